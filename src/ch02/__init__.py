@@ -4,6 +4,11 @@ Attributes:
     DICTIONARY_FILE_PATH (str): String with path to Ubuntu 18.04.2's
         American English dictionary file.
 
+    CLEAN_DICTIONARY_FILE_PATH (str): String with path to cleaned up word
+        dictionary file from Cleanup Dictionary
+        :func:`~p1_cleanup_dictionary.build_artifact`. Uses
+        ``$XDG_CACHE_HOME`` if set, ``~/.cache`` otherwise.
+
     CLEANUP_LIST_ERROR (str): String with :py:exc:`IndexError` for Cleanup
         Dictionary :func:`~p1_cleanup_dictionary.cleanup_list`.
 
@@ -11,9 +16,22 @@ Attributes:
         Recursive Palindrome
         :func:`~c1_recursive_palindrome.recursive_ispalindrome`.
 
+    WORD_VARIANT_ERROR (str): String with :py:exc:`ValueError` for Word
+        Registry :func:`~p1_word_registry.load_words`.
+
+    READ_ARTIFACT_ERROR (str): String with :py:exc:`ValueError` for Word
+        Artifact :class:`~p1_word_artifact.WordArtifact`.
+
 """
 
+import os
+
 # Constants
 DICTIONARY_FILE_PATH = '/usr/share/dict/american-english'
+CLEAN_DICTIONARY_FILE_PATH = os.path.join(
+    os.environ.get('XDG_CACHE_HOME', os.path.expanduser('~/.cache')),
+    'impracticalpythonprojects', 'american-english-clean')
 CLEANUP_LIST_ERROR = 'List cannot be empty.'
 RECURSIVE_ISPALINDROME_ERROR = 'Word must be a string.'
+WORD_VARIANT_ERROR = 'Variant must be raw, cleanup_list, or cleanup_list_more.'
+READ_ARTIFACT_ERROR = 'File is not a word artifact file.'
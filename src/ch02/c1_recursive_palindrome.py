@@ -1,4 +1,10 @@
-"""Recursively determine if a word is a palindrome."""
+"""Recursively determine if a word is a palindrome.
+
+:func:`recursive_ispalindrome` copies the word at each level of recursion, so
+long words are slow and can reach the recursion limit.
+:func:`ispalindrome` checks the same without recursion or copies, and
+:func:`find_palindromes` checks every word of a word dictionary with it.
+"""
 from src.ch02 import RECURSIVE_ISPALINDROME_ERROR
 
 
@@ -29,6 +35,71 @@ def recursive_ispalindrome(word: str) -> bool:
     return False
 
 
+def ispalindrome(word: str) -> bool:
+    """Check if a word is a palindrome without recursion.
+
+    Same as :func:`recursive_ispalindrome`, but compares letters from both
+    ends towards the middle, so it works on words of any length without
+    copying them.
+
+    Args:
+        word (str): String to check palindrome-ness.
+
+    Returns:
+        :py:obj:`True` if the word is a palindrome, :py:obj:`False` otherwise.
+
+    Raises:
+        TypeError: If **word** is not a string.
+
+    Example:
+        >>> from src.ch02.c1_recursive_palindrome import ispalindrome
+        >>> ispalindrome('rotor'), ispalindrome('rotors')
+        (True, False)
+
+    """
+    if not isinstance(word, str):
+        raise TypeError(RECURSIVE_ISPALINDROME_ERROR)
+    left, right = 0, len(word) - 1
+    while left < right:
+        if word[left] != word[right]:
+            return False
+        left += 1
+        right -= 1
+    return True
+
+
+def find_palindromes(words, check_ends: bool = True):
+    """Find palindromes in words.
+
+    Args:
+        words: Iterable of :py:obj:`str` words, like a word dictionary list
+            or :func:`~src.ch02.p1_cleanup_dictionary.iter_words`.
+        check_ends (bool): Whether to skip words with different first and
+            last letters before checking the rest with :func:`ispalindrome`.
+            Most words are skipped this way. Defaults to :py:obj:`True`.
+
+    Yields:
+        :py:obj:`str` with the next word of **words** that is a palindrome.
+        Empty words are skipped.
+
+    Raises:
+        TypeError: If a word is not a string.
+
+    Example:
+        >>> from src.ch02.c1_recursive_palindrome import find_palindromes
+        >>> list(find_palindromes(['level', 'cat', 'noon']))
+        ['level', 'noon']
+
+    """
+    for word in words:
+        if not isinstance(word, str):
+            raise TypeError(RECURSIVE_ISPALINDROME_ERROR)
+        if not word or check_ends and word[0] != word[-1]:
+            continue
+        if ispalindrome(word):
+            yield word
+
+
 def main(word: str = None) -> None:
     """Demonstrate the recursive palindrome tester.
 
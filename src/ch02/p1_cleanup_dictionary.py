@@ -2,18 +2,163 @@
 
 Various functions for cleaning up a word dictionary.
 
+Words can also be streamed from a word dictionary file with
+:func:`iter_words` through generator stages, like
+:func:`skip_single_letters` and :func:`skip_unclean_words`, so only the
+final word list is ever held in memory.
+
+To clean up a word dictionary file only once, save the result with its
+offsets index using :func:`build_artifact`, or from the command line::
+
+    python -m src.ch02.p1_cleanup_dictionary build [filepath] [artifact_file]
+
 Attributes:
     APPROVED_WORDS (list): Words that should always appear in a word
         dictionary.
+    BUFFER_SIZE (int): Number of bytes :func:`iter_words` reads at a time.
 
 """
-from string import ascii_lowercase
+import argparse
+import os
+import re
+import sys
+from timeit import timeit
 from src.ch01.challenge.c2_name_generator import read_from_file
-from src.ch02 import DICTIONARY_FILE_PATH, CLEANUP_LIST_ERROR
+from src.ch02 import DICTIONARY_FILE_PATH, CLEAN_DICTIONARY_FILE_PATH, \
+    CLEANUP_LIST_ERROR
+from src.ch02.p1_word_artifact import write_artifact
 
 APPROVED_WORDS = ['i', 'a', 'me', 'an', 'qi', 'at', 'to', 'as', 'am', 'ad',
                   'be', 'by', 'go', 'he', 'hi', 'if', 'in', 'is', 'it', 'my',
                   'no', 'of', 'oh', 'ox', 'so', 'up', 'us', 'we']
+BUFFER_SIZE = 1 << 16
+
+# Lowercase words with only letters in ascii_lowercase.
+_CLEAN_WORD = re.compile('[a-z]*', re.ASCII)
+
+
+def iter_words(filepath: str, buffer_size: int = BUFFER_SIZE,
+               encoding: str = 'utf-8'):
+    """Iterate over words in word dictionary file.
+
+    Same words as
+    :func:`~src.ch01.challenge.c2_name_generator.read_from_file`, but reads
+    **buffer_size** bytes at a time and decodes all whole lines in them at
+    once instead of making a list of every line.
+
+    Args:
+        filepath (str): String with path to word dictionary file.
+        buffer_size (int): Number of bytes to read at a time. Defaults to
+            :py:const:`BUFFER_SIZE`.
+        encoding (str): Encoding of word dictionary file. Defaults to
+            ``utf-8``.
+
+    Yields:
+        :py:obj:`str` with the next line of the file without trailing
+        whitespaces.
+
+    """
+    rest = b''
+    with open(filepath, 'rb') as file:
+        for block in iter(lambda: file.read(buffer_size), b''):
+            # A newline byte is always a whole character, so whole lines can
+            # be decoded together.
+            end = block.rfind(b'\n') + 1
+            if not end:
+                rest += block
+                continue
+            lines = _split_lines((rest + block[:end]).decode(encoding))
+            rest = block[end:]
+            # Last line is empty, since it ends with a newline.
+            lines.pop()
+            for line in lines:
+                yield line.rstrip()
+    if rest:
+        lines = _split_lines(rest.decode(encoding))
+        if not lines[-1]:
+            lines.pop()
+        for line in lines:
+            yield line.rstrip()
+
+
+def _split_lines(text: str) -> list:
+    """Split text at universal newlines like text mode files."""
+    return text.replace('\r\n', '\n').replace('\r', '\n').split('\n')
+
+
+def skip_single_letters(words):
+    """Skip single letter words.
+
+    Generator stage version of :func:`cleanup_list`.
+
+    Args:
+        words: Iterable of :py:obj:`str` words.
+
+    Yields:
+        :py:obj:`str` with the next word of **words** that isn't a single
+        letter word.
+
+    """
+    for word in words:
+        if len(word) > 1:
+            yield word
+
+
+def skip_unclean_words(words):
+    """Skip unclean words.
+
+    Generator stage that removes the same words as
+    :func:`cleanup_list_more`, but doesn't add :py:const:`APPROVED_WORDS`,
+    remove duplicates, or sort.
+
+    Args:
+        words: Iterable of :py:obj:`str` words.
+
+    Yields:
+        :py:obj:`str` with the next word of **words** in lowercase that
+        doesn't have apostrophes, isn't a double letter word, and only has
+        letters in :py:obj:`string.ascii_lowercase`.
+
+    """
+    # Lowercase first, since some letters are only in ascii_lowercase
+    # once lowercase.
+    for word in map(str.lower, words):
+        # Apostrophes aren't letters, so words with them are skipped too.
+        if len(word) != 2 and _CLEAN_WORD.fullmatch(word):
+            yield word
+
+
+def add_approved_words(words):
+    """Add approved words.
+
+    Args:
+        words: Iterable of :py:obj:`str` words.
+
+    Yields:
+        :py:obj:`str` with each word of **words**, then each word of
+        :py:const:`APPROVED_WORDS`.
+
+    """
+    yield from words
+    yield from APPROVED_WORDS
+
+
+def skip_duplicates(words):
+    """Skip duplicate words.
+
+    Args:
+        words: Iterable of :py:obj:`str` words.
+
+    Yields:
+        :py:obj:`str` with the next word of **words** that hasn't been
+        yielded yet.
+
+    """
+    seen = set()
+    for word in words:
+        if word not in seen:
+            seen.add(word)
+            yield word
 
 
 def cleanup_list(word_list: list) -> list:
@@ -36,7 +181,7 @@ def cleanup_list(word_list: list) -> list:
     return [word for word in word_list if len(word) > 1]
 
 
-def cleanup_list_more(word_list: list) -> list:
+def cleanup_list_more(word_list: list, sort: bool = True) -> list:
     """Cleanup word list even more.
 
     First, remove words with apostrophes, double letter words, duplicates,
@@ -46,42 +191,72 @@ def cleanup_list_more(word_list: list) -> list:
 
     Args:
         word_list (list): List with words as elements.
+        sort (bool): Whether to sort list. Defaults to :py:obj:`True`.
 
     Returns:
-        Sorted list with words as elements excluding cleaned words and
-        :py:const:`APPROVED_WORDS` added.
+        List with words as elements excluding cleaned words and
+        :py:const:`APPROVED_WORDS` added. Sorted if **sort**, in no
+        particular order otherwise.
 
     Raises:
         IndexError: If **word_list** is empty.
 
+    Note:
+        Checks each word with one regular expression and removes duplicates
+        with a :py:obj:`set` in the same pass.
+
     """
     if not word_list:
         raise IndexError(CLEANUP_LIST_ERROR)
-    clean_list = []
-    for word in word_list:
-        if any(["'" in word, len(word) == 2]):
-            # Skip words with apostrophes and double letter words.
-            continue
-        if any([letter not in ascii_lowercase for letter in word.lower()]):
-            # Skip words with letters not in ascii_lowercase.
-            continue
-        clean_list.append(word.lower())
-    # Add approved words to list if missing.
-    for word in APPROVED_WORDS:
-        if word not in clean_list:
-            clean_list.append(word)
-    # Remove duplicates and sort.
-    clean_list = sorted(list(set(clean_list)))
-    return clean_list
+    # Apostrophes aren't letters, so words with them are skipped too.
+    clean_words = {word for word in map(str.lower, word_list)
+                   if len(word) != 2 and _CLEAN_WORD.fullmatch(word)}
+    clean_words.update(APPROVED_WORDS)
+    if sort:
+        return sorted(clean_words)
+    return list(clean_words)
+
+
+def benchmark_cleanup_list_more(word_list: list, number: int = 1) -> dict:
+    """Benchmark ways to cleanup word list even more.
+
+    Use :py:func:`timeit.timeit` to time :func:`cleanup_list_more` with and
+    without **sort**, and the generator stages :func:`skip_unclean_words`,
+    :func:`add_approved_words`, and :func:`skip_duplicates` with the same
+    **word_list**.
+
+    Args:
+        word_list (list): List with words as elements.
+        number (int): Number of times to cleanup **word_list**. Defaults to
+            ``1``.
+
+    Returns:
+        :py:obj:`dict` with the name of each way as keys and its average
+        time in seconds as values.
+
+    Example:
+        >>> import src.ch02.p1_cleanup_dictionary as cleanup
+        >>> path = 'tests/data/ch02/dictionary.txt'
+        >>> word_list = cleanup.cleanup_dict(path)
+        >>> list(cleanup.benchmark_cleanup_list_more(word_list))
+        ['sorted', 'unsorted', 'stages']
+
+    """
+    ways = {
+        'sorted': lambda: cleanup_list_more(word_list),
+        'unsorted': lambda: cleanup_list_more(word_list, sort=False),
+        'stages': lambda: list(skip_duplicates(add_approved_words(
+            skip_unclean_words(word_list)))),
+    }
+    return {name: timeit(way, number=number) / number
+            for name, way in ways.items()}
 
 
 def cleanup_dict(filepath: str) -> list:
-    """Wrap read_from_file and cleanup_list.
+    """Wrap iter_words and skip_single_letters.
 
-    Passes given **filepath** through
-    :func:`~src.ch01.challenge.c2_name_generator.read_from_file`
-    to get a list of words, then :func:`cleanup_list` to remove single letter
-    words.
+    Passes given **filepath** through :func:`iter_words` to stream its
+    words, then :func:`skip_single_letters` to remove single letter words.
 
     Args:
         filepath (str): String with path to word dictionary file.
@@ -89,12 +264,84 @@ def cleanup_dict(filepath: str) -> list:
     Returns:
         List with words as elements excluding single letter words.
 
+    Raises:
+        IndexError: If the file at **filepath** is empty.
+
     """
-    return cleanup_list(read_from_file(filepath))
+    if not os.path.getsize(filepath):
+        # Same as cleanup_list, since an empty file has no lines.
+        raise IndexError(CLEANUP_LIST_ERROR)
+    return list(skip_single_letters(iter_words(filepath)))
+
+
+def build_artifact(filepath: str = DICTIONARY_FILE_PATH,
+                   artifact_file: str = CLEAN_DICTIONARY_FILE_PATH) -> int:
+    """Build cleaned up word dictionary file.
 
+    Clean up word dictionary file with :func:`cleanup_dict` and
+    :func:`cleanup_list_more` once, then save the sorted words with
+    :func:`~src.ch02.p1_word_artifact.write_artifact`, so other programs
+    can use them without cleaning up the word dictionary file again.
 
-def main():
-    """Demonstrate cleanup dictionary."""
+    Args:
+        filepath (str): String with path to word dictionary file. Defaults
+            to :py:const:`~src.ch02.DICTIONARY_FILE_PATH`.
+        artifact_file (str): String with path to cleaned up word dictionary
+            file to write. Its offsets index file is written next to it.
+            Defaults to :py:const:`~src.ch02.CLEAN_DICTIONARY_FILE_PATH`.
+
+    Returns:
+        :py:obj:`int` number of words in **artifact_file**.
+
+    Raises:
+        IndexError: If **filepath** is empty.
+
+    Example:
+        >>> import os
+        >>> from tempfile import TemporaryDirectory
+        >>> from src.ch02.p1_cleanup_dictionary import build_artifact
+        >>> from src.ch02.p1_word_artifact import WordArtifact
+        >>> with TemporaryDirectory() as folder:
+        ...     path = os.path.join(folder, 'clean.txt')
+        ...     print(build_artifact('tests/data/ch02/dictionary.txt', path))
+        ...     with WordArtifact(path) as words:
+        ...         print(words[1])
+        79
+        aardvark
+
+    """
+    words = cleanup_list_more(cleanup_dict(filepath))
+    os.makedirs(os.path.dirname(os.path.abspath(artifact_file)),
+                exist_ok=True)
+    return write_artifact(words, artifact_file)
+
+
+def main(argv: list = None):
+    """Demonstrate cleanup dictionary.
+
+    Args:
+        argv (list): Command line arguments. Defaults to :py:obj:`None` to
+            demonstrate :func:`cleanup_dict`. Use ``build`` to run
+            :func:`build_artifact` instead, optionally with paths to the
+            word dictionary file and cleaned up word dictionary file.
+
+    """
+    parser = argparse.ArgumentParser(
+        prog='python -m src.ch02.p1_cleanup_dictionary',
+        description='Clean up word dictionary.')
+    commands = parser.add_subparsers(dest='command')
+    build = commands.add_parser(
+        'build', help='save cleaned up word dictionary with offsets index')
+    build.add_argument('filepath', nargs='?', default=DICTIONARY_FILE_PATH,
+                       help='word dictionary file')
+    build.add_argument('artifact_file', nargs='?',
+                       default=CLEAN_DICTIONARY_FILE_PATH,
+                       help='cleaned up word dictionary file to write')
+    args = parser.parse_args([] if argv is None else argv)
+    if args.command == 'build':
+        word_count = build_artifact(args.filepath, args.artifact_file)
+        print(f'Saved {word_count} words to {args.artifact_file}.')
+        return
     print('I\'m a word dictionary cleaner.\n'
           'I remove those annoying one letter words.\n')
     word_list = read_from_file(DICTIONARY_FILE_PATH)
@@ -108,4 +355,4 @@ def main():
 
 
 if __name__ == '__main__':
-    main()
+    main(sys.argv[1:])
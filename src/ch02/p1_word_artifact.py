@@ -0,0 +1,165 @@
+"""Save cleaned up word lists with random access.
+
+Write a word list as a newline-delimited word file, which can be used like
+any other word dictionary file, and an offsets index file next to it with
+where each word starts. With both, :class:`WordArtifact` gets any word by
+its rank without reading the whole word file.
+
+The index file has the little-endian unsigned 64-bit offset of the start of
+each word in the word file, then the size of the word file.
+
+Attributes:
+    INDEX_EXTENSION (str): Extension added to the path of the word file to
+        get the path of its index file.
+
+"""
+import mmap
+import os
+import struct
+from array import array
+from collections.abc import Sequence
+from tempfile import NamedTemporaryFile
+from src.ch02 import READ_ARTIFACT_ERROR
+
+INDEX_EXTENSION = '.idx'
+
+_OFFSET = struct.Struct('<Q')
+
+
+def write_artifact(words, artifact_file: str) -> int:
+    """Write words to word file and index file.
+
+    Args:
+        words: Iterable of :py:obj:`str` words without newlines.
+        artifact_file (str): Path to word file to write. Its index file is
+            written to the same path with :py:const:`INDEX_EXTENSION`
+            added.
+
+    Returns:
+        :py:obj:`int` number of words written.
+
+    Note:
+        Writes to temporary files first, then replaces the index file
+        before the word file, so other processes never read partial files.
+
+    """
+    offsets = array('Q', [0])
+    folder = os.path.dirname(os.path.abspath(artifact_file))
+    temp_files = []
+    try:
+        with NamedTemporaryFile(dir=folder, delete=False) as file:
+            temp_files.append(file.name)
+            for word in words:
+                line = f'{word}\n'.encode()
+                file.write(line)
+                offsets.append(offsets[-1] + len(line))
+        if _OFFSET.pack(1) != struct.pack('=Q', 1):
+            # Big-endian, so swap to little-endian.
+            offsets.byteswap()
+        with NamedTemporaryFile(dir=folder, delete=False) as index:
+            temp_files.append(index.name)
+            index.write(offsets.tobytes())
+        os.replace(index.name, artifact_file + INDEX_EXTENSION)
+        os.replace(file.name, artifact_file)
+    except BaseException:
+        # Don't leave partial temporary files behind.
+        for temp_file in temp_files:
+            if os.path.exists(temp_file):
+                os.remove(temp_file)
+        raise
+    return len(offsets) - 1
+
+
+class WordArtifact(Sequence):
+    """Memory-mapped word file with index file.
+
+    Read-only sequence of the words in a word file from
+    :func:`write_artifact`. Each word is read from the memory-mapped word
+    file by its offsets in the memory-mapped index file when asked for, so
+    it works with :py:func:`random.sample` without loading every word.
+
+    Args:
+        artifact_file (str): Path to word file.
+
+    Raises:
+        ValueError: If the index file doesn't match the word file.
+
+    Example:
+        >>> import os
+        >>> from tempfile import TemporaryDirectory
+        >>> from src.ch02.p1_word_artifact import write_artifact, WordArtifact
+        >>> with TemporaryDirectory() as folder:
+        ...     path = os.path.join(folder, 'words.txt')
+        ...     print(write_artifact(['bee', 'cat', 'zoo'], path))
+        ...     with WordArtifact(path) as words:
+        ...         print(len(words), words[0], words[-1], 'cat' in words)
+        3
+        3 bee zoo True
+
+    """
+
+    def __init__(self, artifact_file: str):
+        """Initialize class."""
+        self._words = _map_file(artifact_file)
+        try:
+            self._offsets = _map_file(artifact_file + INDEX_EXTENSION)
+        except OSError:
+            self._words.close()
+            raise
+        size = len(self._offsets)
+        if any([not size, size % _OFFSET.size,
+                size and self._get_offset(-1) != len(self._words)]):
+            self.close()
+            raise ValueError(READ_ARTIFACT_ERROR)
+
+    def __getitem__(self, index: int) -> str:
+        """Get word with rank of index."""
+        if not isinstance(index, int):
+            raise TypeError(index)
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError(index)
+        start = self._get_offset(index)
+        # Skip the newline.
+        end = self._get_offset(index + 1) - 1
+        return self._words[start:end].decode()
+
+    def __len__(self) -> int:
+        """Get number of words."""
+        return len(self._offsets) // _OFFSET.size - 1
+
+    def __enter__(self):
+        """Enter context."""
+        return self
+
+    def __exit__(self, *args):
+        """Close on exit."""
+        self.close()
+
+    def close(self) -> None:
+        """Close word file and index file."""
+        self._words.close()
+        self._offsets.close()
+
+    def _get_offset(self, index: int) -> int:
+        """Get offset at index of index file."""
+        if index < 0:
+            index += len(self._offsets) // _OFFSET.size
+        return _OFFSET.unpack_from(self._offsets, index * _OFFSET.size)[0]
+
+
+def _map_file(filepath: str):
+    """Memory-map file at filepath, or get empty bytes if it's empty."""
+    with open(filepath, 'rb') as file:
+        if not os.fstat(file.fileno()).st_size:
+            # Empty files can't be memory-mapped.
+            return _EmptyMap()
+        return mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+class _EmptyMap(bytes):
+    """Empty bytes that can be closed like a memory-mapped file."""
+
+    def close(self) -> None:
+        """Do nothing, since there is nothing to close."""
@@ -0,0 +1,230 @@
+"""Share cleaned up word dictionaries in a process.
+
+Load, clean up, and keep each variant of a word dictionary file only once
+per process, so every chapter that needs the same words shares one copy.
+Words are kept as immutable :py:obj:`tuple` and :py:obj:`frozenset`
+objects, so callers can't change them for each other.
+
+Attributes:
+    VARIANTS (tuple): Names of the variants of a word dictionary file.
+        ``raw`` is every line from
+        :func:`~src.ch02.p1_cleanup_dictionary.iter_words`,
+        ``cleanup_list`` is without single letter words like
+        :func:`~src.ch02.p1_cleanup_dictionary.cleanup_dict`, and
+        ``cleanup_list_more`` is also cleaned up like
+        :func:`~src.ch02.p1_cleanup_dictionary.cleanup_list_more`.
+    REGISTRY (WordRegistry): Registry shared by the whole process.
+
+"""
+import os
+import sys
+from threading import Lock
+from src.ch02 import DICTIONARY_FILE_PATH, WORD_VARIANT_ERROR
+from src.ch02.p1_cleanup_dictionary import iter_words, skip_single_letters, \
+    skip_unclean_words, add_approved_words, skip_duplicates
+
+VARIANTS = ('raw', 'cleanup_list', 'cleanup_list_more')
+
+
+def load_words(filepath: str, variant: str = 'cleanup_list') -> tuple:
+    """Load variant of word dictionary file.
+
+    Args:
+        filepath (str): String with path to word dictionary file.
+        variant (str): Name of variant in :py:const:`VARIANTS`. Defaults to
+            ``cleanup_list``.
+
+    Returns:
+        :py:obj:`tuple` with the words of **variant** of **filepath**.
+        ``cleanup_list_more`` is sorted.
+
+    Raises:
+        ValueError: If **variant** isn't in :py:const:`VARIANTS`.
+
+    """
+    if variant not in VARIANTS:
+        raise ValueError(WORD_VARIANT_ERROR)
+    words = iter_words(filepath)
+    if variant == 'raw':
+        return tuple(words)
+    words = skip_single_letters(words)
+    if variant == 'cleanup_list':
+        return tuple(words)
+    return tuple(sorted(skip_duplicates(add_approved_words(
+        skip_unclean_words(words)))))
+
+
+def get_size(words) -> int:
+    """Get memory size of words.
+
+    Args:
+        words: :py:obj:`tuple` or :py:obj:`frozenset` of :py:obj:`str`
+            words.
+
+    Returns:
+        :py:obj:`int` number of bytes used by **words** and each word in
+        it.
+
+    """
+    return sys.getsizeof(words) + sum(sys.getsizeof(word) for word in words)
+
+
+class WordRegistry:
+    """Registry of word dictionary variants.
+
+    Lazily loads each variant of each word dictionary file with
+    :func:`load_words` the first time it is asked for, then keeps it until
+    evicted. If a word dictionary file changes, its variants are loaded
+    again. Safe to use from many threads.
+
+    Example:
+        >>> from src.ch02.p1_word_registry import WordRegistry
+        >>> registry = WordRegistry()
+        >>> path = 'tests/data/ch02/dictionary.txt'
+        >>> words = registry.get_words(path, 'cleanup_list_more')
+        >>> registry.get_words(path, 'cleanup_list_more') is words
+        True
+        >>> len(words)
+        79
+
+    """
+
+    def __init__(self):
+        """Initialize class."""
+        self._lock = Lock()
+        # Each key is a path and variant, and each value is a list with the
+        # file's size and modification time, the words, and their set.
+        self._entries = {}
+
+    def __len__(self) -> int:
+        """Get number of variants loaded."""
+        return len(self._entries)
+
+    def get_words(self, filepath: str = DICTIONARY_FILE_PATH,
+                  variant: str = 'cleanup_list') -> tuple:
+        """Get words of variant of word dictionary file.
+
+        Args:
+            filepath (str): String with path to word dictionary file.
+                Defaults to :py:const:`~src.ch02.DICTIONARY_FILE_PATH`.
+            variant (str): Name of variant in :py:const:`VARIANTS`.
+                Defaults to ``cleanup_list``.
+
+        Returns:
+            :py:obj:`tuple` with the words of **variant** of **filepath**
+            from :func:`load_words`. Same object until evicted or
+            **filepath** changes.
+
+        Raises:
+            ValueError: If **variant** isn't in :py:const:`VARIANTS`.
+
+        """
+        return self._get_entry(filepath, variant)[1]
+
+    def get_word_set(self, filepath: str = DICTIONARY_FILE_PATH,
+                     variant: str = 'cleanup_list') -> frozenset:
+        """Get set of words of variant of word dictionary file.
+
+        Args:
+            filepath (str): String with path to word dictionary file.
+                Defaults to :py:const:`~src.ch02.DICTIONARY_FILE_PATH`.
+            variant (str): Name of variant in :py:const:`VARIANTS`.
+                Defaults to ``cleanup_list``.
+
+        Returns:
+            :py:obj:`frozenset` with the words of :meth:`get_words`, for
+            checking if words are in **variant** of **filepath**.
+
+        Raises:
+            ValueError: If **variant** isn't in :py:const:`VARIANTS`.
+
+        """
+        entry = self._get_entry(filepath, variant)
+        with self._lock:
+            if entry[2] is None:
+                entry[2] = frozenset(entry[1])
+        return entry[2]
+
+    def memory_usage(self) -> dict:
+        """Get memory usage of each variant loaded.
+
+        Returns:
+            :py:obj:`dict` with a :py:obj:`tuple` of the absolute path and
+            variant as keys and the number of bytes used by its words and
+            set of words, if made, as values.
+
+        Note:
+            Words in both a tuple and a set are counted twice, even though
+            they are shared.
+
+        """
+        with self._lock:
+            entries = list(self._entries.items())
+        return {key: sum(get_size(words) for words in entry[1:]
+                         if words is not None)
+                for key, entry in entries}
+
+    def evict(self, filepath: str = None, variant: str = None) -> int:
+        """Evict variants of word dictionary files.
+
+        Args:
+            filepath (str): String with path to word dictionary file to
+                evict. Defaults to :py:obj:`None` for every file.
+            variant (str): Name of variant to evict. Defaults to
+                :py:obj:`None` for every variant.
+
+        Returns:
+            :py:obj:`int` number of variants evicted. They are loaded again
+            the next time they are asked for.
+
+        """
+        path = None if filepath is None else os.path.abspath(filepath)
+        with self._lock:
+            keys = [key for key in self._entries
+                    if path in (None, key[0]) and variant in (None, key[1])]
+            for key in keys:
+                del self._entries[key]
+        return len(keys)
+
+    def _get_entry(self, filepath: str, variant: str) -> list:
+        """Get entry of variant of filepath, loading it if needed."""
+        if variant not in VARIANTS:
+            raise ValueError(WORD_VARIANT_ERROR)
+        key = (os.path.abspath(filepath), variant)
+        stat = os.stat(filepath)
+        version = (stat.st_size, stat.st_mtime_ns)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] == version:
+                return entry
+        # Load without the lock, so other files can be used meanwhile.
+        entry = [version, load_words(filepath, variant), None]
+        with self._lock:
+            current = self._entries.get(key)
+            if current is not None and current[0] == version:
+                # Another thread loaded it first, so share theirs.
+                return current
+            self._entries[key] = entry
+        return entry
+
+
+REGISTRY = WordRegistry()
+
+
+def get_words(filepath: str = DICTIONARY_FILE_PATH,
+              variant: str = 'cleanup_list') -> tuple:
+    """Get words of variant of word dictionary file from the registry.
+
+    Shortcut for :meth:`WordRegistry.get_words` of :py:const:`REGISTRY`.
+
+    Args:
+        filepath (str): String with path to word dictionary file. Defaults
+            to :py:const:`~src.ch02.DICTIONARY_FILE_PATH`.
+        variant (str): Name of variant in :py:const:`VARIANTS`. Defaults to
+            ``cleanup_list``.
+
+    Returns:
+        :py:obj:`tuple` with the words of **variant** of **filepath**.
+
+    """
+    return REGISTRY.get_words(filepath, variant)
@@ -0,0 +1,82 @@
+"""Find palingrams in a word dictionary.
+
+A palingram is a phrase that is a palindrome, like ``nurses run``. Instead
+of checking every pair of words, each word is split into a prefix and
+suffix at every position. If one part is a palindrome and the other part
+reversed is a word, those two words make a palingram. Looking up the other
+parts in an index of reversed words makes it about as fast as the total
+letters times the average word length.
+"""
+from src.ch02 import DICTIONARY_FILE_PATH
+from src.ch02.c1_recursive_palindrome import ispalindrome
+from src.ch02.p1_cleanup_dictionary import cleanup_dict
+
+
+def find_palingrams(words) -> list:
+    """Find palingrams made of two words.
+
+    Args:
+        words: Iterable of :py:obj:`str` words.
+
+    Returns:
+        Sorted :py:obj:`list` of :py:obj:`tuple` with the first and second
+        word of each palingram. Words aren't paired with themselves.
+
+    Example:
+        >>> from src.ch02.p2_palingrams import find_palingrams
+        >>> find_palingrams(['nurses', 'run', 'stack', 'cats', 'dog'])
+        [('nurses', 'run'), ('stack', 'cats')]
+
+    """
+    # Each reversed word, so reversed parts can be looked up without
+    # reversing them first.
+    reversed_words = {word[::-1]: word for word in words}
+    palingrams = set()
+    for word in reversed_words.values():
+        for i in range(len(word) + 1):
+            prefix, suffix = word[:i], word[i:]
+            # The word, then a word that is the prefix reversed.
+            other = reversed_words.get(prefix)
+            if other is not None and other != word and ispalindrome(suffix):
+                palingrams.add((word, other))
+            # A word that is the suffix reversed, then the word. If the
+            # prefix is empty, it was already found as the first case of
+            # the other word.
+            other = reversed_words.get(suffix)
+            if i and other is not None and other != word and \
+                    ispalindrome(prefix):
+                palingrams.add((other, word))
+    return sorted(palingrams)
+
+
+def palingram_dict(filepath: str = DICTIONARY_FILE_PATH) -> list:
+    """Find palingrams in word dictionary file.
+
+    Args:
+        filepath (str): String with path to word dictionary file. Defaults
+            to :py:const:`~src.ch02.DICTIONARY_FILE_PATH`.
+
+    Returns:
+        Sorted :py:obj:`list` of :py:obj:`tuple` with the first and second
+        word of each palingram in **filepath** from :func:`find_palingrams`,
+        without single letter words.
+
+    Raises:
+        IndexError: If **filepath** is empty.
+
+    """
+    return find_palingrams(cleanup_dict(filepath))
+
+
+def main():
+    """Demonstrate palingram finder."""
+    print('I\'m a palingram finder.\n'
+          'I pair up words that read the same backwards.\n')
+    palingrams = palingram_dict(DICTIONARY_FILE_PATH)
+    print(f'Number of palingrams = {len(palingrams)}\n')
+    for first, second in palingrams:
+        print(f'{first} {second}')
+
+
+if __name__ == '__main__':
+    main()
@@ -1,13 +1,67 @@
 """Chapter 3.
 
 Attributes:
+    CACHE_DIR (str): String with path to folder for cache files of word
+        dictionary files, like :py:mod:`~p1_digram_index` index files. Uses
+        ``$XDG_CACHE_HOME`` if set, ``~/.cache`` otherwise.
+
+    ANAGRAM_CACHE_DIR (str): String with path to folder for anagram
+        dictionary cache files. Same as :py:const:`CACHE_DIR`.
+
     GET_DIGRAMS_ERROR (str): String with :py:exc:`TypeError` for
         :py:func:`~p1_digram_counter.get_digrams`.
 
     COUNT_DIGRAMS_ERROR (str): String with :py:exc:`TypeError` for
         :py:func:`~p1_digram_counter.count_digrams`.
 
+    BACKEND_ERROR (str): String with :py:exc:`ValueError` for
+        :py:func:`~p1_digram_counter.count_digrams`.
+
+    ENCODING_ERROR (str): String with :py:exc:`ValueError` for
+        :py:func:`~c1_anagram_generator.anagram_generator`.
+
+    READ_ANAGRAM_CACHE_ERROR (str): String with :py:exc:`ValueError` for
+        :py:func:`~c1_anagram_cache.read_anagram_cache` if the file isn't a
+        cache file.
+
+    STALE_ANAGRAM_CACHE_ERROR (str): String with :py:exc:`ValueError` for
+        :py:func:`~c1_anagram_cache.read_anagram_cache` if the word
+        dictionary file has changed.
+
+    READ_DIGRAM_INDEX_ERROR (str): String with :py:exc:`ValueError` for
+        :py:class:`~p1_digram_index.DigramIndex` if the file isn't a digram
+        index file.
+
+    STALE_DIGRAM_INDEX_ERROR (str): String with :py:exc:`ValueError` for
+        :py:class:`~p1_digram_index.DigramIndex` if the word dictionary
+        file has changed.
+
+    DIGRAM_POSITIONS_ERROR (str): String with :py:exc:`ValueError` for
+        :py:class:`~p1_digram_index.DigramIndex` if it was written without
+        positional counts.
+
+    NGRAM_LENGTH_ERROR (str): String with :py:exc:`ValueError` for
+        :py:class:`~p1_ngram_counter.NgramCounter`.
+
+    NGRAM_ERROR (str): String with :py:exc:`ValueError` for
+        :py:meth:`~p1_ngram_counter.NgramCounter.documents` and
+        :py:meth:`~p1_ngram_counter.NgramCounter.occurrences`.
+
 """
+import os
 
+CACHE_DIR = os.path.join(
+    os.environ.get('XDG_CACHE_HOME', os.path.expanduser('~/.cache')),
+    'impracticalpythonprojects')
+ANAGRAM_CACHE_DIR = CACHE_DIR
 GET_DIGRAMS_ERROR = 'Word must be a string.'
 COUNT_DIGRAMS_ERROR = 'Digrams must be a set and dict_list must be a list.'
+BACKEND_ERROR = 'Backend must be python or numpy.'
+ENCODING_ERROR = 'Encoding must be prime, mask, or vector.'
+READ_ANAGRAM_CACHE_ERROR = 'File is not an anagram cache file.'
+STALE_ANAGRAM_CACHE_ERROR = 'Word dictionary file has changed.'
+READ_DIGRAM_INDEX_ERROR = 'File is not a digram index file.'
+STALE_DIGRAM_INDEX_ERROR = 'Word dictionary file has changed.'
+DIGRAM_POSITIONS_ERROR = 'Digram index has no positional counts.'
+NGRAM_LENGTH_ERROR = 'N-gram length must be from 1 to 4.'
+NGRAM_ERROR = 'N-gram must be lowercase letters of the counted length.'
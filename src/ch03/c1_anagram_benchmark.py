@@ -0,0 +1,214 @@
+"""Benchmark anagram generator building blocks.
+
+Time the alternative ways :mod:`~src.ch03.c1_anagram_generator` has to get
+IDs, build anagram dictionaries, and find the IDs IN some letters, so they
+can be compared on the same word list.
+
+To compare them on the system word dictionary, or on another word
+dictionary file, run::
+
+    python -m src.ch03.c1_anagram_benchmark [filepath] [--number NUMBER]
+        [--words WORD ...]
+
+It prints the times of :func:`benchmark_get_id`,
+:func:`benchmark_anagram_dict`, and :func:`benchmark_encodings`, finding the
+IDs IN each of **--words**.
+
+Attributes:
+    BENCHMARK_WORDS (list): Words :func:`main` finds IDs IN by default.
+
+"""
+import argparse
+import sys
+from functools import partial
+from string import ascii_lowercase
+from timeit import timeit
+from src.ch02 import DICTIONARY_FILE_PATH
+from src.ch02.p1_cleanup_dictionary import cleanup_dict, cleanup_list_more
+from src.ch03.c1_anagram_generator import (
+    get_primes, get_id, get_ids, get_anagram_dict, multi_get_anagram_dict,
+    pool_get_anagram_dict, AnagramIndex, AnagramMasks)
+from src.ch03.c1_anagram_vectors import AnagramMatrix
+
+BENCHMARK_WORDS = ['seeshells', 'anagramgenerator']
+
+
+def benchmark_get_id(word_list: list, number: int = 1) -> dict:
+    """Benchmark per word cost of getting IDs.
+
+    Use :py:func:`timeit.timeit` to time making the letter to prime table
+    for each word, like :func:`~src.ch03.c1_anagram_generator.get_id` used
+    to, :func:`~src.ch03.c1_anagram_generator.get_id` with
+    :py:const:`~src.ch03.c1_anagram_generator.LETTER_PRIMES`, and
+    :func:`~src.ch03.c1_anagram_generator.get_ids` with **word_list**.
+
+    Args:
+        word_list (list): List of words to get IDs of.
+        number (int): Number of times to get IDs of **word_list**. Defaults
+            to ``1``.
+
+    Returns:
+        :py:obj:`dict` with the name of each step as keys and its average
+        time per word in seconds as values.
+
+    Example:
+        >>> import src.ch02.p1_cleanup_dictionary as cleanup
+        >>> from src.ch03.c1_anagram_benchmark import benchmark_get_id
+        >>> path = 'tests/data/ch02/dictionary.txt'
+        >>> word_list = cleanup.cleanup_list_more(cleanup.cleanup_dict(path))
+        >>> list(benchmark_get_id(word_list))
+        ['letter_table', 'get_id', 'get_ids']
+
+    """
+    steps = {
+        'letter_table': lambda: [dict(zip(ascii_lowercase, get_primes()))
+                                 for _ in word_list],
+        'get_id': lambda: [get_id(word) for word in word_list],
+        'get_ids': lambda: get_ids(word_list),
+    }
+    words = max(len(word_list), 1) * number
+    return {name: timeit(step, number=number) / words
+            for name, step in steps.items()}
+
+
+def benchmark_anagram_dict(word_list: list, number: int = 1,
+                           workers: int = None) -> dict:
+    """Benchmark anagram dictionary builders.
+
+    Use :py:func:`timeit.timeit` to time
+    :func:`~src.ch03.c1_anagram_generator.get_anagram_dict`,
+    :func:`~src.ch03.c1_anagram_generator.multi_get_anagram_dict`, and
+    :func:`~src.ch03.c1_anagram_generator.pool_get_anagram_dict` with the same
+    **word_list**.
+
+    Args:
+        word_list (list): List of words to make into anagram dictionary.
+        number (int): Number of times to build each anagram dictionary.
+            Defaults to ``1``.
+        workers (int): Number of processes for
+            :func:`~src.ch03.c1_anagram_generator.pool_get_anagram_dict`.
+            Defaults to
+            :py:func:`os.cpu_count`.
+
+    Returns:
+        :py:obj:`dict` with the name of each builder as keys and its average
+        time in seconds as values.
+
+    Example:
+        >>> import src.ch02.p1_cleanup_dictionary as cleanup
+        >>> from src.ch03.c1_anagram_benchmark import benchmark_anagram_dict
+        >>> path = 'tests/data/ch02/dictionary.txt'
+        >>> word_list = cleanup.cleanup_list_more(cleanup.cleanup_dict(path))
+        >>> list(benchmark_anagram_dict(word_list))
+        ['get_anagram_dict', 'multi_get_anagram_dict', 'pool_get_anagram_dict']
+
+    """
+    builders = {
+        'get_anagram_dict': lambda: get_anagram_dict(word_list),
+        'multi_get_anagram_dict': lambda: multi_get_anagram_dict(word_list),
+        'pool_get_anagram_dict':
+            lambda: pool_get_anagram_dict(word_list, workers),
+    }
+    return {name: timeit(builder, number=number) / number
+            for name, builder in builders.items()}
+
+
+def benchmark_encodings(word_list: list, words: list,
+                        number: int = 1) -> dict:
+    """Benchmark finding IDs IN words with each encoding.
+
+    Use :py:func:`timeit.timeit` to time finding the IDs of an anagram
+    dictionary of **word_list** that are IN each word of **words** with the
+    same classes :func:`~src.ch03.c1_anagram_generator.anagram_generator`
+    searches with for each of its encodings: walking the letter-count trie
+    of :class:`~src.ch03.c1_anagram_generator.AnagramIndex` for ``prime``,
+    checking letter masks first with
+    :class:`~src.ch03.c1_anagram_generator.AnagramMasks` for ``mask``, and
+    comparing letter counts with
+    :class:`~src.ch03.c1_anagram_vectors.AnagramMatrix` for ``vector``.
+
+    Args:
+        word_list (list): List of words to make into anagram dictionary.
+        words (list): List of lowercase words to find IDs IN.
+        number (int): Number of times to find IDs IN **words**. Defaults to
+            ``1``.
+
+    Returns:
+        :py:obj:`dict` with the name of each encoding as keys and its
+        average time per word of **words** in seconds as values.
+
+    Example:
+        >>> import src.ch02.p1_cleanup_dictionary as cleanup
+        >>> from src.ch03.c1_anagram_benchmark import benchmark_encodings
+        >>> path = 'tests/data/ch02/dictionary.txt'
+        >>> word_list = cleanup.cleanup_list_more(cleanup.cleanup_dict(path))
+        >>> list(benchmark_encodings(word_list, ['seeshells', 'aardvark']))
+        ['prime', 'mask', 'vector']
+
+    """
+    anagram_dict = get_anagram_dict(word_list)
+    indexes = {
+        'prime': AnagramIndex(anagram_dict),
+        'mask': AnagramMasks(anagram_dict),
+        'vector': AnagramMatrix(anagram_dict),
+    }
+
+    def find_keys(index):
+        return [index.find_keys(word) for word in words]
+
+    count = max(len(words), 1) * number
+    return {name: timeit(partial(find_keys, index), number=number) / count
+            for name, index in indexes.items()}
+
+
+def print_times(title: str, times: dict) -> None:
+    """Print benchmark times.
+
+    Args:
+        title (str): What was timed.
+        times (dict): Dictionary from a benchmark function with names as
+            keys and times in seconds as values.
+
+    Returns:
+        :py:obj:`None`. **title** and each name with its time are printed.
+
+    """
+    print(f'\n{title}:')
+    width = max(map(len, times), default=0)
+    for name, time in times.items():
+        print(f'  {name:<{width}}  {time:.6g} s')
+
+
+def main(argv: list = None):
+    """Benchmark anagram generator building blocks.
+
+    Args:
+        argv (list): Command line arguments. Defaults to :py:obj:`None` to
+            benchmark with :py:const:`~src.ch02.DICTIONARY_FILE_PATH`.
+            Optionally, the path to another word dictionary file,
+            ``--number`` of times to run each benchmark, and ``--words`` to
+            find IDs IN instead of :py:const:`BENCHMARK_WORDS`.
+
+    """
+    parser = argparse.ArgumentParser(
+        prog='python -m src.ch03.c1_anagram_benchmark',
+        description='Benchmark anagram generator building blocks.')
+    parser.add_argument('filepath', nargs='?', default=DICTIONARY_FILE_PATH,
+                        help='word dictionary file')
+    parser.add_argument('--number', type=int, default=1,
+                        help='number of times to run each benchmark')
+    parser.add_argument('--words', nargs='+', default=BENCHMARK_WORDS,
+                        metavar='WORD', help='lowercase words to find IDs IN')
+    args = parser.parse_args([] if argv is None else argv)
+    word_list = cleanup_list_more(cleanup_dict(args.filepath))
+    print(f'Benchmarking with {len(word_list)} words from {args.filepath}.')
+    print_times('Getting IDs, per word',
+                benchmark_get_id(word_list, args.number))
+    print_times('Anagram dictionary builders',
+                benchmark_anagram_dict(word_list, args.number))
+    print_times('Finding IDs IN words by encoding, per word',
+                benchmark_encodings(word_list, args.words, args.number))
+
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
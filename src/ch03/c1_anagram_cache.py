@@ -0,0 +1,130 @@
+"""Save anagram dictionaries to disk.
+
+Store the anagram dictionary of a word dictionary file in a compact binary
+cache file so it only has to be built again when the word dictionary file
+changes.
+
+Each cache file starts with a header of :py:const:`CACHE_MAGIC`,
+:py:const:`CACHE_VERSION`, and the fingerprint of the word dictionary file
+from :func:`~src.ch03.p1_cache_files.get_fingerprint`. After the number of
+IDs, each ID is stored as the length of the ID in bytes, the length of its
+words in bytes, the ID as little-endian bytes, then its words, each followed
+by a newline.
+
+Attributes:
+    CACHE_MAGIC (bytes): Bytes that every cache file starts with.
+    CACHE_VERSION (int): Version of the cache file format. Change when the
+        format or the words in an anagram dictionary change.
+    CACHE_EXTENSION (str): File extension of cache files from
+        :func:`~src.ch03.p1_cache_files.get_cache_path`.
+
+"""
+import struct
+from collections import defaultdict
+from src.ch03 import READ_ANAGRAM_CACHE_ERROR, STALE_ANAGRAM_CACHE_ERROR
+from src.ch03.p1_cache_files import is_fresh, write_cache_file
+
+CACHE_MAGIC = b'IPPA'
+CACHE_VERSION = 2
+CACHE_EXTENSION = 'anagrams'
+
+# Magic, version, file size, file modification time, and file SHA-256 hash.
+_HEADER = struct.Struct('<4sHQq32s')
+_COUNT = struct.Struct('<I')
+_ENTRY = struct.Struct('<BI')
+
+
+def pack_anagram_cache(anagram_dict: dict, fingerprint: tuple) -> bytes:
+    """Pack anagram dictionary like a cache file.
+
+    Args:
+        anagram_dict (dict): Anagram dictionary to save.
+        fingerprint (tuple): Fingerprint from
+            :func:`~src.ch03.p1_cache_files.get_fingerprint` of the word
+            dictionary file used to make **anagram_dict**.
+
+    Returns:
+        :py:obj:`bytes` with the contents of the cache file of
+        **anagram_dict**.
+
+    """
+    chunks = [_HEADER.pack(CACHE_MAGIC, CACHE_VERSION, *fingerprint),
+              _COUNT.pack(len(anagram_dict))]
+    for key, words in anagram_dict.items():
+        key_bytes = key.to_bytes((key.bit_length() + 7) // 8, 'little')
+        # End each word with a newline, so no words and one empty word
+        # are different.
+        word_bytes = ''.join(word + '\n' for word in words).encode()
+        chunks.extend([_ENTRY.pack(len(key_bytes), len(word_bytes)),
+                       key_bytes, word_bytes])
+    return b''.join(chunks)
+
+
+def write_anagram_cache(anagram_dict: dict, cache_file: str,
+                        fingerprint: tuple) -> None:
+    """Write anagram dictionary to cache file.
+
+    Args:
+        anagram_dict (dict): Anagram dictionary to save.
+        cache_file (str): Path to cache file to write.
+        fingerprint (tuple): Fingerprint from
+            :func:`~src.ch03.p1_cache_files.get_fingerprint` of the word
+            dictionary file used to make **anagram_dict**.
+
+    Returns:
+        :py:obj:`None`. **anagram_dict** is written to **cache_file** with
+        :func:`~src.ch03.p1_cache_files.write_cache_file`.
+
+    """
+    write_cache_file(pack_anagram_cache(anagram_dict, fingerprint),
+                     cache_file)
+
+
+def read_anagram_cache(cache_file: str, filepath: str) -> dict:
+    """Read anagram dictionary from cache file.
+
+    Args:
+        cache_file (str): Path to cache file to read.
+        filepath (str): Path to word dictionary file used to make the cache
+            file.
+
+    Returns:
+        :py:class:`~collections.defaultdict` of :py:obj:`list` with an ID
+        (:py:obj:`int`) as the key and words whose product of letters equal
+        that ID as values.
+
+    Raises:
+        ValueError: If **cache_file** isn't a cache file or if **filepath**
+            has changed since **cache_file** was written.
+
+    """
+    with open(cache_file, 'rb') as file:
+        data = file.read()
+    if len(data) < _HEADER.size + _COUNT.size:
+        raise ValueError(READ_ANAGRAM_CACHE_ERROR)
+    magic, version, *fingerprint = _HEADER.unpack_from(data)
+    if magic != CACHE_MAGIC or version != CACHE_VERSION:
+        raise ValueError(READ_ANAGRAM_CACHE_ERROR)
+    if not is_fresh(filepath, fingerprint):
+        raise ValueError(STALE_ANAGRAM_CACHE_ERROR)
+    offset = _HEADER.size
+    count, = _COUNT.unpack_from(data, offset)
+    offset += _COUNT.size
+    anagram_dict = defaultdict(list)
+    try:
+        for _ in range(count):
+            key_len, words_len = _ENTRY.unpack_from(data, offset)
+            offset += _ENTRY.size
+            key = int.from_bytes(data[offset:offset + key_len], 'little')
+            offset += key_len
+            words = data[offset:offset + words_len].decode()
+            offset += words_len
+            if words and not words.endswith('\n'):
+                raise ValueError(READ_ANAGRAM_CACHE_ERROR)
+            # Last newline ends the last word.
+            anagram_dict[key] = words.split('\n')[:-1]
+    except struct.error as err:
+        raise ValueError(READ_ANAGRAM_CACHE_ERROR) from err
+    if offset != len(data):
+        raise ValueError(READ_ANAGRAM_CACHE_ERROR)
+    return anagram_dict
@@ -1,14 +1,41 @@
-"""Generate phrase anagrams from a word or phrase."""
+"""Generate phrase anagrams from a word or phrase.
+
+Attributes:
+    LETTER_PRIMES (dict): Dictionary with each letter in
+        :py:obj:`~string.ascii_lowercase` as keys and its unique prime number
+        from :func:`get_primes` as values.
+    LETTER_BITS (dict): Dictionary with each letter in
+        :py:obj:`~string.ascii_lowercase` as keys and its unique bit as
+        values.
+    TASKS_PER_WORKER (int): Number of search tasks to split anagram phrase
+        searches into per process in :func:`pool_iter_anagram_phrases`.
+
+"""
+from bisect import bisect_left
 from collections import defaultdict, Counter
+from collections.abc import Mapping
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice, permutations
 from os import cpu_count
 from string import ascii_lowercase
 from sys import setrecursionlimit
 from threading import Thread
 from src.ch02 import DICTIONARY_FILE_PATH
-from src.ch02.p1_cleanup_dictionary import cleanup_dict, cleanup_list_more
+from src.ch02.p1_word_registry import get_words
+from src.ch03 import ANAGRAM_CACHE_DIR, ENCODING_ERROR
+from src.ch03.c1_anagram_cache import CACHE_EXTENSION, pack_anagram_cache, \
+    read_anagram_cache
+from src.ch03.p1_cache_files import get_cache_path, load_cache_file
+from src.ch03.c1_anagram_memo import get_signature, LetterCache
+from src.ch03.c1_anagram_vectors import AnagramMatrix
 
 setrecursionlimit(9000)  # Default is 1000
 
+TASKS_PER_WORKER = 8
+
+# Anagram index each process of pool_iter_anagram_phrases searches with.
+_TASK_INDEX = None
+
 
 def get_primes(length: int = 26, min_prime: int = 2,
                max_prime: int = 101) -> list:
@@ -49,6 +76,11 @@ def get_primes(length: int = 26, min_prime: int = 2,
     return primes
 
 
+# Assign each ASCII lowercase letter a prime number once.
+LETTER_PRIMES = dict(zip(ascii_lowercase, get_primes()))
+LETTER_BITS = {letter: 1 << i for i, letter in enumerate(ascii_lowercase)}
+
+
 def get_id(word: str) -> int:
     """Get ID number of word.
 
@@ -62,17 +94,64 @@ def get_id(word: str) -> int:
     Returns:
         :py:obj:`int` representing ID of **word**.
 
+    Note:
+        Uses :py:const:`LETTER_PRIMES` instead of calling :func:`get_primes`
+        for each word.
+
     """
-    # Assign each ASCII lowercase letter a prime number.
-    primes = get_primes()
-    letter_id = dict(zip(ascii_lowercase, primes))
     # Find the product of each letter in the word.
     product = 1
     for letter in word:
-        product *= letter_id[letter]
+        product *= LETTER_PRIMES[letter]
     return product
 
 
+def get_ids(words: list) -> list:
+    """Get ID numbers of words.
+
+    Same as calling :func:`get_id` on each word in **words**, but in one
+    loop without a function call per word.
+
+    Args:
+        words (list): List of words to get IDs of.
+
+    Returns:
+        :py:obj:`list` of :py:obj:`int` representing the ID of each word in
+        **words**.
+
+    """
+    letter_primes = LETTER_PRIMES  # Local lookups are faster.
+    ids = []
+    for word in words:
+        product = 1
+        for letter in word:
+            product *= letter_primes[letter]
+        ids.append(product)
+    return ids
+
+
+def get_mask(word: str) -> int:
+    """Get letter mask of word.
+
+    Args:
+        word (str): Word to get letter mask of.
+
+    Returns:
+        :py:obj:`int` with the bit from :py:const:`LETTER_BITS` of each
+        letter in **word** set.
+
+    Example:
+        >>> from src.ch03.c1_anagram_generator import get_mask
+        >>> bin(get_mask('cab'))
+        '0b111'
+
+    """
+    mask = 0
+    for letter in word:
+        mask |= LETTER_BITS[letter]
+    return mask
+
+
 def get_anagram_dict(word_list: list) -> dict:
     """Get an anagram dictionary from word_list.
 
@@ -80,7 +159,8 @@ def get_anagram_dict(word_list: list) -> dict:
     the ID as the key.
 
     Args:
-        word_list (list): List of words to make into anagram dictionary.
+        word_list (list): List of words to make into anagram dictionary. Any
+            iterable of words, like a generator, also works.
 
     Returns:
         :py:class:`~collections.defaultdict` of :py:obj:`list` with an ID
@@ -88,10 +168,13 @@ def get_anagram_dict(word_list: list) -> dict:
         that ID as values.
 
     """
+    if not isinstance(word_list, list):
+        # Words are read twice, so a generator would be used up.
+        word_list = list(word_list)
     anagram_dict = defaultdict(list)
     # Find the product of each letter for each word in a dictionary.
-    for word in word_list:
-        anagram_dict[get_id(word)].append(word)
+    for word, id_num in zip(word_list, get_ids(word_list)):
+        anagram_dict[id_num].append(word)
     return anagram_dict
 
 
@@ -179,6 +262,217 @@ def multi_get_anagram_dict(word_list: list) -> dict:
     return super_dict
 
 
+def pool_get_anagram_dict(word_list: list, workers: int = None) -> dict:
+    """Multiprocess get anagram dictionary.
+
+    Uses :py:class:`~concurrent.futures.ProcessPoolExecutor` to make an
+    anagram dictionary of each part of **word_list** in a separate process,
+    then merges them in order. Unlike :func:`multi_get_anagram_dict`, the
+    IDs are calculated in parallel instead of taking turns with the
+    `Global Interpreter Lock`_.
+
+    Args:
+        word_list (list): List of words to make into anagram dictionary.
+        workers (int): Number of processes to use. Defaults to
+            :py:func:`os.cpu_count`.
+
+    Returns:
+        :py:class:`~collections.defaultdict` of :py:obj:`list` with an ID
+        (:py:obj:`int`) as the key and words whose product of letters equal
+        that ID as values. Same as :func:`get_anagram_dict`.
+
+    """
+    if workers is None:
+        workers = cpu_count()
+    super_dict = defaultdict(list)
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        # Map returns partial dictionaries in the same order as the parts.
+        for part_dict in executor.map(get_anagram_dict,
+                                      split(word_list, workers)):
+            for key, value in part_dict.items():
+                super_dict[key].extend(value)
+    return super_dict
+
+
+def cached_anagram_dict(dict_file: str, cache_dir: str = None) -> dict:
+    """Get anagram dictionary of word dictionary file using a cache.
+
+    Read the anagram dictionary of **dict_file** from its cache file in
+    **cache_dir** with
+    :func:`~src.ch03.c1_anagram_cache.read_anagram_cache` and
+    :func:`~src.ch03.p1_cache_files.load_cache_file`. If missing or stale,
+    get the ``cleanup_list_more`` words of **dict_file** with
+    :func:`~src.ch02.p1_word_registry.get_words`, build the anagram
+    dictionary with :func:`pool_get_anagram_dict`, and save it again.
+
+    Args:
+        dict_file (str): Path to word dictionary file.
+        cache_dir (str): Path to folder with cache files. Defaults to
+            :py:const:`~src.ch03.ANAGRAM_CACHE_DIR`.
+
+    Returns:
+        :py:class:`~collections.defaultdict` of :py:obj:`list` with an ID
+        (:py:obj:`int`) as the key and words whose product of letters equal
+        that ID as values.
+
+    """
+    if cache_dir is None:
+        cache_dir = ANAGRAM_CACHE_DIR
+
+    def build(fingerprint: tuple) -> tuple:
+        """Build anagram dictionary of dict_file like a cache file."""
+        dictionary = get_words(dict_file, 'cleanup_list_more')
+        anagram_dict = pool_get_anagram_dict(dictionary)
+        return anagram_dict, pack_anagram_cache(anagram_dict, fingerprint)
+
+    cache_file = get_cache_path(dict_file, cache_dir, CACHE_EXTENSION)
+    return load_cache_file(dict_file, cache_file, read_anagram_cache, build)
+
+
+class AnagramMasks(Mapping):
+    """Anagram dictionary with letter masks.
+
+    Read-only mapping with the same IDs and words as the anagram dictionary
+    it is built from. Each ID also has a letter mask from :func:`get_mask`,
+    so most IDs that can't be IN some letters are skipped with one AND
+    instead of a modulo.
+
+    Args:
+        anagram_dict (dict): Dictionary from :func:`get_anagram_dict`.
+        masks (dict): Dictionary with at least the IDs in **anagram_dict**
+            as keys and their letter masks as values. Defaults to
+            :py:obj:`None` to get them from the words in **anagram_dict**.
+
+    Example:
+        >>> from src.ch03.c1_anagram_generator import AnagramMasks
+        >>> masks = AnagramMasks({3715217: ['sett', 'test'], 451: ['me']})
+        >>> masks.find_keys('tests')
+        [3715217]
+
+    """
+
+    def __init__(self, anagram_dict: dict, masks: dict = None):
+        """Initialize class."""
+        self._anagram_dict = dict(anagram_dict)
+        if masks is None:
+            # Words with the same ID have the same letters.
+            self._masks = {key: get_mask(words[0]) if words else 0
+                           for key, words in self._anagram_dict.items()}
+        else:
+            self._masks = {key: masks[key] for key in self._anagram_dict}
+
+    def __getitem__(self, key: int) -> list:
+        """Get words with ID of key."""
+        return self._anagram_dict[key]
+
+    def __iter__(self):
+        """Iterate over IDs."""
+        return iter(self._anagram_dict)
+
+    def __len__(self) -> int:
+        """Get number of IDs."""
+        return len(self._anagram_dict)
+
+    @property
+    def masks(self) -> dict:
+        """dict: IDs as keys and their letter masks as values."""
+        return self._masks
+
+    def find_keys(self, letters: str) -> list:
+        """Find IDs in letters.
+
+        Args:
+            letters (str): Lowercase letters that IDs must be IN.
+
+        Returns:
+            :py:obj:`list` of :py:obj:`int` IDs whose words can be made with
+            **letters**.
+
+        """
+        id_num = get_id(letters)
+        # IDs with any of these letters can't be IN letters.
+        unusable = ~get_mask(letters)
+        return [key for key, mask in self._masks.items()
+                if not mask & unusable and id_num % key == 0]
+
+
+class AnagramIndex(Mapping):
+    """Letter-count trie of an anagram dictionary.
+
+    Read-only mapping with the same IDs and words as the anagram dictionary
+    it is built from. Each ID is also stored in a trie keyed by the sorted
+    letters of its words, so all sub-anagrams of some letters can be found
+    by only walking the branches those letters can spell instead of
+    checking every ID in the dictionary.
+
+    Args:
+        anagram_dict (dict): Dictionary from :func:`get_anagram_dict`.
+
+    Example:
+        >>> from src.ch03.c1_anagram_generator import AnagramIndex
+        >>> index = AnagramIndex({3715217: ['sett', 'test'], 451: ['me']})
+        >>> index.find_keys('tests')
+        [3715217]
+
+    """
+
+    def __init__(self, anagram_dict: dict):
+        """Initialize class."""
+        self._anagram_dict = dict(anagram_dict)
+        self._trie = {}
+        for key, words in self._anagram_dict.items():
+            if not words:
+                # Nothing to find.
+                continue
+            # Words with the same ID have the same sorted letters.
+            node = self._trie
+            for letter in sorted(words[0]):
+                node = node.setdefault(letter, {})
+            # Use None as the end of word marker since letters are strings.
+            node[None] = key
+
+    def __getitem__(self, key: int) -> list:
+        """Get words with ID of key."""
+        return self._anagram_dict[key]
+
+    def __iter__(self):
+        """Iterate over IDs."""
+        return iter(self._anagram_dict)
+
+    def __len__(self) -> int:
+        """Get number of IDs."""
+        return len(self._anagram_dict)
+
+    def find_keys(self, letters: str) -> list:
+        """Find IDs in letters.
+
+        Walk the trie using each letter in **letters** at most as many times
+        as it appears.
+
+        Args:
+            letters (str): Lowercase letters that IDs must be IN.
+
+        Returns:
+            :py:obj:`list` of :py:obj:`int` IDs whose words can be made with
+            **letters**.
+
+        """
+        keys = []
+        self._walk(self._trie, Counter(letters), keys)
+        return keys
+
+    def _walk(self, node: dict, budget: Counter, keys: list) -> None:
+        """Recursively add IDs under node that fit in budget to keys."""
+        for letter, child in node.items():
+            if letter is None:
+                keys.append(child)
+            elif budget[letter]:
+                # Borrow the letter for this branch, then give it back.
+                budget[letter] -= 1
+                self._walk(child, budget, keys)
+                budget[letter] += 1
+
+
 def find_anagrams(word: str, anagram_dict: dict) -> list:
     """Find anagrams in word.
 
@@ -186,11 +480,19 @@ def find_anagrams(word: str, anagram_dict: dict) -> list:
 
     Args:
         word (str): Word to find anagrams of.
-        anagram_dict: Dictionary from :func:`get_anagram_dict`.
+        anagram_dict: Dictionary from :func:`get_anagram_dict` or an
+            :class:`AnagramIndex` or
+            :class:`~src.ch03.c1_anagram_vectors.AnagramMatrix` of it.
 
     Returns:
         :py:obj:`list` of :py:obj:`str` with all anagrams in **word**.
 
+    Note:
+        An :class:`AnagramIndex` only checks IDs that can be IN **word** and
+        an :class:`~src.ch03.c1_anagram_vectors.AnagramMatrix` checks every
+        ID at once. Otherwise, every ID in **anagram_dict** is checked one at
+        a time.
+
     """
     if not word.islower():
         word = word.lower()
@@ -198,14 +500,19 @@ def find_anagrams(word: str, anagram_dict: dict) -> list:
         # If word is a phrase with spaces, remove spaces.
         word = ''.join(word.split())
     anagrams = []
+    for key in _usable_keys(anagram_dict, word):
+        anagrams.extend(anagram_dict[key])
+    return sorted(anagrams)
+
+
+def _usable_keys(anagram_dict: dict, word: str) -> list:
+    """Get IDs of anagram_dict that can be IN word."""
+    if isinstance(anagram_dict, (AnagramIndex, AnagramMasks, AnagramMatrix)):
+        return anagram_dict.find_keys(word)
     id_num = get_id(word)
-    keys = list(anagram_dict.keys())  # Make keys indexable. Python3.6 only?
     # If an anagram is IN the word, the modulo of the anagram's ID and the
     # word's ID will be 0.
-    for key in keys:
-        if id_num % key == 0:
-            anagrams.extend(anagram_dict[key])
-    return sorted(anagrams)
+    return [key for key in anagram_dict if id_num % key == 0]
 
 
 def remove_unusable_words(anagram_dict: dict, usable_letters: list) -> dict:
@@ -221,17 +528,22 @@ def remove_unusable_words(anagram_dict: dict, usable_letters: list) -> dict:
     Returns:
         :py:class:`~collections.defaultdict` of :py:obj:`list` with an ID
         (:py:obj:`int`) as the key and words whose product of letters equal
-        that ID as values.
+        that ID as values. If **anagram_dict** is an :class:`AnagramIndex`,
+        :class:`AnagramMasks`, or
+        :class:`~src.ch03.c1_anagram_vectors.AnagramMatrix`, so is the
+        pruned dictionary.
 
     """
     new_word = ''.join(usable_letters)
     new_anagram_dict = defaultdict(list)
-    id_num = get_id(new_word)
-    keys = list(anagram_dict.keys())  # Make keys indexable. Python3.6 only?
     # If anagram can be IN new_word, add to new_anagram_dict.
-    for key in keys:
-        if id_num % key == 0:
-            new_anagram_dict[key] = anagram_dict[key]
+    for key in _usable_keys(anagram_dict, new_word):
+        new_anagram_dict[key] = anagram_dict[key]
+    if isinstance(anagram_dict, AnagramMasks):
+        # Reuse the letter masks.
+        return AnagramMasks(new_anagram_dict, anagram_dict.masks)
+    if isinstance(anagram_dict, (AnagramIndex, AnagramMatrix)):
+        return type(anagram_dict)(new_anagram_dict)
     return new_anagram_dict
 
 
@@ -247,6 +559,9 @@ def find_anagram_phrases(phrases: list, word: str, anagram_dict: dict,
         phrases (list): List of anagram phrases.
         word (str): Current word to find anagram phrases of.
         anagram_dict (dict): Current anagram dictionary to find anagrams with.
+            If an :class:`AnagramIndex`, it is not pruned between calls.
+            If a plain dictionary, it is pruned into an
+            :class:`AnagramMasks` for the next calls.
         phrase (list): Current anagram phrase candidate.
 
     Returns:
@@ -257,7 +572,14 @@ def find_anagram_phrases(phrases: list, word: str, anagram_dict: dict,
     letters.subtract(''.join(phrase))
     letters_left = list(letters.elements())
 
-    new_anagram_dict = remove_unusable_words(anagram_dict, letters_left)
+    if isinstance(anagram_dict, AnagramIndex):
+        # Walking the trie already skips unusable words.
+        new_anagram_dict = anagram_dict
+    else:
+        new_anagram_dict = remove_unusable_words(anagram_dict, letters_left)
+        if not isinstance(new_anagram_dict, (AnagramMasks, AnagramMatrix)):
+            # Add letter masks so deeper calls can skip most IDs with an AND.
+            new_anagram_dict = AnagramMasks(new_anagram_dict)
     # Once the length is equal, we have an anagram phrase.
     if len(word.replace(' ', '')) == len(''.join(phrase)):
         if Counter(word.replace(' ', '')) == Counter(''.join(phrase)):
@@ -273,40 +595,340 @@ def find_anagram_phrases(phrases: list, word: str, anagram_dict: dict,
     return None
 
 
-def anagram_generator(word: str) -> list:
+def iter_anagram_phrases(word: str, anagram_dict: dict, limit: int = None,
+                         canonical: bool = False, cache: LetterCache = None):
+    """Iterate over anagram phrases.
+
+    Same anagram phrases in the same order as :func:`find_anagram_phrases`,
+    but uses a stack instead of recursion and yields each anagram phrase as
+    soon as it is found. Stop iterating to stop searching.
+
+    Args:
+        word (str): Word to find anagram phrases of.
+        anagram_dict (dict): Anagram dictionary to find anagrams with. If an
+            :class:`AnagramIndex`, :class:`AnagramMasks`, or
+            :class:`~src.ch03.c1_anagram_vectors.AnagramMatrix`, the search
+            uses the same kind of index. If a plain dictionary, it is built
+            into an :class:`AnagramIndex`.
+        limit (int): Maximum number of anagram phrases to yield. Defaults to
+            :py:obj:`None` for all of them.
+        canonical (bool): Whether to only yield anagram phrases with words in
+            alphabetical order. Defaults to :py:obj:`False`.
+        cache (LetterCache): Cache to remember the anagrams of the letters
+            left in, and their anagram phrases if
+            :attr:`~src.ch03.c1_anagram_memo.LetterCache.completions`.
+            Defaults to :py:obj:`None` to not remember anything.
+
+    Yields:
+        :py:obj:`str` with the next anagram phrase of **word**.
+
+    Note:
+        Without **cache**, only keeps the current anagram phrase and the
+        unused anagrams of each of its words in memory.
+
+        If **canonical**, every other order of the same words is skipped
+        without being searched. Use :func:`permute_phrases` to get them
+        back.
+
+    """
+    letters = Counter(''.join(word.lower().split()))
+    anagram_dict = _search_index(anagram_dict, letters)
+    yield from islice(_search_phrases(letters, anagram_dict, [], canonical,
+                                      cache), limit)
+
+
+def _search_index(anagram_dict: dict, letters: Counter) -> Mapping:
+    """Prune anagram_dict to letters as an index to search with."""
+    anagram_dict = remove_unusable_words(anagram_dict,
+                                         list(letters.elements()))
+    if isinstance(anagram_dict, (AnagramIndex, AnagramMasks, AnagramMatrix)):
+        # Keep the chosen encoding.
+        return anagram_dict
+    # Build anagram index specific to word.
+    return AnagramIndex(anagram_dict)
+
+
+def _search_phrases(letters: Counter, anagram_dict: dict, phrase: list,
+                    canonical: bool, cache: LetterCache = None):
+    """Yield anagram phrases that start with phrase using letters left."""
+    letters, phrase = letters.copy(), phrase[:]
+    letters_left = sum(letters.values())
+    if not letters_left:
+        yield ' '.join(phrase)
+        return
+    if cache is not None and cache.completions:
+        completions = _completions(letters, anagram_dict, canonical, cache)
+        if canonical and phrase:
+            # Completions are sorted, so skip straight to the minimum.
+            completions = completions[bisect_left(completions,
+                                                  (phrase[-1],)):]
+        for completion in completions:
+            yield ' '.join(phrase + list(completion))
+        return
+    # Each level of the stack has the anagrams left to try for the next word
+    # in phrase.
+    stack = [_next_anagrams(letters, anagram_dict,
+                            phrase[-1] if canonical and phrase else None,
+                            cache)]
+    while stack:
+        anagram = next(stack[-1], None)
+        if anagram is None:
+            # Out of anagrams, so take back the previous word.
+            stack.pop()
+            if stack:
+                letters.update(phrase[-1])
+                letters_left += len(phrase.pop())
+            continue
+        phrase.append(anagram)
+        letters.subtract(anagram)
+        letters_left -= len(anagram)
+        if letters_left:
+            # Find anagrams in the letters left for the next word.
+            stack.append(_next_anagrams(letters, anagram_dict,
+                                        anagram if canonical else None,
+                                        cache))
+            continue
+        # All letters are used, so we have an anagram phrase.
+        yield ' '.join(phrase)
+        letters.update(anagram)
+        letters_left += len(phrase.pop())
+
+
+def _next_anagrams(letters: Counter, anagram_dict: dict, minimum: str,
+                   cache: LetterCache = None):
+    """Iterate over anagrams in letters that aren't before minimum."""
+    if cache is None:
+        anagrams = find_anagrams(''.join(letters.elements()), anagram_dict)
+    else:
+        signature = get_signature(letters)
+        anagrams = cache.get(signature)
+        if anagrams is None:
+            anagrams = tuple(find_anagrams(signature, anagram_dict))
+            cache.put(signature, anagrams)
+    if minimum is not None:
+        # Anagrams are sorted, so skip straight to the minimum.
+        anagrams = anagrams[bisect_left(anagrams, minimum):]
+    return iter(anagrams)
+
+
+def _completions(letters: Counter, anagram_dict: dict, canonical: bool,
+                 cache: LetterCache) -> tuple:
+    """Get sorted tuple of word tuples that use exactly the letters left."""
+    key = (get_signature(letters), canonical)
+    completions = cache.get(key)
+    if completions is not None:
+        return completions
+    completions = []
+    letters = letters.copy()
+    for anagram in _next_anagrams(letters, anagram_dict, None, cache):
+        letters.subtract(anagram)
+        if any(count > 0 for count in letters.values()):
+            rest = _completions(letters, anagram_dict, canonical, cache)
+            if canonical:
+                rest = rest[bisect_left(rest, (anagram,)):]
+            completions.extend((anagram,) + words for words in rest)
+        else:
+            completions.append((anagram,))
+        letters.update(anagram)
+    completions = tuple(completions)
+    cache.put(key, completions)
+    return completions
+
+
+def permute_phrases(phrases):
+    """Permute words of phrases.
+
+    Expand each phrase into every distinct order of its words. Useful for
+    getting all anagram phrases back from
+    :func:`iter_anagram_phrases` with **canonical**.
+
+    Args:
+        phrases: Iterable of :py:obj:`str` phrases with words separated by
+            spaces.
+
+    Yields:
+        :py:obj:`str` with the next order of words of each phrase in sorted
+        order.
+
+    Example:
+        >>> from src.ch03.c1_anagram_generator import permute_phrases
+        >>> list(permute_phrases(['a act', 'a cat']))
+        ['a act', 'act a', 'a cat', 'cat a']
+
+    """
+    for phrase in phrases:
+        # Repeated words make repeated orders.
+        orders = set(permutations(phrase.split()))
+        for order in sorted(orders):
+            yield ' '.join(order)
+
+
+def pool_iter_anagram_phrases(word: str, anagram_dict: dict,
+                              workers: int = None, limit: int = None,
+                              canonical: bool = False):
+    """Multiprocess iterate over anagram phrases.
+
+    Split the search of :func:`iter_anagram_phrases` into tasks that each
+    search the anagram phrases starting with different words, then use
+    :py:class:`~concurrent.futures.ProcessPoolExecutor` to search them in
+    parallel.
+
+    Args:
+        word (str): Word to find anagram phrases of.
+        anagram_dict (dict): Anagram dictionary to find anagrams with, like
+            :func:`iter_anagram_phrases`.
+        workers (int): Number of processes to use. Defaults to
+            :py:func:`os.cpu_count`.
+        limit (int): Maximum number of anagram phrases to yield. Defaults to
+            :py:obj:`None` for all of them.
+        canonical (bool): Whether to only yield anagram phrases with words in
+            alphabetical order. Defaults to :py:obj:`False`.
+
+    Yields:
+        :py:obj:`str` with the next anagram phrase of **word** in the same
+        order as :func:`iter_anagram_phrases`.
+
+    Note:
+        Makes about :py:const:`TASKS_PER_WORKER` tasks per process by
+        splitting the tasks with the most letters left by their next word.
+        Processes take the next task as soon as they finish one, so one big
+        task doesn't leave the others waiting. The anagram index is only
+        sent once to each process, so each task only sends its starting
+        phrase.
+
+    """
+    if workers is None:
+        workers = cpu_count()
+    letters = Counter(''.join(word.lower().split()))
+    # Send the smaller anagram index specific to word to each process.
+    anagram_dict = _search_index(anagram_dict, letters)
+    phrases = _split_phrases(letters, anagram_dict, canonical,
+                             workers * TASKS_PER_WORKER)
+    with ProcessPoolExecutor(max_workers=workers,
+                             initializer=_init_search_task,
+                             initargs=(anagram_dict,)) as executor:
+        futures = [executor.submit(_search_phrase_task, letters, phrase,
+                                   canonical) for phrase in phrases]
+        try:
+            # Wait for tasks in order to keep anagram phrases in order.
+            yield from islice((anagram_phrase for future in futures
+                               for anagram_phrase in future.result()), limit)
+        finally:
+            # Skip tasks that haven't started if stopped early.
+            for future in futures:
+                future.cancel()
+
+
+def _split_phrases(letters: Counter, anagram_dict: dict, canonical: bool,
+                   tasks: int) -> list:
+    """Split anagram phrase search into at least tasks starting phrases."""
+    phrases = [[]]
+    while len(phrases) < tasks:
+        # Split the phrase with the most letters left, in case it's big.
+        letters_left = [sum(letters.values()) - len(''.join(phrase))
+                        for phrase in phrases]
+        most = max(letters_left, default=0)
+        if not most:
+            # Only complete anagram phrases left, if any.
+            break
+        i = letters_left.index(most)
+        phrase_letters = letters.copy()
+        phrase_letters.subtract(''.join(phrases[i]))
+        minimum = phrases[i][-1] if canonical and phrases[i] else None
+        # Replace in place to keep the same order as one search.
+        phrases[i:i + 1] = [
+            phrases[i] + [anagram] for anagram in
+            _next_anagrams(phrase_letters, anagram_dict, minimum)]
+    return phrases
+
+
+def _init_search_task(anagram_dict: dict) -> None:
+    """Keep anagram index of the search for the tasks of a process."""
+    # pylint: disable=global-statement
+    # Set once per process, so tasks don't each send the anagram index.
+    global _TASK_INDEX
+    _TASK_INDEX = anagram_dict
+
+
+def _search_phrase_task(letters: Counter, phrase: list,
+                        canonical: bool) -> list:
+    """Find anagram phrases that start with phrase in a process."""
+    letters = letters.copy()
+    letters.subtract(''.join(phrase))
+    return list(_search_phrases(letters, _TASK_INDEX, phrase, canonical,
+                                LetterCache()))
+
+
+def anagram_generator(word: str, cache_dir: str = None, limit: int = None,
+                      canonical: bool = False, permute: bool = False,
+                      workers: int = None, encoding: str = 'prime') -> list:
     """Generate phrase anagrams.
 
     Make phrase anagrams from a given word or phrase.
 
     Args:
         word (str): Word to get phrase anagrams of.
+        cache_dir (str): Path to folder with anagram dictionary cache files.
+            Defaults to :py:const:`~src.ch03.ANAGRAM_CACHE_DIR`.
+        limit (int): Maximum number of phrase anagrams to make. Defaults to
+            :py:obj:`None` for all of them.
+        canonical (bool): Whether to only search for phrase anagrams with
+            words in alphabetical order. Defaults to :py:obj:`False`.
+        permute (bool): Whether to expand canonical phrase anagrams into
+            every order of their words with :func:`permute_phrases`.
+            Defaults to :py:obj:`False`.
+        workers (int): Number of processes to search with using
+            :func:`pool_iter_anagram_phrases`. Defaults to :py:obj:`None` to
+            search in this process.
+        encoding (str): How to find the words IN **word** and the letters
+            left of each anagram phrase. Either ``prime`` to check the IDs
+            from :func:`get_id` and then search an :class:`AnagramIndex`,
+            ``mask`` to check letter masks first with
+            :class:`AnagramMasks`, or ``vector`` to check letter counts with
+            :class:`~src.ch03.c1_anagram_vectors.AnagramMatrix`. Defaults to
+            ``prime``.
 
     Returns:
         :py:obj:`list` of phrase anagrams of **word**.
 
+    Raises:
+        ValueError: If **encoding** isn't ``prime``, ``mask``, or
+            ``vector``.
+
+    Note:
+        With **canonical**, phrase anagrams with three or more words are
+        found much faster since each set of words is only searched once.
+
     """
-    phrases, phrase = [], []
-    dictionary = cleanup_list_more(cleanup_dict(DICTIONARY_FILE_PATH))
-    anagram_dict = multi_get_anagram_dict(dictionary)
-    # Build anagram dictionary specific to word.
-    new_anagram_dict = remove_unusable_words(anagram_dict,
-                                             list(word.replace(' ', '')))
-    # Recursively find phrases using new_anagram_dict.
-    find_anagram_phrases(phrases, word, new_anagram_dict, phrase)
-    return phrases
+    # pylint: disable=too-many-arguments
+    # Each argument is an optional setting of the search.
+    if encoding not in ('prime', 'mask', 'vector'):
+        raise ValueError(ENCODING_ERROR)
+    anagram_dict = cached_anagram_dict(DICTIONARY_FILE_PATH, cache_dir)
+    if encoding == 'mask':
+        anagram_dict = AnagramMasks(anagram_dict)
+    elif encoding == 'vector':
+        anagram_dict = AnagramMatrix(anagram_dict)
+    if workers is None:
+        phrases = iter_anagram_phrases(word, anagram_dict, canonical=canonical,
+                                       cache=LetterCache())
+    else:
+        phrases = pool_iter_anagram_phrases(word, anagram_dict, workers,
+                                            canonical=canonical)
+    if canonical and permute:
+        phrases = permute_phrases(phrases)
+    return list(islice(phrases, limit))
 
 
 def main():
     """Demonstrate the Anagram Generator."""
     print('I can find all phrase anagrams given a word or phrase.\n'
           'I\'m fun at parties.')
-    # Print first 500 results.
+    # Print first 500 results as they are found.
     word = 'see shells'
     print(f'\nAnalyzing: {word}\n')
-    anagram_phrases = anagram_generator(word)
-    for i, phrase in enumerate(anagram_phrases):
-        if i > 500:
-            break
+    anagram_dict = cached_anagram_dict(DICTIONARY_FILE_PATH)
+    for phrase in iter_anagram_phrases(word, anagram_dict, limit=501):
         print(phrase)
 
 
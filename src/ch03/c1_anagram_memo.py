@@ -0,0 +1,142 @@
+"""Remember anagram phrase searches by the letters left.
+
+Different orders of the same words leave the same letters to search, so
+the anagrams in those letters, and even every anagram phrase that can be
+made with them, only have to be found once. Letters are remembered by their
+signature from :func:`get_signature` in a :class:`LetterCache` that forgets
+the least recently used letters once it is full.
+
+Attributes:
+    CacheInfo (namedtuple): Hits, misses, maximum size, and current size of
+        a :class:`LetterCache`, like :py:func:`functools.lru_cache`.
+
+"""
+from collections import namedtuple, OrderedDict
+
+CacheInfo = namedtuple('CacheInfo', ['hits', 'misses', 'maxsize', 'currsize'])
+
+
+def get_signature(letters) -> str:
+    """Get signature of letters.
+
+    Args:
+        letters: :py:class:`~collections.Counter` of letters or
+            :py:obj:`str` of letters.
+
+    Returns:
+        :py:obj:`str` with **letters** in alphabetical order, so every
+        order of the same letters has the same signature.
+
+    Example:
+        >>> from collections import Counter
+        >>> from src.ch03.c1_anagram_memo import get_signature
+        >>> get_signature(Counter('shells'))
+        'ehllss'
+
+    """
+    if isinstance(letters, str):
+        return ''.join(sorted(letters))
+    return ''.join(sorted(letters.elements()))
+
+
+class LetterCache:
+    """Least recently used cache of letter signatures.
+
+    Remembers up to **maxsize** values by key, then forgets the least
+    recently used key to make room for each new one.
+
+    Args:
+        maxsize (int): Maximum number of keys to remember. Defaults to
+            ``1024``.
+        completions (bool): Whether to also remember every anagram phrase
+            of the letters left, not just their anagrams. Defaults to
+            :py:obj:`False`.
+
+    Note:
+        Values are only valid for the anagram dictionary they were found
+        with, so use one cache per anagram dictionary.
+
+    Example:
+        >>> from src.ch03.c1_anagram_memo import LetterCache
+        >>> cache = LetterCache(maxsize=2)
+        >>> cache.put('act', ('a', 'act', 'at', 'cat'))
+        >>> cache.get('act')
+        ('a', 'act', 'at', 'cat')
+        >>> cache.cache_info()
+        CacheInfo(hits=1, misses=0, maxsize=2, currsize=1)
+
+    """
+
+    def __init__(self, maxsize: int = 1024, completions: bool = False):
+        """Initialize class."""
+        self._maxsize = maxsize
+        self._completions = completions
+        self._cache = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+
+    def __len__(self) -> int:
+        """Get number of keys remembered."""
+        return len(self._cache)
+
+    @property
+    def maxsize(self) -> int:
+        """int: Maximum number of keys to remember."""
+        return self._maxsize
+
+    @property
+    def completions(self) -> bool:
+        """bool: Whether to remember anagram phrases of letters left."""
+        return self._completions
+
+    def get(self, key):
+        """Get value of key.
+
+        Args:
+            key: Key to get value of.
+
+        Returns:
+            Value of **key** if remembered, :py:obj:`None` otherwise.
+
+        """
+        value = self._cache.get(key)
+        if value is None:
+            self._misses += 1
+            return None
+        self._hits += 1
+        self._cache.move_to_end(key)
+        return value
+
+    def put(self, key, value) -> None:
+        """Remember value of key.
+
+        Args:
+            key: Key to remember value of.
+            value: Value to remember. Must not be :py:obj:`None`.
+
+        Returns:
+            :py:obj:`None`. If full, the least recently used key is
+            forgotten.
+
+        """
+        self._cache[key] = value
+        self._cache.move_to_end(key)
+        while len(self._cache) > self._maxsize:
+            self._cache.popitem(last=False)
+
+    def cache_info(self) -> CacheInfo:
+        """Get cache statistics.
+
+        Returns:
+            :py:obj:`CacheInfo` with the number of hits and misses of
+            :meth:`get`, **maxsize**, and number of keys remembered.
+
+        """
+        return CacheInfo(self._hits, self._misses, self._maxsize,
+                         len(self._cache))
+
+    def clear(self) -> None:
+        """Forget every key and reset statistics."""
+        self._cache.clear()
+        self._hits = 0
+        self._misses = 0
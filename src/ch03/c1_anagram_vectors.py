@@ -0,0 +1,113 @@
+"""Find anagrams with letter count vectors.
+
+Instead of the product of primes from
+:func:`~src.ch03.c1_anagram_generator.get_id`, represent each word as a
+vector of how many times each letter in :py:obj:`~string.ascii_lowercase`
+appears in it. A word is IN some letters if none of its counts are more than
+the counts of those letters, which :py:mod:`numpy` can check for every word
+at once.
+
+"""
+from collections.abc import Mapping
+import numpy as np
+
+
+def get_counts(word: str) -> np.ndarray:
+    """Get letter counts of word.
+
+    Args:
+        word (str): Lowercase word to count letters of.
+
+    Returns:
+        :py:class:`numpy.ndarray` with how many times each letter in
+        :py:obj:`~string.ascii_lowercase` appears in **word**.
+
+    """
+    letters = np.frombuffer(word.encode('ascii'), dtype=np.uint8) - ord('a')
+    return np.bincount(letters, minlength=26)
+
+
+def get_count_matrix(word_list: list) -> np.ndarray:
+    """Get letter count matrix of words.
+
+    Args:
+        word_list (list): List of lowercase words to count letters of.
+
+    Returns:
+        :py:class:`numpy.ndarray` of :py:class:`numpy.uint8` with one row of
+        26 letter counts, like :func:`get_counts`, for each word in
+        **word_list**.
+
+    """
+    counts = np.zeros((len(word_list), 26), dtype=np.uint8)
+    letters = np.frombuffer(''.join(word_list).encode('ascii'),
+                            dtype=np.uint8) - ord('a')
+    # Row number of each letter in letters.
+    rows = np.repeat(np.arange(len(word_list)),
+                     [len(word) for word in word_list])
+    np.add.at(counts, (rows, letters), 1)
+    return counts
+
+
+class AnagramMatrix(Mapping):
+    """Letter count matrix of an anagram dictionary.
+
+    Read-only mapping with the same IDs and words as the anagram dictionary
+    it is built from. Each ID also has letter counts in a matrix from
+    :func:`get_count_matrix`, so the IDs that can be IN some letters are
+    found by comparing the counts of every ID at once.
+
+    Args:
+        anagram_dict (dict): Dictionary from
+            :func:`~src.ch03.c1_anagram_generator.get_anagram_dict`.
+
+    Example:
+        >>> from src.ch03.c1_anagram_vectors import AnagramMatrix
+        >>> matrix = AnagramMatrix({3715217: ['sett', 'test'], 451: ['me']})
+        >>> matrix.find_keys('tests')
+        [3715217]
+
+    """
+
+    def __init__(self, anagram_dict: dict):
+        """Initialize class."""
+        self._anagram_dict = dict(anagram_dict)
+        # Words with the same ID have the same letter counts.
+        self._keys = [key for key, words in self._anagram_dict.items()
+                      if words]
+        # Store each letter's counts together, so they can be compared one
+        # letter at a time.
+        self._counts = np.ascontiguousarray(get_count_matrix(
+            [self._anagram_dict[key][0] for key in self._keys]).T)
+
+    def __getitem__(self, key: int) -> list:
+        """Get words with ID of key."""
+        return self._anagram_dict[key]
+
+    def __iter__(self):
+        """Iterate over IDs."""
+        return iter(self._anagram_dict)
+
+    def __len__(self) -> int:
+        """Get number of IDs."""
+        return len(self._anagram_dict)
+
+    def find_keys(self, letters: str) -> list:
+        """Find IDs in letters.
+
+        Args:
+            letters (str): Lowercase letters that IDs must be IN.
+
+        Returns:
+            :py:obj:`list` of :py:obj:`int` IDs whose words can be made with
+            **letters**.
+
+        """
+        # Compare as uint8 to skip converting the matrix to int64.
+        budget = np.minimum(get_counts(letters), 255).astype(np.uint8)
+        # Same as (counts <= budget).all(axis=1) with one row per ID, but
+        # without making a boolean matrix first.
+        fits = np.ones(len(self._keys), dtype=bool)
+        for letter_counts, letter_budget in zip(self._counts, budget):
+            fits &= letter_counts <= letter_budget
+        return [self._keys[i] for i in np.flatnonzero(fits)]
@@ -0,0 +1,148 @@
+"""Share cache files of word dictionaries.
+
+Anagram dictionary cache files and digram index files are both built from
+a word dictionary file, saved next to each other in a cache folder, and
+built again when the word dictionary file changes. Each kind of cache file
+only has to read and build its own contents with :func:`load_cache_file`.
+
+A word dictionary file is fingerprinted with :func:`get_fingerprint`, and
+each cache file keeps the fingerprint it was built from, so
+:func:`is_fresh` can tell when to build it again.
+
+"""
+import hashlib
+import os
+from tempfile import NamedTemporaryFile
+
+
+def get_fingerprint(filepath: str) -> tuple:
+    """Get fingerprint of file.
+
+    Args:
+        filepath (str): Path to file to fingerprint.
+
+    Returns:
+        :py:obj:`tuple` with the size in bytes, modification time in
+        nanoseconds, and SHA-256 hash of the file at **filepath**.
+
+    """
+    stat = os.stat(filepath)
+    return stat.st_size, stat.st_mtime_ns, _get_digest(filepath)
+
+
+def _get_digest(filepath: str) -> bytes:
+    """Get SHA-256 hash of file at filepath."""
+    digest = hashlib.sha256()
+    with open(filepath, 'rb') as file:
+        for block in iter(lambda: file.read(1 << 16), b''):
+            digest.update(block)
+    return digest.digest()
+
+
+def is_fresh(filepath: str, fingerprint: tuple) -> bool:
+    """Check if fingerprint still matches file.
+
+    Args:
+        filepath (str): Path to fingerprinted file.
+        fingerprint (tuple): Fingerprint from :func:`get_fingerprint`.
+
+    Returns:
+        :py:obj:`True` if the file at **filepath** hasn't changed since
+        **fingerprint** was made, :py:obj:`False` otherwise.
+
+    Note:
+        Only hashes the file if its size matches, but its modification time
+        doesn't.
+
+    """
+    size, mtime, digest = fingerprint
+    stat = os.stat(filepath)
+    if stat.st_size != size:
+        return False
+    if stat.st_mtime_ns == mtime:
+        return True
+    # Touched, but maybe not changed.
+    return _get_digest(filepath) == digest
+
+
+def get_cache_path(filepath: str, cache_dir: str, extension: str) -> str:
+    """Get cache file path of file.
+
+    Args:
+        filepath (str): Path to word dictionary file.
+        cache_dir (str): Path to folder with cache files.
+        extension (str): File extension of the kind of cache file.
+
+    Returns:
+        :py:obj:`str` with path to the cache file of **filepath** in
+        **cache_dir**. Each word dictionary file gets its own cache file of
+        each kind.
+
+    """
+    name = hashlib.sha256(os.path.abspath(filepath).encode()).hexdigest()
+    return os.path.join(cache_dir, f'{name[:16]}.{extension}')
+
+
+def write_cache_file(data: bytes, cache_file: str) -> None:
+    """Write cache file.
+
+    Args:
+        data (bytes): Contents of cache file.
+        cache_file (str): Path to cache file to write.
+
+    Returns:
+        :py:obj:`None`. **data** is written to **cache_file**.
+
+    Note:
+        Writes to a temporary file first, then replaces **cache_file**, so
+        other processes never read a partial cache file.
+
+    """
+    file = NamedTemporaryFile(dir=os.path.dirname(cache_file), delete=False)
+    try:
+        with file:
+            file.write(data)
+        os.replace(file.name, cache_file)
+    except OSError:
+        # Don't leave a partial temporary file behind.
+        os.remove(file.name)
+        raise
+
+
+def load_cache_file(dict_file: str, cache_file: str, read, build):
+    """Load cache file of word dictionary file.
+
+    Read **cache_file** with **read**. If missing, unreadable, or stale,
+    build it again from **dict_file** with **build** and save it with
+    :func:`write_cache_file`.
+
+    Args:
+        dict_file (str): Path to word dictionary file.
+        cache_file (str): Path to cache file of **dict_file**.
+        read: Callable that takes **cache_file** and **dict_file** and
+            returns what is cached, or raises :py:exc:`OSError` or
+            :py:exc:`ValueError` if it can't.
+        build: Callable that takes the fingerprint of **dict_file** from
+            :func:`get_fingerprint` and returns a :py:obj:`tuple` with what
+            to cache and the contents of its cache file.
+
+    Returns:
+        What **read** or **build** returned. If **cache_file** can't be
+        written, like in a read-only cache folder, it is still returned,
+        but built again next time.
+
+    """
+    try:
+        return read(cache_file, dict_file)
+    except (OSError, ValueError):
+        # Missing, unreadable, or stale cache file, so build it again.
+        pass
+    # Fingerprint first, so changes made while building make it stale.
+    value, data = build(get_fingerprint(dict_file))
+    try:
+        os.makedirs(os.path.dirname(cache_file), exist_ok=True)
+        write_cache_file(data, cache_file)
+    except OSError:
+        # Read-only or full cache folder, so skip caching this time.
+        pass
+    return value
@@ -1,10 +1,15 @@
 """Counts the occurrence of all possible digrams of a word in a dictionary."""
+import os
+from functools import lru_cache
 from itertools import permutations
+from string import ascii_lowercase
 from collections import Counter
 from src.ch01.practice.p2_poor_bar_chart import print_bar_chart
-from src.ch02.p1_cleanup_dictionary import read_from_file
+from src.ch02.p1_cleanup_dictionary import iter_words
 from src.ch02 import DICTIONARY_FILE_PATH
-from src.ch03 import GET_DIGRAMS_ERROR, COUNT_DIGRAMS_ERROR
+from src.ch03 import GET_DIGRAMS_ERROR, COUNT_DIGRAMS_ERROR, BACKEND_ERROR
+from src.ch03 import p1_digram_vectors
+from src.ch03.p1_digram_index import load_digram_index
 
 
 def get_digrams(word: str) -> set:
@@ -28,14 +33,83 @@ def get_digrams(word: str) -> set:
     return set(''.join(i) for i in permutations(word, 2))
 
 
-def count_digrams(digrams: set, dict_list: list) -> dict:
+def get_digram_table(dict_list) -> dict:
+    """Get digram table of word dictionary.
+
+    Count how many words in a word dictionary list have each digram in one
+    pass over the list.
+
+    Args:
+        dict_list: Word dictionary list, or any iterable of words, like
+            :func:`~src.ch02.p1_cleanup_dictionary.iter_words`.
+
+    Returns:
+        :py:class:`~collections.Counter` with every digram in
+        **dict_list** as keys and the number of words that have it as
+        values.
+
+    Example:
+        >>> from src.ch03.p1_digram_counter import get_digram_table
+        >>> digram_table = get_digram_table(['tom', 'moon', 'mom'])
+        >>> digram_table['om'], digram_table['oo'], digram_table['ab']
+        (2, 1, 0)
+
+    """
+    digram_table = Counter()
+    for word in dict_list:
+        # Use a set, so each word is only counted once per digram.
+        digram_table.update({word[i:i + 2] for i in range(len(word) - 1)})
+    return digram_table
+
+
+def make_digram_table(dict_list: list, backend: str = 'python') -> dict:
+    """Make digram table of word dictionary with backend.
+
+    Args:
+        dict_list (list): Word dictionary list.
+        backend (str): How to make the digram table. Either ``python`` for
+            :func:`get_digram_table` or ``numpy`` for
+            :func:`~src.ch03.p1_digram_vectors.get_digram_table`. Both give
+            the same counts. Defaults to ``python``.
+
+    Returns:
+        :py:obj:`dict` with every digram in **dict_list** as keys and the
+        number of words that have it as values.
+
+    Raises:
+        ValueError: If **backend** isn't ``python`` or ``numpy``.
+
+    Example:
+        >>> from src.ch03.p1_digram_counter import make_digram_table
+        >>> word_list = ['cake', 'cocoa', 'bake']
+        >>> digram_table = make_digram_table(word_list, 'numpy')
+        >>> digram_table['ak'], digram_table['co']
+        (2, 1)
+
+    """
+    if backend == 'python':
+        return get_digram_table(dict_list)
+    if backend == 'numpy':
+        return p1_digram_vectors.get_digram_table(dict_list)
+    raise ValueError(BACKEND_ERROR)
+
+
+def count_digrams(digrams: set, dict_list: list, backend: str = 'python',
+                  digram_table: dict = None) -> dict:
     """Count digrams in word dictionary.
 
-    Count frequency of each digram in the set in a word dictionary list.
+    Count frequency of each digram in the set in a word dictionary list by
+    looking it up in the table from :func:`make_digram_table`.
 
     Args:
         digrams (set): Set of digrams to count frequency of.
         dict_list (list): Word dictionary list.
+        backend (str): How to make the digram table. Either ``python`` or
+            ``numpy``, like :func:`make_digram_table`. Defaults to
+            ``python``.
+        digram_table (dict): Digram table of **dict_list** from
+            :func:`make_digram_table`. If given, it is looked up instead of
+            making the digram table again. Defaults to :py:obj:`None`.
 
     Returns:
         :py:class:`~collections.Counter` with digrams as keys and their
@@ -44,43 +118,107 @@ def count_digrams(digrams: set, dict_list: list) -> dict:
     Raises:
         TypeError: If **digrams** isn't a set or if **dict_list** isn't a
             list.
+        ValueError: If **backend** isn't ``python`` or ``numpy``.
+
+    Note:
+        Without **digram_table**, the digram table of **dict_list** is made
+        each time. To count the digrams of many words in the same words,
+        make it once with :func:`make_digram_table` and pass it as
+        **digram_table**.
+
+    Example:
+        >>> from src.ch03.p1_digram_counter import count_digrams
+        >>> from src.ch03.p1_digram_counter import make_digram_table
+        >>> word_list = ['tom', 'moon', 'mom']
+        >>> digram_table = make_digram_table(word_list)
+        >>> for word in ['om', 'oo']:
+        ...     print(count_digrams({word}, word_list,
+        ...                         digram_table=digram_table))
+        Counter({'om': 2})
+        Counter({'oo': 1})
 
     """
     if not all([isinstance(digrams, set), isinstance(dict_list, list)]):
         raise TypeError(COUNT_DIGRAMS_ERROR)
-    # Initialize Counter with the digram set.
-    digram_count = Counter(digrams)
-    digram_count.subtract(digrams)  # Set values to `0`
-    # Iterate through each digram in the set.
+    if digram_table is None:
+        digram_table = make_digram_table(dict_list, backend)
+    return lookup_digrams(digrams, digram_table, dict_list)
+
+
+def lookup_digrams(digrams: set, digram_table: dict,
+                   dict_list: list = None) -> dict:
+    """Look up digrams in digram table.
+
+    Args:
+        digrams (set): Set of digrams to get frequency of.
+        digram_table (dict): Digram table from :func:`get_digram_table` or
+            :func:`make_digram_table`.
+        dict_list (list): Word dictionary list **digram_table** was made
+            from. Only needed for strings in **digrams** that aren't two
+            characters long. Defaults to :py:obj:`None`.
+
+    Returns:
+        :py:class:`~collections.Counter` with digrams as keys and their
+        counts as values.
+
+    """
+    digram_count = Counter()
     for digram in digrams:
-        # For each digram, iterate through dict_list to find the digram.
-        for word in dict_list:
-            if digram in word:
-                # If found, increment counter.
-                digram_count[digram] += 1
+        if len(digram) == 2 or dict_list is None:
+            digram_count[digram] = digram_table.get(digram, 0)
+        else:
+            # Not in the table, so search each word for it.
+            digram_count[digram] = sum(digram in word for word in dict_list)
     return digram_count
 
 
-def digram_counter(word: str, dict_file: str = DICTIONARY_FILE_PATH) -> dict:
-    """Wrap get_digrams, count_digrams, and read_from_file.
+def digram_counter(word: str, dict_file: str = DICTIONARY_FILE_PATH,
+                   cache_dir: str = None) -> dict:
+    """Wrap get_digrams, get_digram_table, and iter_words.
 
     Send **word** through :func:`get_digrams` to get a set of digrams which
-    is then passed through :func:`count_digrams` along with the list made by
-    passing **dict_file** through
-    :py:func:`~src.ch01.challenge.c2_name_generator.read_from_file`.
+    are then looked up in the table made by :func:`get_digram_table` from
+    the words streamed by passing **dict_file** through
+    :py:func:`~src.ch02.p1_cleanup_dictionary.iter_words`.
 
     Args:
         word (str): Word to get digrams of.
         dict_file (str): Path of dictionary file to get a frequency analysis
             of each digram. Defaults to
             :py:const:`~src.ch02.DICTIONARY_FILE_PATH`.
+        cache_dir (str): Path to folder with digram index files. If given,
+            lowercase digrams are looked up in the memory-mapped index file
+            of **dict_file** from
+            :func:`~src.ch03.p1_digram_index.load_digram_index` instead.
+            Defaults to :py:obj:`None`.
 
     Returns:
         :py:class:`~collections.Counter` with digrams as keys and their
         counts as values.
 
+    Note:
+        The digram table of **dict_file** is only made again if
+        **dict_file** changes, so counting the digrams of many words only
+        reads it once.
+
     """
-    return count_digrams(get_digrams(word), read_from_file(dict_file))
+    digrams = get_digrams(word)
+    # The digram index only has lowercase digrams.
+    if cache_dir is not None and set(word).issubset(ascii_lowercase):
+        with load_digram_index(dict_file, cache_dir) as digram_index:
+            return lookup_digrams(digrams, digram_index)
+    stat = os.stat(dict_file)
+    digram_table = _read_digram_table(os.path.abspath(dict_file),
+                                      stat.st_size, stat.st_mtime_ns)
+    return lookup_digrams(digrams, digram_table)
+
+
+@lru_cache(maxsize=8)
+def _read_digram_table(dict_file: str, size: int, mtime: int) -> dict:
+    """Get digram table of dict_file with size and mtime."""
+    # pylint: disable=unused-argument
+    # Size and mtime are only part of the cache key.
+    return get_digram_table(iter_words(dict_file))
 
 
 def main():
@@ -0,0 +1,339 @@
+"""Save digram counts of word dictionaries to disk.
+
+Store how many words of a word dictionary file have each of the 26 × 26
+lowercase digrams in a compact binary index file, so short-lived processes
+can share one copy of it with :py:mod:`mmap` instead of reading the word
+dictionary file again.
+
+Each index file starts with a header of :py:const:`INDEX_MAGIC`,
+:py:const:`INDEX_VERSION`, the fingerprint of the word dictionary file from
+:func:`~src.ch03.p1_cache_files.get_fingerprint`, and whether it has
+positional counts. After that are the little-endian unsigned 32-bit counts
+of each digram in the order of :func:`get_digram_number`. If it has
+positional counts, the counts of words that start with each digram and of
+words that end with each digram follow in the same order.
+
+Attributes:
+    INDEX_MAGIC (bytes): Bytes that every index file starts with.
+    INDEX_VERSION (int): Version of the index file format.
+    DIGRAMS (int): Number of lowercase digrams in an index file.
+    INDEX_EXTENSION (str): File extension of index files from
+        :func:`~src.ch03.p1_cache_files.get_cache_path`.
+
+"""
+import mmap
+import struct
+from array import array
+from collections.abc import Mapping
+from itertools import product
+from string import ascii_lowercase
+from src.ch02.p1_cleanup_dictionary import iter_words
+from src.ch03 import CACHE_DIR, READ_DIGRAM_INDEX_ERROR, \
+    STALE_DIGRAM_INDEX_ERROR, DIGRAM_POSITIONS_ERROR
+from src.ch03.p1_cache_files import get_cache_path, is_fresh, \
+    load_cache_file, write_cache_file
+
+INDEX_MAGIC = b'IPPD'
+INDEX_VERSION = 1
+DIGRAMS = 26 * 26
+INDEX_EXTENSION = 'digrams'
+
+# Magic, version, file size, file modification time, file SHA-256 hash, and
+# whether it has positional counts. Multiple of 4 bytes, so counts line up.
+_HEADER = struct.Struct('<4sHQq32sH')
+_COUNT = struct.Struct('<I')
+
+
+def get_digram_number(digram: str) -> int:
+    """Get number of digram.
+
+    Args:
+        digram (str): Two lowercase letters.
+
+    Returns:
+        :py:obj:`int` from ``0`` for ``aa`` to ``675`` for ``zz``.
+
+    Raises:
+        KeyError: If **digram** isn't two lowercase letters.
+
+    Example:
+        >>> from src.ch03.p1_digram_index import get_digram_number
+        >>> get_digram_number('ab')
+        1
+
+    """
+    if len(digram) != 2 or not all(letter in ascii_lowercase
+                                   for letter in digram):
+        raise KeyError(digram)
+    first, second = digram
+    return (ord(first) - ord('a')) * 26 + ord(second) - ord('a')
+
+
+def get_digram_counts(dict_list, positions: bool = False) -> array:
+    """Get digram counts of word dictionary.
+
+    Count how many words in a word dictionary list have each lowercase
+    digram in one pass over the list.
+
+    Args:
+        dict_list: Word dictionary list, or any iterable of words, like
+            :func:`~src.ch02.p1_cleanup_dictionary.iter_words`.
+        positions (bool): Whether to also count the words that start and end
+            with each digram. Defaults to :py:obj:`False`.
+
+    Returns:
+        :py:class:`~array.array` of unsigned 32-bit counts of each digram in
+        the order of :func:`get_digram_number`. If **positions**, followed
+        by the counts of words that start with each digram, then the counts
+        of words that end with each digram.
+
+    """
+    counts = array('I', bytes(4 * DIGRAMS * (3 if positions else 1)))
+    # Skip the digrams with letters that aren't lowercase.
+    numbers = {''.join(digram): number for number, digram in
+               enumerate(product(ascii_lowercase, repeat=2))}
+    for word in dict_list:
+        # Use a set, so each word is only counted once per digram.
+        for digram in {word[i:i + 2] for i in range(len(word) - 1)}:
+            if digram in numbers:
+                counts[numbers[digram]] += 1
+        if positions and len(word) > 1:
+            if word[:2] in numbers:
+                counts[DIGRAMS + numbers[word[:2]]] += 1
+            if word[-2:] in numbers:
+                counts[2 * DIGRAMS + numbers[word[-2:]]] += 1
+    return counts
+
+
+def write_digram_index(dict_list, index_file: str, fingerprint: tuple,
+                       positions: bool = False) -> None:
+    """Write digram counts to index file.
+
+    Args:
+        dict_list: Word dictionary list, or any iterable of words, to count
+            digrams of.
+        index_file (str): Path to index file to write.
+        fingerprint (tuple): Fingerprint from
+            :func:`~src.ch03.p1_cache_files.get_fingerprint` of the word
+            dictionary file **dict_list** was read from.
+        positions (bool): Whether to also write positional counts. Defaults
+            to :py:obj:`False`.
+
+    Returns:
+        :py:obj:`None`. The digram counts of **dict_list** are written to
+        **index_file** with
+        :func:`~src.ch03.p1_cache_files.write_cache_file`.
+
+    """
+    write_cache_file(_pack_digram_index(dict_list, fingerprint, positions),
+                     index_file)
+
+
+def _pack_digram_index(dict_list, fingerprint: tuple,
+                       positions: bool) -> bytes:
+    """Pack header and digram counts of dict_list like an index file."""
+    counts = get_digram_counts(dict_list, positions)
+    if struct.pack('=I', 1) != _COUNT.pack(1):
+        # Big-endian, so swap to little-endian.
+        counts.byteswap()
+    return _HEADER.pack(INDEX_MAGIC, INDEX_VERSION, *fingerprint,
+                        positions) + counts.tobytes()
+
+
+class DigramIndex(Mapping):
+    """Memory-mapped digram index file.
+
+    Read-only mapping with each lowercase digram as keys and the number of
+    words that have it as values. Counts are read from the memory-mapped
+    index file when looked up, so processes that open the same index file
+    share one copy of it.
+
+    Args:
+        index_file (str): Path to index file from
+            :func:`write_digram_index`.
+        dict_file (str): Path to word dictionary file **index_file** was
+            written from. Defaults to :py:obj:`None` to not check if it has
+            changed.
+
+    Raises:
+        ValueError: If **index_file** isn't an index file or if
+            **dict_file** has changed since **index_file** was written.
+
+    Example:
+        >>> from src.ch03.p1_digram_index import load_digram_index
+        >>> path = 'tests/data/ch02/dictionary.txt'
+        >>> with load_digram_index(path) as index:
+        ...     print(index['ra'])
+        4
+
+    """
+
+    def __init__(self, index_file: str, dict_file: str = None):
+        """Initialize class."""
+        with open(index_file, 'rb') as file:
+            try:
+                self._mmap = mmap.mmap(file.fileno(), 0,
+                                       access=mmap.ACCESS_READ)
+            except ValueError as err:
+                # Empty file.
+                raise ValueError(READ_DIGRAM_INDEX_ERROR) from err
+        try:
+            self._positions = self._read_header(dict_file)
+        except ValueError:
+            self._mmap.close()
+            raise
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> 'DigramIndex':
+        """Make digram index in memory.
+
+        Args:
+            data (bytes): Contents of an index file from
+                :func:`write_digram_index`.
+
+        Returns:
+            :py:class:`DigramIndex` of **data** in an anonymous memory map
+            instead of an index file. Close it when done.
+
+        Raises:
+            ValueError: If **data** isn't an index file.
+
+        """
+        index = cls.__new__(cls)
+        index._mmap = mmap.mmap(-1, max(len(data), 1))
+        index._mmap.write(data)
+        try:
+            if len(data) < len(index._mmap):
+                # Anonymous memory maps can't be empty.
+                raise ValueError(READ_DIGRAM_INDEX_ERROR)
+            index._positions = index._read_header(None)
+        except ValueError:
+            index._mmap.close()
+            raise
+        return index
+
+    def _read_header(self, dict_file: str) -> bool:
+        """Check header and get whether it has positional counts."""
+        if len(self._mmap) < _HEADER.size:
+            raise ValueError(READ_DIGRAM_INDEX_ERROR)
+        magic, version, *fingerprint, positions = \
+            _HEADER.unpack_from(self._mmap)
+        size = _HEADER.size + _COUNT.size * DIGRAMS * (3 if positions else 1)
+        if any([magic != INDEX_MAGIC, version != INDEX_VERSION,
+                len(self._mmap) != size]):
+            raise ValueError(READ_DIGRAM_INDEX_ERROR)
+        if dict_file is not None and not is_fresh(dict_file, fingerprint):
+            raise ValueError(STALE_DIGRAM_INDEX_ERROR)
+        return bool(positions)
+
+    def __getitem__(self, digram: str) -> int:
+        """Get number of words with digram."""
+        return self._get_count(0, digram)
+
+    def __iter__(self):
+        """Iterate over digrams."""
+        return (''.join(digram)
+                for digram in product(ascii_lowercase, repeat=2))
+
+    def __len__(self) -> int:
+        """Get number of digrams."""
+        return DIGRAMS
+
+    def __enter__(self):
+        """Enter context."""
+        return self
+
+    def __exit__(self, *args):
+        """Close on exit."""
+        self.close()
+
+    @property
+    def positions(self) -> bool:
+        """bool: Whether it has positional counts."""
+        return self._positions
+
+    def starts(self, digram: str) -> int:
+        """Get number of words that start with digram.
+
+        Args:
+            digram (str): Two lowercase letters.
+
+        Returns:
+            :py:obj:`int` number of words that start with **digram**.
+
+        Raises:
+            ValueError: If it doesn't have positional counts.
+
+        """
+        return self._get_count(1, digram)
+
+    def ends(self, digram: str) -> int:
+        """Get number of words that end with digram.
+
+        Args:
+            digram (str): Two lowercase letters.
+
+        Returns:
+            :py:obj:`int` number of words that end with **digram**.
+
+        Raises:
+            ValueError: If it doesn't have positional counts.
+
+        """
+        return self._get_count(2, digram)
+
+    def close(self) -> None:
+        """Close index file."""
+        self._mmap.close()
+
+    def _get_count(self, table: int, digram: str) -> int:
+        """Get count of digram in table of counts."""
+        if table and not self._positions:
+            raise ValueError(DIGRAM_POSITIONS_ERROR)
+        number = table * DIGRAMS + get_digram_number(digram)
+        return _COUNT.unpack_from(
+            self._mmap, _HEADER.size + _COUNT.size * number)[0]
+
+
+def load_digram_index(dict_file: str, cache_dir: str = None,
+                      positions: bool = False) -> DigramIndex:
+    """Load digram index of word dictionary file.
+
+    Open the index file of **dict_file** in **cache_dir** with
+    :func:`~src.ch03.p1_cache_files.load_cache_file`. If missing, stale, or
+    without positional counts when **positions**, count the digrams of
+    **dict_file** again and write its index file.
+
+    Args:
+        dict_file (str): Path to word dictionary file.
+        cache_dir (str): Path to folder with index files. Defaults to
+            :py:const:`~src.ch03.CACHE_DIR`.
+        positions (bool): Whether it needs positional counts. Defaults to
+            :py:obj:`False`.
+
+    Returns:
+        :py:class:`DigramIndex` of **dict_file**. Close it when done. If the
+        digrams were counted again, it is made in memory with
+        :meth:`DigramIndex.from_bytes`, so it works even if the index file
+        can't be written, like in a read-only **cache_dir**.
+
+    """
+    if cache_dir is None:
+        cache_dir = CACHE_DIR
+
+    def read(index_file: str, dict_file: str) -> DigramIndex:
+        """Open index file if it has the counts needed."""
+        index = DigramIndex(index_file, dict_file)
+        if positions and not index.positions:
+            index.close()
+            raise ValueError(DIGRAM_POSITIONS_ERROR)
+        return index
+
+    def build(fingerprint: tuple) -> tuple:
+        """Count digrams of dict_file like an index file."""
+        data = _pack_digram_index(iter_words(dict_file), fingerprint,
+                                  positions)
+        return DigramIndex.from_bytes(data), data
+
+    index_file = get_cache_path(dict_file, cache_dir, INDEX_EXTENSION)
+    return load_cache_file(dict_file, index_file, read, build)
@@ -0,0 +1,87 @@
+"""Count digrams of word dictionaries with NumPy.
+
+Instead of slicing each word of a word dictionary list in Python, encode the
+whole list once as a padded matrix with a row of character codes for each
+word. Each digram of every word is then one column of the matrix next to the
+column after it, so :py:mod:`numpy` can number every digram at once and
+count them with :py:func:`numpy.bincount`.
+
+"""
+from collections import Counter
+import numpy as np
+
+
+def get_char_matrix(dict_list: list) -> tuple:
+    """Get character matrix of word dictionary.
+
+    Args:
+        dict_list (list): Word dictionary list.
+
+    Returns:
+        :py:obj:`tuple` with a :py:class:`numpy.ndarray` with a row for each
+        word of **dict_list** and a :py:class:`numpy.ndarray` of the
+        sorted code points of the characters in **dict_list**. Each row has
+        the code of each character of its word, where the code of a
+        character is its index in the code points plus one, padded with
+        ``0`` to the length of the longest word. Codes are
+        :py:class:`numpy.uint8` if there are less than 255 characters.
+
+    Example:
+        >>> from src.ch03.p1_digram_vectors import get_char_matrix
+        >>> matrix, chars = get_char_matrix(['tom', 'moon'])
+        >>> matrix.tolist()
+        [[4, 3, 1, 0], [1, 3, 3, 2]]
+        >>> ''.join(map(chr, chars))
+        'mnot'
+
+    """
+    lengths = np.fromiter(map(len, dict_list), dtype=np.intp,
+                          count=len(dict_list))
+    # UTF-32 has one code point per character.
+    text = np.frombuffer(''.join(dict_list).encode('utf-32-le'),
+                         dtype=np.uint32)
+    chars, codes = np.unique(text, return_inverse=True)
+    dtype = np.uint8 if len(chars) < 255 else np.uint32
+    matrix = np.zeros((len(dict_list), lengths.max(initial=0)), dtype=dtype)
+    # Fill each row up to the length of its word.
+    matrix[np.arange(matrix.shape[1]) < lengths[:, None]] = codes + 1
+    return matrix, chars
+
+
+def get_digram_table(dict_list: list) -> dict:
+    """Get digram table of word dictionary with NumPy.
+
+    Same as :func:`~src.ch03.p1_digram_counter.get_digram_table`, but
+    counts the digrams of every word at once with the matrix from
+    :func:`get_char_matrix`.
+
+    Args:
+        dict_list (list): Word dictionary list.
+
+    Returns:
+        :py:class:`~collections.Counter` with every digram in
+        **dict_list** as keys and the number of words that have it as
+        values.
+
+    """
+    matrix, chars = get_char_matrix(dict_list)
+    size = len(chars) + 1
+    dtype = np.int32 if size * size < 2 ** 31 else np.int64
+    # Number each digram by the codes of its first and second characters.
+    firsts, seconds = matrix[:, :-1], matrix[:, 1:]
+    numbers = firsts.astype(dtype) * size + seconds
+    # Padding has code 0, so digrams that end in padding become 0 too.
+    numbers[seconds == 0] = 0
+    # Sort each row, so repeats of a digram in a word are next to each
+    # other, and only count the first one.
+    numbers.sort(axis=1)
+    firsts = np.ones(numbers.shape, dtype=bool)
+    firsts[:, 1:] = numbers[:, 1:] != numbers[:, :-1]
+    counts = np.bincount(numbers[firsts & (numbers != 0)],
+                         minlength=size * size)
+    digram_table = Counter()
+    for number in np.flatnonzero(counts):
+        first, second = divmod(int(number), size)
+        digram = chr(chars[first - 1]) + chr(chars[second - 1])
+        digram_table[digram] = int(counts[number])
+    return digram_table
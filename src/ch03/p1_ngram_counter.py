@@ -0,0 +1,238 @@
+"""Count n-grams of word dictionaries.
+
+Like :mod:`~src.ch03.p1_digram_counter`, but for n-grams of any length up to
+:py:const:`MAX_NGRAM_LENGTH`, such as trigrams and quadgrams. Instead of a
+:py:class:`~collections.Counter` with a string for each n-gram, each n-gram
+of lowercase letters is packed into an :py:obj:`int` in base 26 by
+:func:`pack_ngram`, and its counts are stored at that index of an
+:py:class:`~array.array`.
+
+Attributes:
+    MAX_NGRAM_LENGTH (int): Longest n-gram that can be counted.
+
+"""
+import math
+from array import array
+from string import ascii_lowercase
+from src.ch03 import NGRAM_LENGTH_ERROR, NGRAM_ERROR
+
+MAX_NGRAM_LENGTH = 4
+
+# Letter value of each lowercase letter.
+_LETTERS = {letter: value for value, letter in enumerate(ascii_lowercase)}
+
+
+def pack_ngram(ngram: str) -> int:
+    """Pack n-gram into integer.
+
+    Args:
+        ngram (str): Lowercase letters.
+
+    Returns:
+        :py:obj:`int` with the letters of **ngram** as the digits of a base
+        26 number, where ``a`` is ``0`` and ``z`` is ``25``.
+
+    Raises:
+        KeyError: If **ngram** has anything other than lowercase letters.
+
+    Example:
+        >>> from src.ch03.p1_ngram_counter import pack_ngram
+        >>> pack_ngram('the')
+        13030
+
+    """
+    number = 0
+    for letter in ngram:
+        number = number * 26 + _LETTERS[letter]
+    return number
+
+
+def unpack_ngram(number: int, length: int) -> str:
+    """Unpack n-gram from integer.
+
+    Args:
+        number (int): Number from :func:`pack_ngram`.
+        length (int): Length of the n-gram.
+
+    Returns:
+        :py:obj:`str` with the n-gram that **number** was packed from.
+
+    Example:
+        >>> from src.ch03.p1_ngram_counter import unpack_ngram
+        >>> unpack_ngram(13030, 3)
+        'the'
+
+    """
+    letters = []
+    for _ in range(length):
+        number, value = divmod(number, 26)
+        letters.append(ascii_lowercase[value])
+    return ''.join(reversed(letters))
+
+
+class NgramCounter:
+    """Document and occurrence counts of n-grams.
+
+    Count how many words have each n-gram of lowercase letters and how many
+    times each appears in all words, in one pass over any iterable of
+    words. N-grams with anything other than lowercase letters are skipped.
+
+    Args:
+        length (int): Length of n-grams to count. Defaults to ``3`` for
+            trigrams.
+        words: Iterable of :py:obj:`str` words to count n-grams of first.
+            Defaults to :py:obj:`None`.
+
+    Raises:
+        ValueError: If **length** isn't from ``1`` to
+            :py:const:`MAX_NGRAM_LENGTH`.
+
+    Example:
+        >>> from src.ch03.p1_ngram_counter import NgramCounter
+        >>> counter = NgramCounter(3, ['banana', 'bandana'])
+        >>> counter.documents('ana'), counter.occurrences('ana')
+        (2, 3)
+
+    """
+
+    def __init__(self, length: int = 3, words=None):
+        """Initialize class."""
+        if not 1 <= length <= MAX_NGRAM_LENGTH:
+            raise ValueError(NGRAM_LENGTH_ERROR)
+        self._length = length
+        size = 26 ** length
+        self._documents = array('I', bytes(4 * size))
+        self._occurrences = array('I', bytes(4 * size))
+        self._total = 0
+        if words is not None:
+            self.update(words)
+
+    @property
+    def length(self) -> int:
+        """int: Length of n-grams counted."""
+        return self._length
+
+    @property
+    def total(self) -> int:
+        """int: Number of n-grams counted in all words."""
+        return self._total
+
+    def update(self, words) -> None:
+        """Count n-grams of words.
+
+        Args:
+            words: Iterable of :py:obj:`str` words. Each word is only read
+                once, so it can be a generator or an open file.
+
+        Returns:
+            :py:obj:`None`. Counts of each n-gram in **words** are added.
+
+        """
+        length, size = self._length, 26 ** self._length
+        documents, occurrences = self._documents, self._occurrences
+        letters, total = _LETTERS, 0
+        for word in words:
+            numbers = set()
+            # Number of the last letters in word, and how many in a row.
+            number, run = 0, 0
+            for letter in word:
+                value = letters.get(letter)
+                if value is None:
+                    run = 0
+                    continue
+                # Shift in the new letter and drop the oldest.
+                number = (number * 26 + value) % size
+                run += 1
+                if run >= length:
+                    occurrences[number] += 1
+                    numbers.add(number)
+                    total += 1
+            for number in numbers:
+                documents[number] += 1
+        self._total += total
+
+    def documents(self, ngram: str) -> int:
+        """Get number of words with n-gram.
+
+        Args:
+            ngram (str): Lowercase n-gram of :attr:`length` letters.
+
+        Returns:
+            :py:obj:`int` number of words counted that have **ngram**.
+
+        Raises:
+            ValueError: If **ngram** isn't :attr:`length` lowercase
+                letters.
+
+        """
+        return self._documents[self._pack(ngram)]
+
+    def occurrences(self, ngram: str) -> int:
+        """Get number of times n-gram appears.
+
+        Args:
+            ngram (str): Lowercase n-gram of :attr:`length` letters.
+
+        Returns:
+            :py:obj:`int` number of times **ngram** appears in all words
+            counted.
+
+        Raises:
+            ValueError: If **ngram** isn't :attr:`length` lowercase
+                letters.
+
+        """
+        return self._occurrences[self._pack(ngram)]
+
+    def _pack(self, ngram: str) -> int:
+        """Pack n-gram, checking it has length lowercase letters."""
+        # Shorter or longer n-grams would pack to some other n-gram.
+        if len(ngram) != self._length:
+            raise ValueError(NGRAM_ERROR)
+        try:
+            return pack_ngram(ngram)
+        except KeyError as err:
+            raise ValueError(NGRAM_ERROR) from err
+
+    def most_common(self, number: int = None) -> list:
+        """Get most common n-grams.
+
+        Args:
+            number (int): Number of n-grams to get. Defaults to
+                :py:obj:`None` for every n-gram counted.
+
+        Returns:
+            :py:obj:`list` of :py:obj:`tuple` with each n-gram and the
+            number of times it appears, from most to least common.
+
+        """
+        counted = [(count, -index)
+                   for index, count in enumerate(self._occurrences) if count]
+        counted.sort(reverse=True)
+        return [(unpack_ngram(-index, self._length), count)
+                for count, index in counted[:number]]
+
+    def fitness(self, text: str) -> float:
+        """Score how much text is like the words counted.
+
+        Add up the base 10 logarithm of the probability of each n-gram of
+        **text**, so text made of common n-grams scores higher.
+
+        Args:
+            text (str): Lowercase text to score. Anything other than
+                lowercase letters is skipped.
+
+        Returns:
+            :py:obj:`float` score of **text**. N-grams that were never
+            counted score like they appeared ``0.01`` times.
+
+        """
+        total = max(self._total, 1)
+        floor = math.log10(0.01 / total)
+        letters = [letter for letter in text if letter in _LETTERS]
+        score = 0.0
+        for i in range(len(letters) - self._length + 1):
+            count = self._occurrences[
+                pack_ngram(letters[i:i + self._length])]
+            score += math.log10(count / total) if count else floor
+        return score
@@ -1 +1,23 @@
-"""Chapter 4."""
+"""Chapter 4.
+
+Attributes:
+    TOP_K_ERROR (str): String with :py:exc:`ValueError` for Crack Route
+        :func:`~practice.p6_crack_route.crack_route` and Search Route
+        :func:`~practice.p7_search_route.search_route`.
+
+    COLUMNS_ERROR (str): String with :py:exc:`ValueError` for Search Route
+        :func:`~practice.p7_search_route.search_route`.
+
+    BEAM_WIDTH_ERROR (str): String with :py:exc:`ValueError` for Search
+        Route :func:`~practice.p7_search_route.search_route`.
+
+    BACKEND_ERROR (str): String with :py:exc:`ValueError` for Route Decoder
+        :func:`~practice.p8_route_decoder.decode_batch`.
+
+"""
+
+# Constants
+TOP_K_ERROR = 'top_k must be at least 1.'
+COLUMNS_ERROR = 'Number of words must be a multiple of columns.'
+BEAM_WIDTH_ERROR = 'beam_width must be at least 1.'
+BACKEND_ERROR = 'Backend must be python or numpy.'
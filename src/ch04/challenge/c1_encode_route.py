@@ -1,7 +1,8 @@
 """Encode a route cipher and replace code words."""
 from string import punctuation
 from random import choice
-from src.ch02.p1_cleanup_dictionary import cleanup_dict, DICTIONARY_FILE_PATH
+from src.ch02 import DICTIONARY_FILE_PATH
+from src.ch02.p1_word_registry import get_words
 from src.ch04.practice.p1_hack_lincoln import get_factors, split
 
 
@@ -68,14 +69,14 @@ def fill_dummy(plainlist: list, factors: list,
             **plainlist**.
         dummy_words (list): List of dummy words to use as filler. If not
             provided, defaults to :const:`~src.ch02.DICTIONARY_FILE_PATH`
-            using :func:`~src.ch02.p1_cleanup_dictionary.cleanup_dict`.
+            using :func:`~src.ch02.p1_word_registry.get_words`.
 
     Returns:
         Same list as **plainlist**, but with dummy words added.
 
     """
     if dummy_words is None:
-        dummy_words = cleanup_dict(DICTIONARY_FILE_PATH)
+        dummy_words = get_words(DICTIONARY_FILE_PATH)
     for factor in factors:
         while factor not in get_factors(len(plainlist)):
             plainlist.append(choice(dummy_words).lower())
@@ -1,6 +1,7 @@
 """Hack route cipher sent by Abraham Lincoln."""
-from itertools import combinations
+from itertools import chain
 from src.ch03.c1_anagram_generator import split
+from src.ch04.practice.p4_generate_keys import iter_keys, map_keys
 
 
 def get_factors(integer: int) -> list:
@@ -43,14 +44,8 @@ def keygen(length: int) -> list:
         [[-1, -2], [-1, 2], [1, -2], [1, 2]]
 
     """
-    result = []
-    master_key = range(1, length + 1)
-    # Get all possible combinations of direction (pos/neg) of length
-    combs = set(combinations([-1, 1] * length, length))  # Remove repeats
-    for comb in combs:
-        result.append([sign * key for sign, key in zip(comb, master_key)])
-    result.sort()  # Sort for test consistency.
-    return result
+    # Already in sorted order for test consistency.
+    return [list(key) for key in iter_keys(length)]
 
 
 def decode_route(keys: list, cipherlist: list) -> list:
@@ -86,34 +81,56 @@ def decode_route(keys: list, cipherlist: list) -> list:
     return message
 
 
-def hack_route(ciphertext: str) -> None:
+def hack_route(ciphertext: str, workers: int = None) -> None:
     """Hack route cipher.
 
     Hack route cipher by using :func:`get_factors` to find all possible key
-    lengths. Then use :func:`keygen` to generate all possible keys and pass
-    each one through :func:`decode_route`.
+    lengths. Then use :func:`~src.ch04.practice.p4_generate_keys.iter_keys`
+    to generate all possible keys, like :func:`keygen`, and pass each one
+    through :func:`decode_route`.
 
     Args:
         ciphertext (str): Message encoded with route cipher.
+        workers (int): Number of processes to decode with using
+            :func:`~src.ch04.practice.p4_generate_keys.map_keys`. Defaults
+            to :py:obj:`None` to decode in this process.
 
     Returns:
         None. Prints all possible decoded messages.
 
+    Note:
+        With **workers**, each process decodes ranges of keys, and decoded
+        messages are printed in the same order as in this process.
+
     """
     cipherlist = ciphertext.split()
     # Get all possible key lengths.
     factors = get_factors(len(cipherlist))
-    for factor in factors:
-        # Get all possible keys.
-        if any([factor == 1, factor == len(cipherlist)]):
-            # Key length of 1 is the full cipherlist and key length of
-            # cipherlist length is one word per column.
-            continue
-        keys = keygen(factor)
-        for key in keys:
-            # Use each key to decode route cipher.
-            message = ' '.join(decode_route(key, cipherlist))
-            print(f'Key: {key}\nDecoded message: {message}\n')
+    # Key length of 1 is the full cipherlist and key length of cipherlist
+    # length is one word per column.
+    factors = [factor for factor in factors
+               if factor not in (1, len(cipherlist))]
+    # Decode lazily in this process, or all of each range in a process.
+    task = _iter_decoded if workers is None else _decode_task
+    decoded = chain.from_iterable(map_keys(task, factors, cipherlist,
+                                           workers=workers))
+    for key, message in decoded:
+        print(f'Key: {key}\nDecoded message: {message}\n')
+
+
+def _iter_decoded(cipherlist: list, length: int, permute: bool, start: int,
+                  stop: int):
+    """Decode cipherlist with each key of length from start to stop."""
+    for key in iter_keys(length, permute, start, stop):
+        # Use each key to decode route cipher.
+        key = list(key)
+        yield key, ' '.join(decode_route(key, cipherlist))
+
+
+def _decode_task(cipherlist: list, length: int, permute: bool, start: int,
+                 stop: int) -> list:
+    """Decode cipherlist with a range of keys in a process."""
+    return list(_iter_decoded(cipherlist, length, permute, start, stop))
 
 
 def main():
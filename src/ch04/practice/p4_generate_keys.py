@@ -3,8 +3,188 @@
 Already implemented with :func:`~src.ch04.practice.p1_hack_lincoln.keygen`,
 but this version will return a list of tuples.
 
+Keys can also be made one at a time with :func:`iter_keys`, so only the
+current key is ever held in memory, and split into ranges with
+:func:`split_keys` to share between processes with :func:`map_keys`.
+
+Attributes:
+    TASKS_PER_WORKER (int): Number of ranges of keys to split keys into for
+        each process.
+
 """
-from itertools import combinations
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice, permutations, product
+from math import factorial
+
+TASKS_PER_WORKER = 8
+
+
+def count_keys(length: int, permute: bool = False) -> int:
+    """Count all possible route cipher keys.
+
+    Args:
+        length (int): Length of route cipher key.
+        permute (bool): Whether to also count every order of the columns.
+            Defaults to :py:obj:`False`.
+
+    Returns:
+        :py:obj:`int` number of keys :func:`iter_keys` yields.
+
+    """
+    count = 2 ** length
+    if permute:
+        count *= factorial(length)
+    return count
+
+
+def iter_keys(length: int, permute: bool = False, start: int = 0,
+              stop: int = None):
+    """Iterate over all possible route cipher keys.
+
+    Make each key of **length** from its pattern of signs, instead of
+    removing repeats from every combination of signs.
+
+    Args:
+        length (int): Length of route cipher key.
+        permute (bool): Whether to also try every order of the columns, for
+            when the order the columns were read in isn't known. Defaults
+            to :py:obj:`False` for columns in order.
+        start (int): Number of the first key to yield. Defaults to ``0``.
+        stop (int): Number of the key to stop before. Defaults to
+            :py:obj:`None` for every key after **start**.
+
+    Yields:
+        :py:obj:`tuple` of integers representing the next route cipher key
+        of **length**, in sorted order for each order of the columns.
+
+    Example:
+        >>> from src.ch04.practice.p4_generate_keys import iter_keys
+        >>> list(iter_keys(2))
+        [(-1, -2), (-1, 2), (1, -2), (1, 2)]
+        >>> len(list(iter_keys(3, permute=True)))
+        48
+        >>> list(iter_keys(2, start=1, stop=3))
+        [(-1, 2), (1, -2)]
+
+    """
+    for order, sign_start, sign_stop in iter_orders(length, permute, start,
+                                                    stop):
+        # Negative signs first, so keys are in sorted order.
+        signs = islice(product((-1, 1), repeat=length), sign_start,
+                       sign_stop)
+        for sign in signs:
+            yield tuple(key_sign * key for key_sign, key in zip(sign, order))
+
+
+def iter_orders(length: int, permute: bool = False, start: int = 0,
+                stop: int = None):
+    """Iterate over column orders of a range of route cipher keys.
+
+    Each column order has a key for each pattern of signs, so a range of
+    keys of :func:`iter_keys` is the sign patterns of one or more column
+    orders.
+
+    Args:
+        length (int): Length of route cipher key.
+        permute (bool): Whether to use every order of the columns. Defaults
+            to :py:obj:`False` for columns in order.
+        start (int): Number of the first key. Defaults to ``0``.
+        stop (int): Number of the key to stop before. Defaults to
+            :py:obj:`None` for every key after **start**.
+
+    Yields:
+        :py:obj:`tuple` with the next column order of the keys from
+        **start** to **stop**, and the start and stop of its sign patterns.
+
+    Example:
+        >>> from src.ch04.practice.p4_generate_keys import iter_orders
+        >>> list(iter_orders(2, permute=True, start=3, stop=6))
+        [((1, 2), 3, 4), ((2, 1), 0, 2)]
+
+    """
+    size = 2 ** length
+    count = count_keys(length, permute)
+    stop = count if stop is None else min(stop, count)
+    if start >= stop:
+        return
+    master_key = tuple(range(1, length + 1))
+    orders = permutations(master_key) if permute else [master_key]
+    # Skip to the column orders with keys from start to stop.
+    first, last = start // size, (stop - 1) // size
+    for number, order in enumerate(islice(orders, first, last + 1), first):
+        yield (order, max(start - number * size, 0),
+               min(stop - number * size, size))
+
+
+def split_keys(length: int, parts: int, permute: bool = False) -> list:
+    """Split all possible route cipher keys into ranges.
+
+    Args:
+        length (int): Length of route cipher key.
+        parts (int): Number of ranges to split keys into.
+        permute (bool): Whether to also split every order of the columns.
+            Defaults to :py:obj:`False`.
+
+    Returns:
+        :py:obj:`list` of :py:obj:`tuple` with the **start** and **stop**
+        of each range for :func:`iter_keys`, in order and without empty
+        ranges.
+
+    Example:
+        >>> from src.ch04.practice.p4_generate_keys import split_keys
+        >>> split_keys(3, 3)
+        [(0, 3), (3, 6), (6, 8)]
+
+    """
+    count = count_keys(length, permute)
+    step = -(-count // max(parts, 1))
+    return [(start, min(start + step, count))
+            for start in range(0, count, step)]
+
+
+def map_keys(function, lengths, *args, permute: bool = False,
+             workers: int = None):
+    """Map function over ranges of route cipher keys.
+
+    Call **function** with **args**, then the length, **permute**, start,
+    and stop of each range of keys, like the arguments of
+    :func:`iter_keys`.
+
+    Args:
+        function: Callable that takes **args** and a range of keys. Must be
+            picklable with **workers**.
+        lengths: Iterable of lengths of route cipher keys.
+        args: Arguments to call **function** with before each range.
+        permute (bool): Whether to also use every order of the columns.
+            Defaults to :py:obj:`False`.
+        workers (int): Number of processes to call **function** in using
+            :py:class:`~concurrent.futures.ProcessPoolExecutor`. Defaults to
+            :py:obj:`None` to call it once for all keys of each length in
+            this process.
+
+    Yields:
+        Result of **function** for each range of keys, in order of
+        **lengths**, then in order of keys.
+
+    Note:
+        With **workers**, the keys of each length are split into about
+        :py:const:`TASKS_PER_WORKER` ranges per process with
+        :func:`split_keys`.
+
+    """
+    if workers is None:
+        for length in lengths:
+            yield function(*args, length, permute, 0,
+                           count_keys(length, permute))
+        return
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(function, *args, length, permute, start,
+                                   stop)
+                   for length in lengths for start, stop in
+                   split_keys(length, workers * TASKS_PER_WORKER, permute)]
+        # Wait for tasks in order to keep results in order.
+        for future in futures:
+            yield future.result()
 
 
 def generate_keys(length: int) -> list:
@@ -17,16 +197,10 @@ def generate_keys(length: int) -> list:
 
     Returns:
         List of tuples of integers representing all possible route cipher
-        keys of **length**.
+        keys of **length** from :func:`iter_keys`.
 
     """
-    result = []
-    master_key = range(1, length + 1)
-    # Get all possible combinations of direction (pos/neg) of length
-    combs = set(combinations([-1, 1] * length, length))  # Remove repeats
-    for comb in combs:
-        result.append(tuple(sign * key for sign, key in zip(comb, master_key)))
-    return result
+    return list(iter_keys(length))
 
 
 def main():
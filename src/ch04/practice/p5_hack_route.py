@@ -7,10 +7,11 @@ version will use the building blocks made in
 :py:mod:`~src.ch04.practice.p4_generate_keys`.
 
 """
+from itertools import chain
 from src.ch03.c1_anagram_generator import split
 from src.ch04.practice.p2_identify_cipher import is_substitution
 from src.ch04.practice.p3_get_keys import key_to_dict
-from src.ch04.practice.p4_generate_keys import generate_keys
+from src.ch04.practice.p4_generate_keys import iter_keys, map_keys
 
 
 def decode_route(keys: dict, cipherlist: list) -> list:
@@ -45,7 +46,8 @@ def decode_route(keys: dict, cipherlist: list) -> list:
     return message
 
 
-def hack_route(ciphertext: str, columns: int) -> None:
+def hack_route(ciphertext: str, columns: int, permute: bool = False,
+               workers: int = None) -> None:
     """Hack route cipher using brute-force attack.
 
     Determine if **ciphertext** is a transposition cipher. If so, use
@@ -56,10 +58,20 @@ def hack_route(ciphertext: str, columns: int) -> None:
     Args:
         ciphertext (str): Route cipher encoded string to hack.
         columns (int): Number route cipher columns.
+        permute (bool): Whether to also try every order of the columns with
+            :func:`~src.ch04.practice.p4_generate_keys.iter_keys`. Defaults
+            to :py:obj:`False`.
+        workers (int): Number of processes to decode with using
+            :func:`~src.ch04.practice.p4_generate_keys.map_keys`. Defaults
+            to :py:obj:`None` to decode in this process.
 
     Returns:
         :py:obj:`None`. Prints all possible decoded messages.
 
+    Note:
+        With **workers**, each process decodes ranges of keys, and decoded
+        messages are printed in the same order as in this process.
+
     """
     if ciphertext.isupper():
         # Most functions assume lowercase, despite cryptographic convention.
@@ -67,15 +79,30 @@ def hack_route(ciphertext: str, columns: int) -> None:
     if is_substitution(ciphertext):
         print('Hey, bub, I can\'t help you with substitution ciphers.')
         return None
-    # Get all possible keys with given number of columns.
-    keys = generate_keys(columns)
-    # For each key, decode route cipher and print result.
-    for key in keys:
-        message = ' '.join(decode_route(key_to_dict(key), ciphertext.split()))
+    # For each possible key with given number of columns, decode route
+    # cipher and print result.
+    task = _iter_decoded if workers is None else _decode_task
+    decoded = chain.from_iterable(map_keys(
+        task, [columns], ciphertext.split(), permute=permute,
+        workers=workers))
+    for key, message in decoded:
         print(f'Key: {key}\nDecoded message: {message}\n')
     return None
 
 
+def _iter_decoded(cipherlist: list, columns: int, permute: bool, start: int,
+                  stop: int):
+    """Decode cipherlist with each key from start to stop."""
+    for key in iter_keys(columns, permute, start, stop):
+        yield key, ' '.join(decode_route(key_to_dict(key), cipherlist))
+
+
+def _decode_task(cipherlist: list, columns: int, permute: bool, start: int,
+                 stop: int) -> list:
+    """Decode cipherlist with a range of keys in a process."""
+    return list(_iter_decoded(cipherlist, columns, permute, start, stop))
+
+
 def main():
     """Demonstrate the route cipher hacker."""
     print('There\'s more than one way to hack a route cipher! I can also do a '
@@ -0,0 +1,200 @@
+"""Crack a route cipher by scoring each decoded message.
+
+Same keys as :func:`~src.ch04.practice.p1_hack_lincoln.hack_route`, but
+instead of printing every decoded message, score each one and only keep the
+best few in a bounded heap.
+
+A route cipher only moves words around, so every decoded message has the
+same words. Instead of checking which words are in a word dictionary, the
+letters of the whole message are scored with an n-gram model from
+:class:`~src.ch03.p1_ngram_counter.NgramCounter`, so n-grams across the
+ends of words tell good word orders from bad ones.
+"""
+import heapq
+import os
+from collections import namedtuple
+from functools import lru_cache
+from src.ch02 import DICTIONARY_FILE_PATH
+from src.ch02.p1_word_registry import get_words
+from src.ch03.p1_ngram_counter import NgramCounter
+from src.ch04 import TOP_K_ERROR
+from src.ch04.practice.p1_hack_lincoln import get_factors
+from src.ch04.practice.p4_generate_keys import map_keys
+from src.ch04.practice.p8_route_decoder import decode_keys
+
+RouteCandidate = namedtuple('RouteCandidate', ['score', 'key', 'message'])
+RouteCandidate.__doc__ = """Decoded route cipher message and its score.
+
+Args:
+    score (float): Score of **message**. Higher is better.
+    key (list): Signed, integer key that decodes **message**.
+    message (str): Decoded message.
+
+"""
+
+
+def get_ngram_counter(filepath: str = DICTIONARY_FILE_PATH,
+                      length: int = 3) -> NgramCounter:
+    """Get n-gram counts of word dictionary file.
+
+    Like :func:`~src.ch02.p1_word_registry.get_words`, the n-grams of each
+    word dictionary file are only counted once per process, and counted
+    again if the file changes.
+
+    Args:
+        filepath (str): String with path to word dictionary file. Defaults
+            to :py:const:`~src.ch02.DICTIONARY_FILE_PATH`.
+        length (int): Length of n-grams to count. Defaults to ``3``.
+
+    Returns:
+        :class:`~src.ch03.p1_ngram_counter.NgramCounter` of the words of
+        **filepath**. Shared by every caller, so don't change it.
+
+    """
+    stat = os.stat(filepath)
+    return _count_ngrams(os.path.abspath(filepath), length,
+                         (stat.st_size, stat.st_mtime_ns))
+
+
+@lru_cache(maxsize=8)
+def _count_ngrams(filepath: str, length: int, version: tuple) -> NgramCounter:
+    """Count n-grams of words of filepath at version of the file."""
+    # pylint: disable=unused-argument
+    # Version is only part of the cache key.
+    return NgramCounter(length, get_words(filepath))
+
+
+def make_ngram_scorer(words=None, length: int = 3):
+    """Make n-gram scorer.
+
+    Args:
+        words: Iterable of :py:obj:`str` words to count n-grams of. Defaults
+            to :py:obj:`None` for the words of
+            :py:const:`~src.ch02.DICTIONARY_FILE_PATH`.
+        length (int): Length of n-grams to count. Defaults to ``3``.
+
+    Returns:
+        :meth:`~src.ch03.p1_ngram_counter.NgramCounter.fitness` of the
+        n-grams of **words**, which scores lowercase text. Without
+        **words**, the n-grams are from :func:`get_ngram_counter`.
+
+    """
+    if words is None:
+        return get_ngram_counter(DICTIONARY_FILE_PATH, length).fitness
+    return NgramCounter(length, words).fitness
+
+
+def crack_route(ciphertext: str, top_k: int = 10, columns: int = None,
+                scorer=None, permute: bool = False,
+                workers: int = None) -> list:
+    """Crack route cipher.
+
+    Decode **ciphertext** with every key of every possible number of
+    columns from :func:`~src.ch04.practice.p1_hack_lincoln.get_factors`,
+    like :func:`~src.ch04.practice.p1_hack_lincoln.hack_route`, and score
+    each decoded message. Keys are decoded with
+    :func:`~src.ch04.practice.p8_route_decoder.decode_keys`.
+
+    Args:
+        ciphertext (str): Message encoded with route cipher.
+        top_k (int): Number of best decoded messages to keep. Defaults to
+            ``10``.
+        columns (int): Number of route cipher columns. Defaults to
+            :py:obj:`None` to try every number of columns.
+        scorer: Callable that scores lowercase text, where higher is
+            better. Defaults to :py:obj:`None` for :func:`make_ngram_scorer`
+            of :py:const:`~src.ch02.DICTIONARY_FILE_PATH`, which each
+            process gets from its own :func:`get_ngram_counter`.
+        permute (bool): Whether to also try every order of the columns,
+            like :func:`~src.ch04.practice.p5_hack_route.hack_route`.
+            Defaults to :py:obj:`False`.
+        workers (int): Number of processes to score with using
+            :py:class:`~concurrent.futures.ProcessPoolExecutor`. Defaults to
+            :py:obj:`None` to score in this process.
+
+    Returns:
+        :py:obj:`list` of up to **top_k** :py:class:`RouteCandidate` from
+        best to worst score. Keys tried first win ties.
+
+    Raises:
+        ValueError: If **top_k** is less than ``1`` or if the number of
+            words in **ciphertext** isn't a multiple of **columns**.
+
+    Note:
+        With **workers**, the keys of each number of columns are split into
+        ranges with :func:`~src.ch04.practice.p4_generate_keys.map_keys`.
+        Each process only sends back the best **top_k** of its range, so
+        **scorer** must be picklable, like :func:`make_ngram_scorer`. The
+        results are the same as in this process.
+
+    Example:
+        >>> from src.ch02.p1_word_registry import get_words
+        >>> import src.ch04.practice.p6_crack_route as crack
+        >>> words = get_words('tests/data/ch04/dictionary.txt')
+        >>> scorer = crack.make_ngram_scorer(words)
+        >>> ciphertext = 'message super be supposed this is to a secret stop'
+        >>> crack.crack_route(ciphertext, 1, scorer=scorer)[0].message
+        'this is supposed to be a super secret message stop'
+
+    """
+    # pylint: disable=too-many-arguments
+    # Each argument is an optional setting of the search.
+    if top_k < 1:
+        raise ValueError(TOP_K_ERROR)
+    cipherlist = ciphertext.split()
+    if columns is None:
+        # Key length of 1 is the full cipherlist and key length of
+        # cipherlist length is one word per column.
+        factors = [factor for factor in get_factors(len(cipherlist))
+                   if factor not in (1, len(cipherlist))]
+    else:
+        factors = [columns]
+    results = map_keys(_crack_task, factors, cipherlist, top_k, scorer,
+                       permute=permute, workers=workers)
+    # Merge the best of each task into the best of every key.
+    best = heapq.nlargest(top_k, (item for items in results
+                                  for item in items))
+    return [RouteCandidate(score, key, message)
+            for score, _, _, key, message in best]
+
+
+def _crack_task(cipherlist: list, top_k: int, scorer, length: int,
+                permute: bool, start: int, stop: int) -> list:
+    """Score decoded messages of a range of keys and keep the best."""
+    # pylint: disable=too-many-arguments
+    # Each task is sent to a process as one call.
+    if scorer is None:
+        # Counted once per process instead of sent with each task.
+        scorer = make_ngram_scorer()
+    # Min-heap of the best candidates, so the worst is replaced first.
+    heap = []
+    keys = decode_keys(length, cipherlist, permute, start, stop)
+    for number, (key, words) in enumerate(keys, start):
+        key, message = list(key), ' '.join(words)
+        # Factors are tried from fewest columns, so negative length and
+        # number make earlier keys better on ties in every process.
+        item = (scorer(message.lower()), -length, -number, key, message)
+        if len(heap) < top_k:
+            heapq.heappush(heap, item)
+        elif item > heap[0]:
+            heapq.heapreplace(heap, item)
+    return heap
+
+
+def main():
+    """Demonstrate the route cipher cracker."""
+    print('I can crack a route cipher sent by Abraham Lincoln, and I only '
+          'show you the\ndecoded messages that look the most like words.')
+    print('\nNote: I only crack the route cipher. I leave the '
+          'word-transposition\ncipher to you and your biochemical brain.\n')
+    ciphertext = """THIS OFF DETAINED ASCERTAIN WAYLAND CORRESPONDENTS OF AT
+    WHY AND IF FILLS IT YOU GET THEY NEPTUNE THE TRIBUNE PLEASE ARE THEM CAN
+    UP"""
+    print(f'Cracking: {ciphertext}\n')
+    for candidate in crack_route(ciphertext, 3):
+        print(f'Score: {candidate.score:.2f}\nKey: {candidate.key}\n'
+              f'Decoded message: {candidate.message}\n')
+
+
+if __name__ == '__main__':
+    main()
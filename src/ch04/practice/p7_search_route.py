@@ -0,0 +1,234 @@
+"""Search for the column order and routes of a route cipher.
+
+:func:`~src.ch04.practice.p5_hack_route.hack_route` can try every column
+order, but there are ``n! * 2 ** n`` keys with **n** columns. Instead,
+build each key one column at a time with branch and bound. Adding a column
+to a key adds a word to the end of each row of the decoded message, and
+only adds n-grams to its score from
+:meth:`~src.ch03.p1_ngram_counter.NgramCounter.fitness`. Since each n-gram
+scores at most ``0``, the score of a partial key is a bound on the score of
+every key it can become, so partial keys that can't beat the best keys
+found so far are skipped. For even more columns, a beam search only keeps
+the best partial keys of each length.
+"""
+import heapq
+from string import ascii_lowercase
+from src.ch02 import DICTIONARY_FILE_PATH
+from src.ch03.p1_ngram_counter import NgramCounter
+from src.ch04 import TOP_K_ERROR, COLUMNS_ERROR, BEAM_WIDTH_ERROR
+from src.ch04.practice.p6_crack_route import RouteCandidate, \
+    get_ngram_counter
+from src.ch04.practice.p8_route_decoder import decode_route
+
+# Allowance for rounding, since bounds are added up in a different order
+# than whole scores.
+_EPSILON = 1e-9
+
+
+def search_route(ciphertext: str, columns: int, top_k: int = 10,
+                 counter: NgramCounter = None,
+                 beam_width: int = 1000) -> list:
+    """Search for best route cipher keys in any column order.
+
+    Build keys one column at a time, like trying every key from
+    :func:`~src.ch04.practice.p4_generate_keys.iter_keys` with **permute**
+    and scoring each decoded message, but skip partial keys that score too
+    low. With **beam_width**, only the best partial keys of each length are
+    kept, which is fast but may miss the best keys. Without it, only partial
+    keys that can't make the best **top_k** are skipped, which always finds
+    the best keys but takes too long with more than about six columns.
+
+    Args:
+        ciphertext (str): Message encoded with route cipher.
+        columns (int): Number of route cipher columns.
+        top_k (int): Number of best decoded messages to keep. Defaults to
+            ``10``.
+        counter (NgramCounter): N-gram counts to score lowercase text with.
+            Defaults to :py:obj:`None` for the trigrams of
+            :py:const:`~src.ch02.DICTIONARY_FILE_PATH` from
+            :func:`~src.ch04.practice.p6_crack_route.get_ngram_counter`.
+        beam_width (int): Number of partial keys of each length to keep.
+            Defaults to ``1000``. Use :py:obj:`None` to find the best keys
+            with branch and bound instead.
+
+    Returns:
+        :py:obj:`list` of up to **top_k**
+        :py:class:`~src.ch04.practice.p6_crack_route.RouteCandidate` from
+        best to worst score. Keys are in the order the columns are read, as
+        used by :func:`~src.ch04.practice.p8_route_decoder.decode_route`.
+
+    Raises:
+        ValueError: If **top_k** or **beam_width** is less than ``1`` or if
+            the number of words in **ciphertext** isn't a multiple of
+            **columns**.
+
+    Example:
+        >>> from src.ch04.practice.p7_search_route import search_route
+        >>> ciphertext = 'message super be supposed this is to a secret stop'
+        >>> search_route(ciphertext, 2, 1)[0].key
+        [-1, 2]
+
+    """
+    if top_k < 1:
+        raise ValueError(TOP_K_ERROR)
+    if beam_width is not None and beam_width < 1:
+        raise ValueError(BEAM_WIDTH_ERROR)
+    cipherlist = ciphertext.split()
+    if columns < 1 or len(cipherlist) % columns:
+        raise ValueError(COLUMNS_ERROR)
+    if counter is None:
+        counter = get_ngram_counter(DICTIONARY_FILE_PATH)
+    rows = len(cipherlist) // columns
+    # Only letters are scored, so only keep the letters of each word.
+    letters = [''.join(letter for letter in word.lower()
+                       if letter in ascii_lowercase) for word in cipherlist]
+    table = [letters[i * rows:(i + 1) * rows] for i in range(columns)]
+    search = _Search(cipherlist, table, top_k, counter)
+    if beam_width is None:
+        search.branch([], [''] * rows, 0.0)
+    else:
+        search.beam(beam_width)
+    return [RouteCandidate(score, key, message)
+            for score, _, key, message in sorted(search.heap, reverse=True)]
+
+
+class _Search:
+    """State of a search of route cipher keys."""
+
+    # pylint: disable=too-many-instance-attributes
+    # Scores of routes and joins are made once and shared by every branch.
+
+    def __init__(self, cipherlist: list, table: list, top_k: int,
+                 counter: NgramCounter):
+        """Initialize class."""
+        self.cipherlist = cipherlist
+        self.top_k = top_k
+        self.counter = counter
+        self.keep = counter.length - 1
+        # Min-heap of the best candidates, so the worst is replaced first.
+        self.heap = []
+        self.count = 0
+        self.columns = range(1, len(table) + 1)
+        # Score of the n-grams inside the words of each column, which every
+        # key has.
+        self.inside = {column: sum(counter.fitness(word) for word in words)
+                       for column, words in enumerate(table, 1)}
+        # Each column as words of each row, for each direction.
+        self.routes = {sign * column: words[::sign]
+                       for column, words in enumerate(table, 1)
+                       for sign in (-1, 1)}
+        # Score of the n-grams that start in the words of a route and end
+        # in the words of the next route, for each pair of routes.
+        self.joins = {(first, second): self.get_join(
+            [word[-self.keep:] if self.keep else '' for word in words],
+            second) for first, words in self.routes.items()
+                      for second in self.routes if abs(first) != abs(second)}
+
+    def get_children(self, key: list, tails: list, score: float) -> list:
+        """Get each partial key that adds a column to partial key."""
+        children = []
+        for route in self.routes:
+            if route in key or -route in key:
+                continue
+            # Only n-grams that end in the new words are new.
+            words = self.routes[route]
+            new_score = score + sum(self.counter.fitness(tail + word)
+                                    for tail, word in zip(tails, words))
+            new_tails = [(tail + word)[-self.keep:] if self.keep else ''
+                         for tail, word in zip(tails, words)]
+            children.append((new_score, key + [route], new_tails))
+        return children
+
+    def branch(self, key: list, tails: list, score: float) -> None:
+        """Search every partial key that can beat the best keys."""
+        if len(key) == len(self.columns):
+            self.add_candidate(key)
+            return
+        children = [(new_score + self.get_rest_bound(new_key, new_tails),
+                     new_score, new_key, new_tails)
+                    for new_score, new_key, new_tails in
+                    self.get_children(key, tails, score)]
+        # Best first, so the worst candidate gets better sooner.
+        children.sort(key=lambda child: child[0], reverse=True)
+        for bound, new_score, new_key, new_tails in children:
+            if len(self.heap) == self.top_k and \
+                    bound < self.heap[0][0] - _EPSILON:
+                # Sorted, so the rest can't do better either.
+                break
+            self.branch(new_key, new_tails, new_score)
+
+    def beam(self, width: int) -> None:
+        """Search only the best partial keys of each length."""
+        total = sum(self.inside.values())
+        partials = [(0.0, [], [''] * len(self.routes[1]))]
+        for _ in self.columns:
+            children = []
+            for score, key, tails in partials:
+                children.extend(self.get_children(key, tails, score))
+            # Compare n-grams across words, since the n-grams inside words
+            # of columns not in the key are the same for every key.
+            partials = heapq.nlargest(
+                width, children, key=lambda child: child[0] + total - sum(
+                    self.inside[abs(route)] for route in child[1]))
+        for _, key, _ in partials:
+            self.add_candidate(key)
+
+    def get_join(self, tails: list, route: int) -> float:
+        """Get score of n-grams that start in tails and end in route."""
+        if not self.keep:
+            return 0.0
+        return sum(self.counter.fitness(tail + word[:self.keep])
+                   for tail, word in zip(tails, self.routes[route]))
+
+    def get_rest_bound(self, key: list, tails: list) -> float:
+        """Get best score the columns not in partial key can add.
+
+        Each column left adds the n-grams inside its words, and the
+        n-grams that end in its words after the words before them. The
+        words before them are either the end of partial key or another
+        column left, so the best of those is a bound.
+        """
+        rest = [column for column in self.columns
+                if column not in key and -column not in key]
+        bound = 0.0
+        for column in rest:
+            best = max(self.get_join(tails, route)
+                       for route in (-column, column))
+            for other in rest:
+                if other == column:
+                    continue
+                for first in (-other, other):
+                    for second in (-column, column):
+                        best = max(best, self.joins[first, second])
+            bound += self.inside[column] + best
+        return bound
+
+    def add_candidate(self, key: list) -> None:
+        """Score key and keep it if it is one of the best."""
+        message = ' '.join(decode_route(key, self.cipherlist))
+        # Negative count, so keys found first are better on ties.
+        item = (self.counter.fitness(message.lower()), -self.count, key,
+                message)
+        self.count += 1
+        if len(self.heap) < self.top_k:
+            heapq.heappush(self.heap, item)
+        elif item > self.heap[0]:
+            heapq.heapreplace(self.heap, item)
+
+
+def main():
+    """Demonstrate the route cipher searcher."""
+    print('I can search for the best route cipher keys even when I don\'t '
+          'know the order\nthe columns were read in.\n')
+    # Four column route 'cyphertext' from book.
+    ciphertext = """REST TRANSPORT YOU GODWIN VILLAGE
+                 ROANOKE WITH ARE YOUR IS JUST SUPPLIES FREE SNOW
+                 HEADING TO GONE TO SOUTH FILLER"""
+    print(f'Searching: {ciphertext}\n')
+    for candidate in search_route(ciphertext, 4, 3):
+        print(f'Score: {candidate.score:.2f}\nKey: {candidate.key}\n'
+              f'Decoded message: {candidate.message}\n')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,268 @@
+"""Decode route ciphers with precompiled word orders.
+
+:func:`~src.ch04.practice.p1_hack_lincoln.decode_route` and
+:func:`~src.ch04.practice.p5_hack_route.decode_route` split the cipherlist,
+reverse columns, and build a table for every key. Instead, compile each key
+and number of rows once into the index of the cipherlist word that goes in
+each place of the message, so decoding is one lookup for each word. Many
+keys can also be decoded at once with :py:mod:`numpy`.
+
+Keys with the same column order only differ in which columns are reversed,
+so :func:`compile_routes` compiles every sign pattern of a column order in
+one step, and :func:`decode_keys` uses it to decode ranges of keys from
+:func:`~src.ch04.practice.p4_generate_keys.iter_keys`.
+
+Keys are signed column numbers in the order the columns are read, like
+:func:`~src.ch04.practice.p4_generate_keys.iter_keys`, where negative
+columns are read in reverse.
+"""
+from itertools import chain, islice
+from timeit import timeit
+import numpy as np
+from src.ch04 import BACKEND_ERROR, COLUMNS_ERROR
+from src.ch04.practice import p1_hack_lincoln
+from src.ch04.practice.p4_generate_keys import iter_keys, iter_orders
+
+# Number of keys compiled at once by decode_keys, so big keys don't make
+# one huge array.
+_CHUNK = 1 << 12
+
+
+def compile_route(key, rows: int) -> tuple:
+    """Compile route cipher key into word order.
+
+    Args:
+        key: Sequence of signed, integer column numbers.
+        rows (int): Number of rows of the route cipher.
+
+    Returns:
+        :py:obj:`tuple` with the index of the cipherlist word for each word
+        of the decoded message.
+
+    Example:
+        >>> from src.ch04.practice.p8_route_decoder import compile_route
+        >>> compile_route([-1, 2], 3)
+        (2, 3, 1, 4, 0, 5)
+
+    """
+    # Index of the cipherlist word in each row of each column of the key.
+    columns = []
+    for column in key:
+        indexes = range((abs(column) - 1) * rows, abs(column) * rows)
+        if column < 0:
+            # If negative, reverse direction
+            indexes = indexes[::-1]
+        columns.append(indexes)
+    # Each row of the columns, one after the other.
+    return tuple(chain.from_iterable(zip(*columns)))
+
+
+def compile_routes(order, rows: int, start: int = 0,
+                   stop: int = None) -> np.ndarray:
+    """Compile every sign pattern of a column order into word orders.
+
+    Args:
+        order: Sequence of positive, integer column numbers in the order
+            the columns are read.
+        rows (int): Number of rows of the route cipher.
+        start (int): Number of the first sign pattern to compile. Defaults
+            to ``0``.
+        stop (int): Number of the sign pattern to stop before. Defaults to
+            :py:obj:`None` for every sign pattern after **start**.
+
+    Returns:
+        :py:class:`numpy.ndarray` with a row of word indexes like
+        :func:`compile_route` for each sign pattern from **start** to
+        **stop**, in the same order as the keys of
+        :func:`~src.ch04.practice.p4_generate_keys.iter_keys`.
+
+    Example:
+        >>> from src.ch04.practice.p8_route_decoder import compile_routes
+        >>> compile_routes([1, 2], 3, start=1, stop=3).tolist()
+        [[2, 3, 1, 4, 0, 5], [0, 5, 1, 4, 2, 3]]
+
+    """
+    length = len(order)
+    size = 2 ** length
+    stop = size if stop is None else min(stop, size)
+    # Index of the cipherlist word in each row of each column, read down
+    # and read up.
+    down = (np.array(order, dtype=np.intp)[:, np.newaxis] - 1) * rows + \
+        np.arange(rows, dtype=np.intp)
+    up = down[:, ::-1]
+    # Bits of each sign pattern from the first column, where 0 is negative,
+    # so negative signs come first like iter_keys.
+    patterns = np.arange(start, max(start, stop), dtype=np.intp)
+    shifts = np.arange(length - 1, -1, -1, dtype=np.intp)
+    negative = (patterns[:, np.newaxis] >> shifts) & 1 == 0
+    routes = np.where(negative[:, :, np.newaxis], up, down)
+    # Rows of the message, then columns of each row.
+    return routes.transpose(0, 2, 1).reshape(len(patterns), length * rows)
+
+
+def get_rows(key, cipherlist: list) -> int:
+    """Get number of rows of route cipher.
+
+    Args:
+        key: Sequence of signed, integer column numbers.
+        cipherlist (list): List of strings representing encoded message.
+
+    Returns:
+        :py:obj:`int` number of words in each column of **cipherlist**.
+
+    Raises:
+        ValueError: If the number of words in **cipherlist** isn't a
+            multiple of the number of columns in **key**.
+
+    """
+    rows, remainder = divmod(len(cipherlist), len(key))
+    if remainder:
+        raise ValueError(COLUMNS_ERROR)
+    return rows
+
+
+def decode_route(key, cipherlist: list) -> list:
+    """Decode route cipher with compiled key.
+
+    Same message as
+    :func:`~src.ch04.practice.p5_hack_route.decode_route` with the
+    ``up``/``down`` dictionary of **key**.
+
+    Args:
+        key: Sequence of signed, integer column numbers.
+        cipherlist (list): List of strings representing encoded message.
+
+    Returns:
+        List of strings representing plaintext message.
+
+    Raises:
+        ValueError: If the number of words in **cipherlist** isn't a
+            multiple of the number of columns in **key**.
+
+    """
+    order = compile_route(key, get_rows(key, cipherlist))
+    return [cipherlist[index] for index in order]
+
+
+def decode_batch(keys, cipherlist: list, backend: str = 'python') -> list:
+    """Decode route cipher with many keys.
+
+    Args:
+        keys: Iterable of keys with the same number of columns.
+        cipherlist (list): List of strings representing encoded message.
+        backend (str): How to decode. Either ``python`` for a list of words
+            for each key, or ``numpy`` to look up every word of every key
+            at once. Both give the same messages. Defaults to ``python``.
+
+    Returns:
+        :py:obj:`list` with the list of strings of the plaintext message of
+        each key in **keys**.
+
+    Raises:
+        ValueError: If **backend** isn't ``python`` or ``numpy``, or if the
+            number of words in **cipherlist** isn't a multiple of the number
+            of columns in a key.
+
+    """
+    if backend not in ('python', 'numpy'):
+        raise ValueError(BACKEND_ERROR)
+    orders = [compile_route(key, get_rows(key, cipherlist)) for key in keys]
+    if backend == 'python':
+        return [[cipherlist[index] for index in order] for order in orders]
+    if not orders:
+        return []
+    words = np.empty(len(cipherlist), dtype=object)
+    words[:] = cipherlist
+    return words[np.array(orders, dtype=np.intp)].tolist()
+
+
+def decode_keys(length: int, cipherlist: list, permute: bool = False,
+                start: int = 0, stop: int = None):
+    """Decode route cipher with a range of keys.
+
+    Decode **cipherlist** with each key of
+    :func:`~src.ch04.practice.p4_generate_keys.iter_keys` from **start** to
+    **stop**, compiling the word orders of many keys at once with
+    :func:`compile_routes`.
+
+    Args:
+        length (int): Number of route cipher columns.
+        cipherlist (list): List of strings representing encoded message.
+        permute (bool): Whether to also decode with every order of the
+            columns. Defaults to :py:obj:`False`.
+        start (int): Number of the first key to decode with. Defaults to
+            ``0``.
+        stop (int): Number of the key to stop before. Defaults to
+            :py:obj:`None` for every key after **start**.
+
+    Yields:
+        :py:obj:`tuple` with the next key and the list of strings of its
+        plaintext message.
+
+    Raises:
+        ValueError: If the number of words in **cipherlist** isn't a
+            multiple of **length**.
+
+    Example:
+        >>> from src.ch04.practice.p8_route_decoder import decode_keys
+        >>> next(decode_keys(2, ['a', 'b', 'c', 'd'], start=1))
+        ((-1, 2), ['b', 'c', 'a', 'd'])
+        >>> next(decode_keys(2, ['a', 'b', 'c', 'd'], True, start=4))
+        ((-2, -1), ['d', 'b', 'c', 'a'])
+
+    """
+    rows = get_rows(range(length), cipherlist)
+    words = np.empty(len(cipherlist), dtype=object)
+    words[:] = cipherlist
+    # Keys in the same order as the sign patterns of each column order.
+    keys = iter_keys(length, permute, start, stop)
+    for order, sign_start, sign_stop in iter_orders(length, permute, start,
+                                                    stop):
+        for chunk in range(sign_start, sign_stop, _CHUNK):
+            chunk_stop = min(chunk + _CHUNK, sign_stop)
+            routes = compile_routes(order, rows, chunk, chunk_stop)
+            # pylint: disable=looping-through-iterator
+            # Each chunk takes its keys from where the last one stopped.
+            yield from zip(islice(keys, chunk_stop - chunk),
+                           words[routes].tolist())
+
+
+def benchmark_decoders(cipherlist: list, columns: int,
+                       number: int = 1) -> dict:
+    """Benchmark route cipher decoders.
+
+    Time decoding **cipherlist** with every key of **columns** from
+    :func:`~src.ch04.practice.p4_generate_keys.iter_keys`.
+
+    Args:
+        cipherlist (list): List of strings representing encoded message.
+        columns (int): Number of route cipher columns.
+        number (int): Number of times to run each decoder. Defaults to
+            ``1``.
+
+    Returns:
+        :py:obj:`dict` with the name of each decoder as keys and average
+        seconds per run as values. ``table`` is
+        :func:`~src.ch04.practice.p1_hack_lincoln.decode_route`,
+        ``compiled`` is :func:`decode_route`, ``python`` and ``numpy`` are
+        the backends of :func:`decode_batch`, and ``routes`` is
+        :func:`decode_keys`. Nothing is cached between runs, so every
+        decoder compiles its keys each time.
+
+    Example:
+        >>> from src.ch04.practice.p8_route_decoder import benchmark_decoders
+        >>> list(benchmark_decoders(list(range(120)), 12))
+        ['table', 'compiled', 'python', 'numpy', 'routes']
+
+    """
+    keys = p1_hack_lincoln.keygen(columns)
+    decoders = {
+        'table': lambda: [p1_hack_lincoln.decode_route(key, cipherlist)
+                          for key in keys],
+        'compiled': lambda: [decode_route(key, cipherlist) for key in keys],
+        'python': lambda: decode_batch(keys, cipherlist),
+        'numpy': lambda: decode_batch(keys, cipherlist, 'numpy'),
+        'routes': lambda: list(decode_keys(columns, cipherlist)),
+    }
+    return {name: timeit(decoder, number=number) / number
+            for name, decoder in decoders.items()}
@@ -20,8 +20,9 @@ from string import punctuation
 import nltk
 from nltk.corpus import cmudict
 
-from src.ch02 import DICTIONARY_FILE_PATH
-from src.ch02.p1_cleanup_dictionary import cleanup_dict
+from src.ch02 import DICTIONARY_FILE_PATH, CLEAN_DICTIONARY_FILE_PATH
+from src.ch02.p1_word_artifact import WordArtifact
+from src.ch02.p1_word_registry import get_words
 
 if not os.path.exists(
         os.path.expanduser('~/nltk_data/corpora/cmudict/cmudict')):
@@ -96,9 +97,22 @@ def count_syllables(words: list) -> int:
 
 
 def main():
-    """Demonstrate count_syllables with a word dictionary file."""
-    word_list = cleanup_dict(DICTIONARY_FILE_PATH)
-    sample_list = sample(word_list, 15)
+    """Demonstrate count_syllables with a word dictionary file.
+
+    Sample words from the cleaned up word dictionary file made by
+    :func:`~src.ch02.p1_cleanup_dictionary.build_artifact`, so only the
+    sampled words are read. If it hasn't been built, load the word
+    dictionary file instead.
+
+    """
+    try:
+        word_list = WordArtifact(CLEAN_DICTIONARY_FILE_PATH)
+    except (OSError, ValueError):
+        # Not built or not a word artifact file.
+        sample_list = sample(get_words(DICTIONARY_FILE_PATH), 15)
+    else:
+        with word_list:
+            sample_list = sample(word_list, 15)
     for word in sample_list:
         try:
             syllables = count_syllables(format_words(word))
@@ -1,12 +1,21 @@
 """Test Chapter 2."""
 import os
+import random
 import string
+import sys
 import unittest.mock
 from io import StringIO
+from shutil import copyfile
+from tempfile import TemporaryDirectory
 import src.ch02.p1_cleanup_dictionary as cleanup_dictionary
+from src.ch01.challenge.c2_name_generator import read_from_file
 import src.ch02.c1_recursive_palindrome as recursive_palindrome
+import src.ch02.p2_palingrams as palingrams
+import src.ch02.p1_word_artifact as word_artifact
+import src.ch02.p1_word_registry as word_registry
 from tests import random_string
-from src.ch02 import CLEANUP_LIST_ERROR, RECURSIVE_ISPALINDROME_ERROR
+from src.ch02 import CLEANUP_LIST_ERROR, RECURSIVE_ISPALINDROME_ERROR, \
+    WORD_VARIANT_ERROR, READ_ARTIFACT_ERROR
 
 
 class TestCleanupDictionary(unittest.TestCase):
@@ -67,6 +76,71 @@ class TestCleanupDictionary(unittest.TestCase):
         test_list = ['test', 'test']
         clean_list = cleanup_dictionary.cleanup_list_more(test_list)
         self.assertListEqual(dictionary, clean_list)
+        # Test that it keeps letters that are only in ascii_lowercase once
+        # lowercase, like the Kelvin sign, but skips other letters.
+        test_list = ['test', '\u212a', 'Te\u017ft', 'TEST']
+        clean_list = cleanup_dictionary.cleanup_list_more(test_list)
+        self.assertListEqual(sorted(dictionary + ['k']), clean_list)
+        # Test that it can skip sorting.
+        test_list = ['pls', 'test', "me's", 'test', 'mís', 'es', 'Zoo']
+        clean_list = cleanup_dictionary.cleanup_list_more(test_list,
+                                                          sort=False)
+        self.assertListEqual(
+            sorted(['pls', 'test', 'zoo'] + approved_words),
+            sorted(clean_list))
+        self.assertEqual(len(set(clean_list)), len(clean_list))
+
+    def test_benchmark_cleanup_list_more(self):
+        """Test that it can time each way to cleanup word list even more."""
+        test_times = cleanup_dictionary.benchmark_cleanup_list_more(
+            ['test', 'Pls', "me's"])
+        self.assertListEqual(['sorted', 'unsorted', 'stages'],
+                             list(test_times))
+        for time in test_times.values():
+            self.assertGreater(time, 0)
+
+    def test_iter_words(self):
+        """Test that it streams the same words as read_from_file."""
+        dict_file = os.path.abspath('tests/data/ch02/dictionary.txt')
+        word_list = read_from_file(dict_file)
+        for buffer_size in [1, 2, 7, cleanup_dictionary.BUFFER_SIZE]:
+            test_words = cleanup_dictionary.iter_words(dict_file, buffer_size)
+            self.assertListEqual(word_list, list(test_words))
+        # Test line endings, trailing whitespaces, and multibyte letters.
+        with TemporaryDirectory() as temp_dir:
+            test_file = os.path.join(temp_dir, 'dictionary.txt')
+            for text in ['mís\r\nme \n\nmy\ts', 'a\rb\r\n', '', '\n',
+                         'é' * 5]:
+                with open(test_file, 'w', encoding='utf-8',
+                          newline='') as file:
+                    file.write(text)
+                word_list = read_from_file(test_file)
+                for buffer_size in range(1, 6):
+                    test_words = cleanup_dictionary.iter_words(test_file,
+                                                               buffer_size)
+                    self.assertListEqual(word_list, list(test_words))
+
+    def test_cleanup_stages(self):
+        """Test that generator stages match cleanup lists."""
+        test_list = ['a', 'Test', 'es', 'mís', "me's", 'test', 'pls', 'b',
+                     'Pls', 'ox']
+        test_words = cleanup_dictionary.skip_single_letters(iter(test_list))
+        self.assertListEqual(cleanup_dictionary.cleanup_list(test_list),
+                             list(test_words))
+        test_words = cleanup_dictionary.skip_unclean_words(test_list)
+        self.assertListEqual(['a', 'test', 'test', 'pls', 'b', 'pls'],
+                             list(test_words))
+        test_words = cleanup_dictionary.add_approved_words(['test'])
+        self.assertListEqual(['test'] + cleanup_dictionary.APPROVED_WORDS,
+                             list(test_words))
+        test_words = cleanup_dictionary.skip_duplicates(['b', 'a', 'b', 'a'])
+        self.assertListEqual(['b', 'a'], list(test_words))
+        # Test that composed stages match cleanup_list_more.
+        test_words = sorted(cleanup_dictionary.skip_duplicates(
+            cleanup_dictionary.add_approved_words(
+                cleanup_dictionary.skip_unclean_words(test_list))))
+        self.assertListEqual(cleanup_dictionary.cleanup_list_more(test_list),
+                             test_words)
 
     def test_cleanup_dict(self):
         """Test that it removes single letter words from a dictionary file."""
@@ -75,6 +149,13 @@ class TestCleanupDictionary(unittest.TestCase):
         self.assertEqual(len(clean_dict), 52)  # 78 words - 26 letters
         for element in clean_dict:
             self.assertGreater(len(element), 1)
+        # Test that it raises an error if the file is empty.
+        with TemporaryDirectory() as temp_dir:
+            test_file = os.path.join(temp_dir, 'dictionary.txt')
+            open(test_file, 'w').close()
+            with self.assertRaises(IndexError) as err:
+                cleanup_dictionary.cleanup_dict(test_file)
+            self.assertEqual(CLEANUP_LIST_ERROR, str(err.exception))
 
     @unittest.mock.patch('sys.stdout', new_callable=StringIO)
     @unittest.mock.patch('src.ch02.p1_cleanup_dictionary.DICTIONARY_FILE_PATH', 'tests/data/ch02/dictionary.txt')
@@ -87,6 +168,220 @@ class TestCleanupDictionary(unittest.TestCase):
             file_data = ''.join(file.readlines())
         self.assertEqual(mock_stdout.getvalue(), file_data)
 
+    def test_build_artifact(self):
+        """Test that it saves the cleaned up words once."""
+        dict_file = os.path.abspath('tests/data/ch02/dictionary.txt')
+        clean_list = cleanup_dictionary.cleanup_list_more(
+            cleanup_dictionary.cleanup_dict(dict_file))
+        with TemporaryDirectory() as temp_dir:
+            artifact_file = os.path.join(temp_dir, 'clean', 'words.txt')
+            self.assertEqual(len(clean_list), cleanup_dictionary.build_artifact(
+                dict_file, artifact_file))
+            # Test that it can be read like any word dictionary file.
+            self.assertListEqual(clean_list, read_from_file(artifact_file))
+            with word_artifact.WordArtifact(artifact_file) as words:
+                self.assertListEqual(clean_list, list(words))
+
+    @unittest.mock.patch('sys.stdout', new_callable=StringIO)
+    def test_main_build(self, mock_stdout):
+        """Test build command of main function."""
+        dict_file = os.path.abspath('tests/data/ch02/dictionary.txt')
+        with TemporaryDirectory() as temp_dir:
+            artifact_file = os.path.join(temp_dir, 'words.txt')
+            cleanup_dictionary.main(['build', dict_file, artifact_file])
+            self.assertTrue(os.path.isfile(artifact_file))
+            self.assertTrue(os.path.isfile(
+                artifact_file + word_artifact.INDEX_EXTENSION))
+            with word_artifact.WordArtifact(artifact_file) as words:
+                word_count = len(words)
+        self.assertEqual(f'Saved {word_count} words to {artifact_file}.\n',
+                         mock_stdout.getvalue())
+
+
+class TestWordArtifact(unittest.TestCase):
+    """Test Word Artifact."""
+
+    def test_write_artifact(self):
+        """Test that it writes words and offsets of each word."""
+        with TemporaryDirectory() as temp_dir:
+            artifact_file = os.path.join(temp_dir, 'words.txt')
+            self.assertEqual(3, word_artifact.write_artifact(
+                iter(['an', 'bee', 'Ça']), artifact_file))
+            with open(artifact_file, 'rb') as file:
+                self.assertEqual('an\nbee\nÇa\n'.encode(), file.read())
+            with open(artifact_file + word_artifact.INDEX_EXTENSION,
+                      'rb') as file:
+                offsets = [int.from_bytes(file.read(8), 'little')
+                           for _ in range(4)]
+                self.assertEqual(b'', file.read())
+            self.assertListEqual([0, 3, 7, 11], offsets)
+            # Test that it only has the temporary files it replaced.
+            self.assertEqual(2, len(os.listdir(temp_dir)))
+
+    def test_write_artifact_error(self):
+        """Test that it removes its temporary files if writing fails."""
+        def bad_words():
+            yield 'an'
+            raise ValueError('bad word')
+
+        with TemporaryDirectory() as temp_dir:
+            artifact_file = os.path.join(temp_dir, 'words.txt')
+            with self.assertRaises(ValueError):
+                word_artifact.write_artifact(bad_words(), artifact_file)
+            self.assertListEqual([], os.listdir(temp_dir))
+            # Test an error after the word file is written.
+            with unittest.mock.patch('src.ch02.p1_word_artifact.os.replace',
+                                     side_effect=OSError):
+                with self.assertRaises(OSError):
+                    word_artifact.write_artifact(['an'], artifact_file)
+            self.assertListEqual([], os.listdir(temp_dir))
+
+    def test_word_artifact(self):
+        """Test that it gets each word by its rank."""
+        words = [random_string(5) for _ in range(20)] + ['Ça', 'a']
+        with TemporaryDirectory() as temp_dir:
+            artifact_file = os.path.join(temp_dir, 'words.txt')
+            word_artifact.write_artifact(words, artifact_file)
+            with word_artifact.WordArtifact(artifact_file) as test_words:
+                self.assertEqual(len(words), len(test_words))
+                for index, word in enumerate(words):
+                    self.assertEqual(word, test_words[index])
+                self.assertEqual('a', test_words[-1])
+                self.assertEqual('Ça', test_words[-2])
+                self.assertListEqual(words, list(test_words))
+                self.assertIn('Ça', test_words)
+                with self.assertRaises(IndexError):
+                    _ = test_words[len(words)]
+                with self.assertRaises(IndexError):
+                    _ = test_words[-len(words) - 1]
+                with self.assertRaises(TypeError):
+                    _ = test_words['a']
+                # Test that it can be sampled.
+                sample_list = random.sample(test_words, 5)
+                self.assertEqual(5, len(sample_list))
+                self.assertTrue(set(sample_list).issubset(words))
+            # Test that it can have no words.
+            word_artifact.write_artifact([], artifact_file)
+            with word_artifact.WordArtifact(artifact_file) as test_words:
+                self.assertEqual(0, len(test_words))
+                self.assertListEqual([], list(test_words))
+
+    def test_bad_artifact(self):
+        """Test that it raises an error if files don't match."""
+        with TemporaryDirectory() as temp_dir:
+            artifact_file = os.path.join(temp_dir, 'words.txt')
+            index_file = artifact_file + word_artifact.INDEX_EXTENSION
+            word_artifact.write_artifact(['test', 'me'], artifact_file)
+            # Word file changed since index file was written.
+            with open(artifact_file, 'a') as file:
+                file.write('more\n')
+            with self.assertRaises(ValueError) as err:
+                word_artifact.WordArtifact(artifact_file)
+            self.assertEqual(READ_ARTIFACT_ERROR, str(err.exception))
+            # Index file isn't whole offsets.
+            with open(index_file, 'ab') as file:
+                file.write(b'\x00')
+            with self.assertRaises(ValueError) as err:
+                word_artifact.WordArtifact(artifact_file)
+            self.assertEqual(READ_ARTIFACT_ERROR, str(err.exception))
+            # Index file is empty.
+            open(index_file, 'w').close()
+            with self.assertRaises(ValueError) as err:
+                word_artifact.WordArtifact(artifact_file)
+            self.assertEqual(READ_ARTIFACT_ERROR, str(err.exception))
+            # Index file is missing.
+            os.remove(index_file)
+            with self.assertRaises(FileNotFoundError):
+                word_artifact.WordArtifact(artifact_file)
+
+
+class TestWordRegistry(unittest.TestCase):
+    """Test Word Registry."""
+
+    def test_load_words(self):
+        """Test that it loads each variant."""
+        dict_file = os.path.abspath('tests/data/ch02/dictionary.txt')
+        word_list = read_from_file(dict_file)
+        test_words = word_registry.load_words(dict_file, 'raw')
+        self.assertTupleEqual(tuple(word_list), test_words)
+        test_words = word_registry.load_words(dict_file)
+        self.assertTupleEqual(tuple(cleanup_dictionary.cleanup_dict(dict_file)),
+                              test_words)
+        test_words = word_registry.load_words(dict_file, 'cleanup_list_more')
+        self.assertTupleEqual(tuple(cleanup_dictionary.cleanup_list_more(
+            cleanup_dictionary.cleanup_dict(dict_file))), test_words)
+        with self.assertRaises(ValueError) as err:
+            word_registry.load_words(dict_file, 'cleanest')
+        self.assertEqual(WORD_VARIANT_ERROR, str(err.exception))
+
+    def test_get_size(self):
+        """Test that it counts the size of each word."""
+        words = ('test', 'me')
+        self.assertEqual(sys.getsizeof(words) + sys.getsizeof('test') +
+                         sys.getsizeof('me'), word_registry.get_size(words))
+        self.assertEqual(sys.getsizeof(frozenset()),
+                         word_registry.get_size(frozenset()))
+
+    def test_word_registry(self):
+        """Test that it loads each variant once until evicted."""
+        registry = word_registry.WordRegistry()
+        with TemporaryDirectory() as temp_dir:
+            dict_file = os.path.join(temp_dir, 'dictionary.txt')
+            copyfile('tests/data/ch02/dictionary.txt', dict_file)
+            with unittest.mock.patch('src.ch02.p1_word_registry.load_words',
+                                     wraps=word_registry.load_words) as mock:
+                words = registry.get_words(dict_file)
+                self.assertIs(words, registry.get_words(dict_file))
+                self.assertIsInstance(words, tuple)
+                self.assertEqual(1, mock.call_count)
+                more_words = registry.get_words(dict_file,
+                                                'cleanup_list_more')
+                self.assertEqual(2, mock.call_count)
+                self.assertEqual(2, len(registry))
+                # Test that it makes a set once.
+                word_set = registry.get_word_set(dict_file,
+                                                 'cleanup_list_more')
+                self.assertIsInstance(word_set, frozenset)
+                self.assertSetEqual(set(more_words), word_set)
+                self.assertIs(word_set, registry.get_word_set(
+                    dict_file, 'cleanup_list_more'))
+                self.assertEqual(2, mock.call_count)
+                # Test that it loads again if the file changes.
+                with open(dict_file, 'a') as file:
+                    file.write('\nzebra\n')
+                new_words = registry.get_words(dict_file)
+                self.assertEqual(3, mock.call_count)
+                self.assertEqual(words + ('zebra',), new_words)
+                with self.assertRaises(ValueError) as err:
+                    registry.get_words(dict_file, 'cleanest')
+                self.assertEqual(WORD_VARIANT_ERROR, str(err.exception))
+            # Test memory accounting.
+            usage = registry.memory_usage()
+            path = os.path.abspath(dict_file)
+            self.assertEqual(word_registry.get_size(new_words),
+                             usage[(path, 'cleanup_list')])
+            self.assertEqual(word_registry.get_size(more_words) +
+                             word_registry.get_size(word_set),
+                             usage[(path, 'cleanup_list_more')])
+            # Test eviction.
+            self.assertEqual(0, registry.evict('other.txt'))
+            self.assertEqual(1, registry.evict(dict_file, 'cleanup_list'))
+            self.assertEqual(1, len(registry))
+            self.assertEqual(1, registry.evict())
+            self.assertEqual(0, len(registry))
+            self.assertDictEqual({}, registry.memory_usage())
+            self.assertIsNot(new_words, registry.get_words(dict_file))
+
+    @unittest.mock.patch('src.ch02.p1_word_registry.DICTIONARY_FILE_PATH',
+                         'tests/data/ch02/dictionary.txt')
+    def test_get_words(self):
+        """Test that it shares the process registry."""
+        dict_file = 'tests/data/ch02/dictionary.txt'
+        words = word_registry.get_words(dict_file)
+        self.assertIs(words, word_registry.REGISTRY.get_words(dict_file))
+        self.assertEqual(52, len(words))
+        word_registry.REGISTRY.evict(dict_file)
+
 
 class TestRecursivePalindrome(unittest.TestCase):
     """Test Recursive Palindrome tester."""
@@ -108,6 +403,48 @@ class TestRecursivePalindrome(unittest.TestCase):
         self.assertFalse(
             recursive_palindrome.recursive_ispalindrome(not_palindrome))
 
+    def test_ispalindrome(self):
+        """Test that it matches the recursive palindrome tester."""
+        random_string_ = random_string(10, string.ascii_lowercase)
+        random_palindrome = random_string_ + random_string_[::-1]
+        self.assertTrue(recursive_palindrome.ispalindrome(random_palindrome))
+        self.assertTrue(
+            recursive_palindrome.ispalindrome(random_palindrome[1:-1]))
+        for word in ['', 'a', 'aa', 'ab', 'cat', 'civic', 'Civic', 'noon',
+                     'nooon', 'nosn']:
+            self.assertEqual(
+                recursive_palindrome.recursive_ispalindrome(word),
+                recursive_palindrome.ispalindrome(word))
+        # Test that it works past the recursion limit.
+        long_palindrome = 'ab' * sys.getrecursionlimit() + 'a'
+        self.assertTrue(recursive_palindrome.ispalindrome(long_palindrome))
+        self.assertFalse(
+            recursive_palindrome.ispalindrome(long_palindrome + 'b'))
+        with self.assertRaises(TypeError) as err:
+            recursive_palindrome.ispalindrome(5)
+        self.assertEqual(RECURSIVE_ISPALINDROME_ERROR, str(err.exception))
+
+    def test_find_palindromes(self):
+        """Test that it finds every palindrome in words."""
+        words = ['', 'a', 'aa', 'ab', 'abca', 'cat', 'civic', 'Civic', 'noon',
+                 'nosn', 'racecar']
+        palindromes = ['a', 'aa', 'civic', 'noon', 'racecar']
+        self.assertListEqual(
+            palindromes, list(recursive_palindrome.find_palindromes(words)))
+        self.assertListEqual(
+            palindromes,
+            list(recursive_palindrome.find_palindromes(iter(words), False)))
+        # Test a word dictionary file.
+        dict_file = os.path.abspath('tests/data/ch02/dictionary.txt')
+        word_list = read_from_file(dict_file)
+        self.assertListEqual(
+            [word for word in word_list if word and word == word[::-1]],
+            list(recursive_palindrome.find_palindromes(
+                cleanup_dictionary.iter_words(dict_file))))
+        with self.assertRaises(TypeError) as err:
+            list(recursive_palindrome.find_palindromes(['noon', 5]))
+        self.assertEqual(RECURSIVE_ISPALINDROME_ERROR, str(err.exception))
+
     @unittest.mock.patch('sys.stdout', new_callable=StringIO)
     def test_main(self, mock_stdout):
         """Test demo main function."""
@@ -122,5 +459,55 @@ class TestRecursivePalindrome(unittest.TestCase):
         self.assertEqual(mock_stdout.getvalue(), file_data)
 
 
+class TestPalingrams(unittest.TestCase):
+    """Test Palingrams."""
+
+    def test_find_palingrams(self):
+        """Test that it finds the same palingrams as every pair."""
+        words = ['nurses', 'run', 'stack', 'cats', 'dog', 'god', 'noon',
+                 'no', 'on', 'a', 'aa', 'aaa', 'level', 'el', 'dog']
+        expected = sorted({(first, second) for first in words
+                           for second in words if first != second and
+                           recursive_palindrome.ispalindrome(first + second)})
+        self.assertListEqual(expected, palingrams.find_palingrams(words))
+        self.assertIn(('nurses', 'run'), expected)
+        self.assertIn(('dog', 'god'), expected)
+        self.assertIn(('god', 'dog'), expected)
+        self.assertListEqual([], palingrams.find_palingrams([]))
+        self.assertListEqual([], palingrams.find_palingrams(['noon']))
+        # Test pseudo-random words.
+        words = {random_string(5, 'ab') for _ in range(30)}
+        words.update(random_string(2, 'ab') for _ in range(5))
+        expected = sorted({(first, second) for first in words
+                           for second in words if first != second and
+                           recursive_palindrome.ispalindrome(first + second)})
+        self.assertListEqual(expected, palingrams.find_palingrams(words))
+
+    def test_palingram_dict(self):
+        """Test that it finds palingrams in a dictionary file."""
+        with TemporaryDirectory() as temp_dir:
+            dict_file = os.path.join(temp_dir, 'dictionary.txt')
+            with open(dict_file, 'w') as file:
+                file.write('a\nnurses\nrun\ncats\nstack\nsun\nb\n')
+            self.assertListEqual([('nurses', 'run'), ('stack', 'cats')],
+                                 palingrams.palingram_dict(dict_file))
+
+    @unittest.mock.patch('sys.stdout', new_callable=StringIO)
+    def test_main(self, mock_stdout):
+        """Test demo main function."""
+        with TemporaryDirectory() as temp_dir:
+            dict_file = os.path.join(temp_dir, 'dictionary.txt')
+            with open(dict_file, 'w') as file:
+                file.write('nurses\nrun\ncats\nstack\n')
+            with unittest.mock.patch(
+                    'src.ch02.p2_palingrams.DICTIONARY_FILE_PATH', dict_file):
+                palingrams.main()
+        self.assertEqual('I\'m a palingram finder.\n'
+                         'I pair up words that read the same backwards.\n\n'
+                         'Number of palingrams = 2\n\n'
+                         'nurses run\n'
+                         'stack cats\n', mock_stdout.getvalue())
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -1,12 +1,28 @@
 """Test Chapter 3."""
+import math
 import os
 import unittest.mock
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
 from io import StringIO
+from shutil import copyfile
 from string import ascii_lowercase
+from tempfile import TemporaryDirectory
 from src.ch02.p1_cleanup_dictionary import cleanup_dict, cleanup_list_more
 import src.ch03.p1_digram_counter as digram_counter
+import src.ch03.p1_digram_index as digram_index
+import src.ch03.p1_digram_vectors as digram_vectors
+import src.ch03.p1_ngram_counter as ngram_counter
 import src.ch03.c1_anagram_generator as anagram_generator
-from src.ch03 import GET_DIGRAMS_ERROR, COUNT_DIGRAMS_ERROR
+import src.ch03.c1_anagram_benchmark as anagram_benchmark
+import src.ch03.c1_anagram_cache as anagram_cache
+import src.ch03.p1_cache_files as cache_files
+import src.ch03.c1_anagram_memo as anagram_memo
+import src.ch03.c1_anagram_vectors as anagram_vectors
+from src.ch03 import GET_DIGRAMS_ERROR, COUNT_DIGRAMS_ERROR, BACKEND_ERROR, \
+    READ_ANAGRAM_CACHE_ERROR, STALE_ANAGRAM_CACHE_ERROR, ENCODING_ERROR, \
+    READ_DIGRAM_INDEX_ERROR, STALE_DIGRAM_INDEX_ERROR, DIGRAM_POSITIONS_ERROR, \
+    NGRAM_LENGTH_ERROR, NGRAM_ERROR
 from tests import random_string
 from tests.data.ch03.ch03 import LETTER_PRIME_DICT
 
@@ -25,6 +41,9 @@ class TestDigramCounter(unittest.TestCase):
         with self.assertRaises(TypeError) as err:
             digram_counter.count_digrams(set(), 7)
         self.assertEqual(COUNT_DIGRAMS_ERROR, str(err.exception))
+        with self.assertRaises(ValueError) as err:
+            digram_counter.count_digrams(set(), [], backend='pandas')
+        self.assertEqual(BACKEND_ERROR, str(err.exception))
 
     def test_get_digrams(self):
         """Test that it can make a set of digrams."""
@@ -40,6 +59,70 @@ class TestDigramCounter(unittest.TestCase):
         digram_count = {'mo': 2, 'gh': 1, 'li': 1, 'to': 1, 'on': 1, 'bo': 0}
         test_count = digram_counter.count_digrams(digrams, word_list)
         self.assertDictEqual(digram_count, test_count)
+        test_count = digram_counter.count_digrams(digrams, word_list,
+                                                  backend='numpy')
+        self.assertDictEqual(digram_count, test_count)
+        # Test that it makes the table of changed words again.
+        word_list = ['cake', 'cocoa', 'bake']
+        test_count = digram_counter.count_digrams(
+            {'ak', 'co'}, word_list, backend='numpy')
+        self.assertDictEqual({'ak': 2, 'co': 1}, test_count)
+        word_list.append('coke')
+        test_count = digram_counter.count_digrams(
+            {'ak', 'co'}, word_list, backend='numpy')
+        self.assertDictEqual({'ak': 2, 'co': 2}, test_count)
+        # Test that it looks up a given digram table instead of making it.
+        for backend in ['python', 'numpy']:
+            digram_table = digram_counter.make_digram_table(word_list,
+                                                            backend)
+            with unittest.mock.patch(
+                    'src.ch03.p1_digram_counter.make_digram_table') \
+                    as mock_make:
+                test_count = digram_counter.count_digrams(
+                    {'ak', 'co', 'cok'}, word_list,
+                    digram_table=digram_table)
+                mock_make.assert_not_called()
+            self.assertDictEqual({'ak': 2, 'co': 2, 'cok': 1}, test_count)
+
+    def test_make_digram_table(self):
+        """Test that both backends make the same digram table."""
+        word_list = ['tom', 'morrow', 'moon', 'light', 'mom']
+        digram_table = digram_counter.get_digram_table(word_list)
+        for backend in ['python', 'numpy']:
+            test_table = digram_counter.make_digram_table(word_list, backend)
+            self.assertDictEqual(dict(digram_table), dict(test_table))
+        self.assertDictEqual(dict(digram_table), dict(
+            digram_counter.make_digram_table(word_list)))
+        with self.assertRaises(ValueError) as err:
+            digram_counter.make_digram_table(word_list, 'pandas')
+        self.assertEqual(BACKEND_ERROR, str(err.exception))
+
+    def test_get_digram_table(self):
+        """Test that it counts words with each digram."""
+        word_list = ['tom', 'morrow', 'moon', 'light', 'mom']
+        digram_table = {'to': 1, 'om': 2, 'mo': 3, 'or': 1, 'rr': 1, 'ro': 1,
+                        'ow': 1, 'oo': 1, 'on': 1, 'li': 1, 'ig': 1, 'gh': 1,
+                        'ht': 1}
+        test_table = digram_counter.get_digram_table(word_list)
+        self.assertDictEqual(digram_table, dict(test_table))
+        # Test that it matches searching every word for every digram.
+        test_list = [random_string(length, 'abc') for length in range(10)]
+        test_table = digram_counter.get_digram_table(test_list)
+        for digram in digram_counter.get_digrams('abcabc'):
+            self.assertEqual(sum(digram in word for word in test_list),
+                             test_table[digram])
+        self.assertDictEqual({}, digram_counter.get_digram_table([]))
+
+    def test_lookup_digrams(self):
+        """Test that it can look up digrams in a digram table."""
+        word_list = ['tom', 'morrow', 'moon', 'light']
+        digram_table = digram_counter.get_digram_table(word_list)
+        test_count = digram_counter.lookup_digrams({'mo', 'bo'}, digram_table)
+        self.assertDictEqual({'mo': 2, 'bo': 0}, test_count)
+        # Test that it searches words for strings that aren't digrams.
+        test_count = digram_counter.lookup_digrams({'o', 'row', 'mo'},
+                                                   digram_table, word_list)
+        self.assertDictEqual({'o': 3, 'row': 1, 'mo': 2}, test_count)
 
     def test_digram_counter(self):
         """Test that it can count digrams in a word dictionary file."""
@@ -51,6 +134,29 @@ class TestDigramCounter(unittest.TestCase):
                  'bd': 0, 'cr': 0, 'rb': 0, 'cb': 0, 'rc': 0}
         test_count = digram_counter.digram_counter(word, test_dict_path)
         self.assertDictEqual(count, test_count)
+        # Test that it counts again if the word dictionary file changes.
+        with TemporaryDirectory() as temp_dir:
+            dict_file = os.path.join(temp_dir, 'dictionary.txt')
+            copyfile(test_dict_path, dict_file)
+            test_count = digram_counter.digram_counter(word, dict_file)
+            self.assertDictEqual(count, test_count)
+            with open(dict_file, 'a') as file:
+                file.write('\nbrr\n')
+            count['br'] += 1
+            count['rr'] += 1
+            test_count = digram_counter.digram_counter(word, dict_file)
+            self.assertDictEqual(count, test_count)
+            # Test that it matches with a digram index.
+            test_count = digram_counter.digram_counter(word, dict_file,
+                                                       temp_dir)
+            self.assertDictEqual(count, test_count)
+            self.assertTrue(os.path.exists(cache_files.get_cache_path(
+                dict_file, temp_dir, digram_index.INDEX_EXTENSION)))
+            # Test that it doesn't use it for digrams that aren't in it.
+            test_count = digram_counter.digram_counter('Abra', dict_file,
+                                                       temp_dir)
+            self.assertEqual(0, test_count['Ab'])
+            self.assertEqual(3, test_count['br'])
 
     @unittest.mock.patch('sys.stdout', new_callable=StringIO)
     @unittest.mock.patch('src.ch03.p1_digram_counter.DICTIONARY_FILE_PATH',
@@ -65,6 +171,262 @@ class TestDigramCounter(unittest.TestCase):
         self.assertEqual(mock_stdout.getvalue(), file_data)
 
 
+class TestDigramVectors(unittest.TestCase):
+    """Test Digram Vectors."""
+
+    def test_get_char_matrix(self):
+        """Test that it can encode a word list as a padded matrix."""
+        test_matrix, test_chars = digram_vectors.get_char_matrix(
+            ['tom', 'moon', '', 'a'])
+        self.assertListEqual([[5, 4, 2, 0], [2, 4, 4, 3], [0, 0, 0, 0],
+                              [1, 0, 0, 0]], test_matrix.tolist())
+        self.assertEqual('uint8', test_matrix.dtype.name)
+        self.assertEqual('amnot', ''.join(map(chr, test_chars)))
+        # Test that it has room for more than 254 characters.
+        word = ''.join(map(chr, range(ord('a'), ord('a') + 300)))
+        test_matrix, test_chars = digram_vectors.get_char_matrix([word])
+        self.assertListEqual(list(range(1, 301)), test_matrix[0].tolist())
+        self.assertEqual('uint32', test_matrix.dtype.name)
+        test_matrix, test_chars = digram_vectors.get_char_matrix([])
+        self.assertEqual((0, 0), test_matrix.shape)
+        self.assertEqual(0, len(test_chars))
+
+    def test_get_digram_table(self):
+        """Test that it matches the digram table made in Python."""
+        for chars in ['ab', ascii_lowercase, 'aAbB-\'\u00e9']:
+            test_list = [random_string(length, chars)
+                         for length in range(20)] * 2
+            self.assertDictEqual(
+                digram_counter.get_digram_table(test_list),
+                digram_vectors.get_digram_table(test_list))
+        self.assertDictEqual({}, digram_vectors.get_digram_table([]))
+        self.assertDictEqual({}, digram_vectors.get_digram_table(['a', '']))
+
+
+class TestDigramIndex(unittest.TestCase):
+    """Test Digram Index."""
+
+    def test_get_digram_number(self):
+        """Test that each lowercase digram gets its own number."""
+        self.assertEqual(0, digram_index.get_digram_number('aa'))
+        self.assertEqual(26, digram_index.get_digram_number('ba'))
+        self.assertEqual(675, digram_index.get_digram_number('zz'))
+        for digram in ['a', 'abc', 'Ab', 'a-']:
+            with self.assertRaises(KeyError):
+                digram_index.get_digram_number(digram)
+
+    def test_get_digram_counts(self):
+        """Test that it matches the digram table."""
+        word_list = ['tom', 'morrow', 'moon', 'light', 'Mom', 'a', '']
+        digram_table = digram_counter.get_digram_table(word_list)
+        test_counts = digram_index.get_digram_counts(word_list)
+        self.assertEqual(digram_index.DIGRAMS, len(test_counts))
+        for number, count in enumerate(test_counts):
+            first, second = divmod(number, 26)
+            digram = ascii_lowercase[first] + ascii_lowercase[second]
+            self.assertEqual(digram_table[digram], count)
+        # Test positional counts.
+        test_counts = digram_index.get_digram_counts(word_list, True)
+        self.assertEqual(3 * digram_index.DIGRAMS, len(test_counts))
+        starts = test_counts[digram_index.DIGRAMS:2 * digram_index.DIGRAMS]
+        ends = test_counts[2 * digram_index.DIGRAMS:]
+        self.assertEqual(4, sum(starts))
+        self.assertEqual(2, starts[digram_index.get_digram_number('mo')])
+        self.assertEqual(5, sum(ends))
+        self.assertEqual(2, ends[digram_index.get_digram_number('om')])
+
+    def test_digram_index(self):
+        """Test that it can write and map a digram index file."""
+        word_list = ['tom', 'morrow', 'moon', 'light']
+        fingerprint = (1, 2, bytes(32))
+        with TemporaryDirectory() as temp_dir:
+            index_file = os.path.join(temp_dir, 'test.digrams')
+            digram_index.write_digram_index(word_list, index_file,
+                                            fingerprint)
+            with digram_index.DigramIndex(index_file) as test_index:
+                self.assertEqual(2, test_index['mo'])
+                self.assertEqual(0, test_index['zz'])
+                self.assertEqual(0, test_index.get('Mo', 0))
+                self.assertEqual(676, len(test_index))
+                self.assertEqual(676, len(set(test_index)))
+                self.assertFalse(test_index.positions)
+                with self.assertRaises(ValueError) as err:
+                    test_index.starts('mo')
+                self.assertEqual(DIGRAM_POSITIONS_ERROR, str(err.exception))
+            digram_index.write_digram_index(word_list, index_file,
+                                            fingerprint, positions=True)
+            with digram_index.DigramIndex(index_file) as test_index:
+                self.assertEqual(2, test_index['mo'])
+                self.assertTrue(test_index.positions)
+                self.assertEqual(2, test_index.starts('mo'))
+                self.assertEqual(0, test_index.ends('mo'))
+                self.assertEqual(1, test_index.ends('om'))
+            # Test that it checks the word dictionary file.
+            dict_file = os.path.join(temp_dir, 'dictionary.txt')
+            with open(dict_file, 'w') as file:
+                file.write('tom\n')
+            with self.assertRaises(ValueError) as err:
+                digram_index.DigramIndex(index_file, dict_file)
+            self.assertEqual(STALE_DIGRAM_INDEX_ERROR, str(err.exception))
+            # Test that it only maps index files.
+            for data in [b'', b'IPPD', b'IPPA' + bytes(2800)]:
+                with open(index_file, 'wb') as file:
+                    file.write(data)
+                with self.assertRaises(ValueError) as err:
+                    digram_index.DigramIndex(index_file)
+                self.assertEqual(READ_DIGRAM_INDEX_ERROR, str(err.exception))
+
+    def test_load_digram_index(self):
+        """Test that it writes the index file again when needed."""
+        test_dict_path = os.path.abspath('tests/data/ch02/dictionary.txt')
+        with TemporaryDirectory() as temp_dir:
+            dict_file = os.path.join(temp_dir, 'dictionary.txt')
+            copyfile(test_dict_path, dict_file)
+            cache_dir = os.path.join(temp_dir, 'cache')
+            with digram_index.load_digram_index(dict_file,
+                                                cache_dir) as test_index:
+                self.assertEqual(4, test_index['ra'])
+                self.assertFalse(test_index.positions)
+            # Test that it only writes it again for positional counts.
+            index_file = cache_files.get_cache_path(
+                dict_file, cache_dir, digram_index.INDEX_EXTENSION)
+            mtime = os.stat(index_file).st_mtime_ns
+            with digram_index.load_digram_index(dict_file,
+                                                cache_dir) as test_index:
+                self.assertEqual(mtime, os.stat(index_file).st_mtime_ns)
+            with digram_index.load_digram_index(
+                    dict_file, cache_dir, positions=True) as test_index:
+                self.assertTrue(test_index.positions)
+                self.assertEqual(4, test_index['ra'])
+            # Test that it writes it again if the dictionary changes.
+            with open(dict_file, 'a') as file:
+                file.write('\nrara\n')
+            with digram_index.load_digram_index(dict_file,
+                                                cache_dir) as test_index:
+                self.assertEqual(5, test_index['ra'])
+            # Test that it defaults to CACHE_DIR.
+            with unittest.mock.patch(
+                    'src.ch03.p1_digram_index.CACHE_DIR', cache_dir):
+                with digram_index.load_digram_index(dict_file) as test_index:
+                    self.assertEqual(5, test_index['ra'])
+            # Test that it counts in memory if it can't write the index file.
+            blocked_file = os.path.join(temp_dir, 'blocked')
+            with open(blocked_file, 'w') as file:
+                file.write('not a folder')
+            with digram_index.load_digram_index(
+                    dict_file, os.path.join(blocked_file, 'cache'),
+                    positions=True) as test_index:
+                self.assertEqual(5, test_index['ra'])
+                self.assertTrue(test_index.positions)
+            # Test that a failed write doesn't leave a temporary file.
+            with unittest.mock.patch('os.replace', side_effect=OSError):
+                with digram_index.load_digram_index(
+                        dict_file, cache_dir, positions=True) as test_index:
+                    self.assertEqual(5, test_index['ra'])
+            self.assertListEqual([os.path.basename(index_file)],
+                                 os.listdir(cache_dir))
+
+    def test_from_bytes(self):
+        """Test that it makes a digram index in memory."""
+        with TemporaryDirectory() as temp_dir:
+            index_file = os.path.join(temp_dir, 'test.digrams')
+            digram_index.write_digram_index(['ab', 'abab'], index_file,
+                                            (0, 0, bytes(32)), True)
+            with open(index_file, 'rb') as file:
+                data = file.read()
+        with digram_index.DigramIndex.from_bytes(data) as test_index:
+            self.assertEqual(2, test_index['ab'])
+            self.assertEqual(2, test_index.starts('ab'))
+            self.assertEqual(1, test_index['ba'])
+        for bad_data in [b'', data[:-1], b'x' + data[1:]]:
+            with self.assertRaises(ValueError) as err:
+                digram_index.DigramIndex.from_bytes(bad_data)
+            self.assertEqual(READ_DIGRAM_INDEX_ERROR, str(err.exception))
+
+
+class TestNgramCounter(unittest.TestCase):
+    """Test N-gram Counter."""
+
+    def test_pack_ngram(self):
+        """Test that it can pack and unpack n-grams."""
+        self.assertEqual(0, ngram_counter.pack_ngram('aaaa'))
+        self.assertEqual(26 ** 4 - 1, ngram_counter.pack_ngram('zzzz'))
+        self.assertEqual(27, ngram_counter.pack_ngram('bb'))
+        self.assertEqual(0, ngram_counter.pack_ngram(''))
+        for length in range(1, 5):
+            ngram = random_string(length, ascii_lowercase)
+            number = ngram_counter.pack_ngram(ngram)
+            self.assertLess(number, 26 ** length)
+            self.assertEqual(ngram, ngram_counter.unpack_ngram(number, length))
+        with self.assertRaises(KeyError):
+            ngram_counter.pack_ngram('The')
+
+    def test_ngram_counter(self):
+        """Test that it matches counting n-gram strings."""
+        with self.assertRaises(ValueError) as err:
+            ngram_counter.NgramCounter(5)
+        self.assertEqual(NGRAM_LENGTH_ERROR, str(err.exception))
+        with self.assertRaises(ValueError) as err:
+            ngram_counter.NgramCounter(0)
+        self.assertEqual(NGRAM_LENGTH_ERROR, str(err.exception))
+        test_list = [random_string(length, 'abcA-') for length in range(30)]
+        for length in range(1, 5):
+            test_counter = ngram_counter.NgramCounter(length, iter(test_list))
+            self.assertEqual(length, test_counter.length)
+            documents, occurrences = Counter(), Counter()
+            for word in test_list:
+                ngrams = [word[i:i + length]
+                          for i in range(len(word) - length + 1)
+                          if set(word[i:i + length]).issubset('abc')]
+                occurrences.update(ngrams)
+                documents.update(set(ngrams))
+            self.assertEqual(sum(occurrences.values()), test_counter.total)
+            for ngram in occurrences:
+                self.assertEqual(documents[ngram],
+                                 test_counter.documents(ngram))
+                self.assertEqual(occurrences[ngram],
+                                 test_counter.occurrences(ngram))
+            self.assertEqual(0, test_counter.occurrences('z' * length))
+            self.assertListEqual(
+                sorted(occurrences.items(), key=lambda x: (-x[1], x[0])),
+                test_counter.most_common())
+        # Test that digrams match the digram table.
+        test_counter = ngram_counter.NgramCounter(2, test_list)
+        digram_table = digram_counter.get_digram_table(test_list)
+        for digram in digram_counter.get_digrams('abcabc'):
+            self.assertEqual(digram_table[digram],
+                             test_counter.documents(digram))
+        # Test that it adds to the counts.
+        test_counter = ngram_counter.NgramCounter(3, ['banana'])
+        test_counter.update(['bandana'])
+        self.assertEqual(2, test_counter.documents('ana'))
+        self.assertEqual(3, test_counter.occurrences('ana'))
+        self.assertListEqual([('ana', 3), ('ban', 2)],
+                             test_counter.most_common(2))
+        # Test n-grams of the wrong length or with other characters.
+        for ngram in ['an', 'anan', '', 'AnA', 'a-a', 'an\u00e1']:
+            for count in [test_counter.documents, test_counter.occurrences]:
+                with self.assertRaises(ValueError) as err:
+                    count(ngram)
+                self.assertEqual(NGRAM_ERROR, str(err.exception))
+
+    def test_fitness(self):
+        """Test that it scores text with common n-grams higher."""
+        dict_file = os.path.abspath('tests/data/ch03/dictionary.txt')
+        test_counter = ngram_counter.NgramCounter(
+            4, cleanup_list_more(cleanup_dict(dict_file)))
+        self.assertGreater(test_counter.fitness('see shells'),
+                           test_counter.fitness('ees sllehs'))
+        self.assertAlmostEqual(test_counter.fitness('seashells'),
+                               test_counter.fitness('sea-shells!'))
+        self.assertEqual(0, test_counter.fitness('sea'))
+        # Test that n-grams never counted get the floor.
+        floor = 2 * math.log10(0.01 / test_counter.total)
+        self.assertAlmostEqual(floor, test_counter.fitness('zzzzz'))
+        self.assertAlmostEqual(2 * math.log10(0.01),
+                               ngram_counter.NgramCounter(4).fitness('qqqqq'))
+
+
 class TestAnagramGenerator(unittest.TestCase):
     """Test Anagram Generator."""
 
@@ -110,6 +472,24 @@ class TestAnagramGenerator(unittest.TestCase):
             actual_id *= LETTER_PRIME_DICT[letter]
         self.assertEqual(actual_id, test_string_id)
 
+    def test_get_ids(self):
+        """Test that it can convert a list of words to IDs."""
+        self.assertDictEqual(LETTER_PRIME_DICT, anagram_generator.LETTER_PRIMES)
+        test_list = [random_string(length, ascii_lowercase)
+                     for length in range(15)]
+        test_ids = anagram_generator.get_ids(test_list)
+        self.assertListEqual([anagram_generator.get_id(word) for word in test_list],
+                             test_ids)
+        self.assertListEqual([], anagram_generator.get_ids([]))
+
+    def test_benchmark_get_id(self):
+        """Test that it can time getting IDs."""
+        test_times = anagram_benchmark.benchmark_get_id(['test', 'me'])
+        self.assertListEqual(['letter_table', 'get_id', 'get_ids'],
+                             list(test_times))
+        for time in test_times.values():
+            self.assertGreater(time, 0)
+
     def test_get_anagram_dict(self):
         """Test that it can make an anagram dictionary."""
         # Test a single element list.
@@ -127,6 +507,12 @@ class TestAnagramGenerator(unittest.TestCase):
         test_list = ['sett', 'test', 'me', 'pls']
         test_dict = anagram_generator.get_anagram_dict(test_list)
         self.assertDictEqual(dictionary, test_dict)
+        # Test that a generator isn't used up before it is added.
+        test_dict = anagram_generator.get_anagram_dict(
+            word for word in test_list)
+        self.assertDictEqual(dictionary, test_dict)
+        test_dict = anagram_generator.get_anagram_dict(tuple(test_list))
+        self.assertDictEqual(dictionary, test_dict)
 
     def test_split(self):
         """Test that it can split a list."""
@@ -184,6 +570,75 @@ class TestAnagramGenerator(unittest.TestCase):
         test_dict = anagram_generator.multi_get_anagram_dict(test_list)
         self.assertDictEqual(dictionary, test_dict)
 
+    def test_pool_get_anagram_dict(self):
+        """Test that it can make an anagram dictionary with processes."""
+        # Test a multiple element list with different IDs.
+        dictionary = {3715217: ['sett', 'test'], 451: ['me'], 131387: ['pls']}
+        test_list = ['sett', 'test', 'me', 'pls']
+        test_dict = anagram_generator.pool_get_anagram_dict(test_list)
+        self.assertDictEqual(dictionary, test_dict)
+        # Test that it matches get_anagram_dict with more workers than words.
+        dict_file = os.path.abspath('tests/data/ch03/dictionary.txt')
+        word_list = cleanup_list_more(cleanup_dict(dict_file))
+        test_dict = anagram_generator.pool_get_anagram_dict(word_list, 3)
+        self.assertDictEqual(anagram_generator.get_anagram_dict(word_list),
+                             test_dict)
+        test_dict = anagram_generator.pool_get_anagram_dict(test_list, 8)
+        self.assertDictEqual(dictionary, test_dict)
+
+    def test_benchmark_anagram_dict(self):
+        """Test that it can time each anagram dictionary builder."""
+        test_times = anagram_benchmark.benchmark_anagram_dict(['test', 'me'],
+                                                              workers=2)
+        self.assertListEqual(['get_anagram_dict', 'multi_get_anagram_dict',
+                              'pool_get_anagram_dict'], list(test_times))
+        for time in test_times.values():
+            self.assertGreater(time, 0)
+
+    @unittest.mock.patch('sys.stdout', new_callable=StringIO)
+    def test_benchmark_main(self, mock_stdout):
+        """Test that it benchmarks a word dictionary file."""
+        dict_file = 'tests/data/ch03/dictionary.txt'
+        word_count = len(cleanup_list_more(cleanup_dict(dict_file)))
+        with unittest.mock.patch('src.ch03.c1_anagram_benchmark.timeit',
+                                 return_value=0.5) as mock_timeit:
+            anagram_benchmark.main([dict_file, '--number', '2', '--words',
+                                    'tests'])
+            self.assertTrue(all(call[1] == {'number': 2}
+                                for call in mock_timeit.call_args_list))
+            # Test that it defaults to DICTIONARY_FILE_PATH.
+            with unittest.mock.patch(
+                    'src.ch03.c1_anagram_benchmark.DICTIONARY_FILE_PATH',
+                    dict_file):
+                anagram_benchmark.main()
+
+        def get_output(time, words):
+            per_word = f'{time / word_count:.6g}'
+            per_search = f'{time / words:.6g}'
+            return (f'Benchmarking with {word_count} words from '
+                    f'{dict_file}.\n'
+                    f'\n'
+                    f'Getting IDs, per word:\n'
+                    f'  letter_table  {per_word} s\n'
+                    f'  get_id        {per_word} s\n'
+                    f'  get_ids       {per_word} s\n'
+                    f'\n'
+                    f'Anagram dictionary builders:\n'
+                    f'  get_anagram_dict        {time:.6g} s\n'
+                    f'  multi_get_anagram_dict  {time:.6g} s\n'
+                    f'  pool_get_anagram_dict   {time:.6g} s\n'
+                    f'\n'
+                    f'Finding IDs IN words by encoding, per word:\n'
+                    f'  prime   {per_search} s\n'
+                    f'  mask    {per_search} s\n'
+                    f'  vector  {per_search} s\n')
+
+        # Each run takes 0.25 seconds with --number 2, then 0.5 seconds
+        # with the defaults, which find IDs IN BENCHMARK_WORDS.
+        self.assertEqual(get_output(0.25, 1) + get_output(
+            0.5, len(anagram_benchmark.BENCHMARK_WORDS)),
+                         mock_stdout.getvalue())
+
     def test_find_anagrams(self):
         """Test that it can find anagrams with a word or phrase."""
         dict_file = os.path.abspath('tests/data/ch03/dictionary.txt')
@@ -209,11 +664,90 @@ class TestAnagramGenerator(unittest.TestCase):
         test_list = anagram_generator.find_anagrams('Jose', anagram_dict)
         self.assertListEqual(anagrams, test_list)
 
+    def test_get_mask(self):
+        """Test that it can get the letter mask of a word."""
+        self.assertEqual(0, anagram_generator.get_mask(''))
+        self.assertEqual(0b111, anagram_generator.get_mask('cab'))
+        self.assertEqual(1 << 25 | 1, anagram_generator.get_mask('zaz'))
+        test_string = random_string(30, ascii_lowercase)
+        mask = 0
+        for letter in set(test_string):
+            mask |= 1 << ascii_lowercase.index(letter)
+        self.assertEqual(mask, anagram_generator.get_mask(test_string))
+
+    def test_anagram_masks(self):
+        """Test that it finds the same IDs as the modulo check."""
+        dict_file = os.path.abspath('tests/data/ch03/dictionary.txt')
+        word_list = cleanup_list_more(cleanup_dict(dict_file))
+        anagram_dict = anagram_generator.get_anagram_dict(word_list)
+        anagram_masks = anagram_generator.AnagramMasks(anagram_dict)
+        # Test that it acts like the anagram dictionary.
+        self.assertDictEqual(anagram_dict, dict(anagram_masks))
+        self.assertEqual(len(anagram_dict), len(anagram_masks))
+        for key, words in anagram_dict.items():
+            self.assertEqual(anagram_generator.get_mask(words[0]),
+                             anagram_masks.masks[key])
+        for word in ['ttr', 'test', 'tiptap', 'jose', 'seeshells', 'aardvark']:
+            id_num = anagram_generator.get_id(word)
+            keys = [key for key in anagram_dict if id_num % key == 0]
+            self.assertListEqual(keys, anagram_masks.find_keys(word))
+        # Test that pruning keeps the letter masks.
+        test_dict = anagram_generator.remove_unusable_words(anagram_masks,
+                                                            list('test'))
+        self.assertIsInstance(test_dict, anagram_generator.AnagramMasks)
+        self.assertDictEqual({key: anagram_masks.masks[key] for key in test_dict},
+                             test_dict.masks)
+        # Test that it can reuse letter masks.
+        anagram_masks = anagram_generator.AnagramMasks({451: ['me']}, {451: 7, 2: 1})
+        self.assertDictEqual({451: 7}, anagram_masks.masks)
+        # Test that it doesn't skip empty entries.
+        anagram_masks = anagram_generator.AnagramMasks({451: []})
+        self.assertListEqual([451], anagram_masks.find_keys('me'))
+
+    def test_anagram_index(self):
+        """Test that it can index an anagram dictionary."""
+        dict_file = os.path.abspath('tests/data/ch03/dictionary.txt')
+        word_list = cleanup_list_more(cleanup_dict(dict_file))
+        anagram_dict = anagram_generator.get_anagram_dict(word_list)
+        anagram_index = anagram_generator.AnagramIndex(anagram_dict)
+        # Test that it acts like the anagram dictionary.
+        self.assertDictEqual(anagram_dict, dict(anagram_index))
+        self.assertEqual(len(anagram_dict), len(anagram_index))
+        self.assertListEqual(['sett', 'test'],
+                             anagram_generator.AnagramIndex(
+                                 {3715217: ['sett', 'test']})[3715217])
+        # Test that it finds the same IDs as the modulo check.
+        for word in ['ttr', 'test', 'tiptap', 'jose', 'seeshells', 'aardvark']:
+            id_num = anagram_generator.get_id(word)
+            keys = sorted(key for key in anagram_dict if id_num % key == 0)
+            self.assertListEqual(keys, sorted(anagram_index.find_keys(word)))
+        # Test that it respects repeated letters.
+        self.assertNotIn(3715217, anagram_index.find_keys('tes'))
+        # Test that it skips empty entries.
+        anagram_index = anagram_generator.AnagramIndex({451: []})
+        self.assertListEqual([], anagram_index.find_keys('me'))
+
+    def test_find_anagrams_index(self):
+        """Test that it can find anagrams with an anagram index."""
+        dict_file = os.path.abspath('tests/data/ch03/dictionary.txt')
+        word_list = cleanup_list_more(cleanup_dict(dict_file))
+        anagram_dict = anagram_generator.get_anagram_dict(word_list)
+        anagram_index = anagram_generator.AnagramIndex(anagram_dict)
+        for word in ['ttr', 'test', 'tip tap', 'Jose']:
+            self.assertListEqual(
+                anagram_generator.find_anagrams(word, anagram_dict),
+                anagram_generator.find_anagrams(word, anagram_index))
+
     def test_remove_unusable_words(self):
         """Test that it can prune an anagram dictionary."""
         dictionary = {3715217: ['sett', 'test'], 451: ['me'], 131387: ['pls']}
         test_dict = anagram_generator.remove_unusable_words(dictionary, list('test'))
         self.assertDictEqual({3715217: ['sett', 'test']}, test_dict)
+        # Test that it keeps an anagram index.
+        anagram_index = anagram_generator.AnagramIndex(dictionary)
+        test_dict = anagram_generator.remove_unusable_words(anagram_index, list('test'))
+        self.assertIsInstance(test_dict, anagram_generator.AnagramIndex)
+        self.assertDictEqual({3715217: ['sett', 'test']}, dict(test_dict))
 
     def test_find_anagram_phrases(self):
         """Test that it can find anagram phrases."""
@@ -228,19 +762,271 @@ class TestAnagramGenerator(unittest.TestCase):
         # Test a phrase with four anagram phrases.
         anagram_generator.find_anagram_phrases(phrases, 'a cat', anagram_dict, phrase)
         self.assertListEqual(['a act', 'a cat', 'act a', 'cat a'], phrases)
+        # Test that an anagram index finds the same phrases.
+        phrases = []
+        anagram_index = anagram_generator.AnagramIndex(anagram_dict)
+        anagram_generator.find_anagram_phrases(phrases, 'a cat', anagram_index, phrase)
+        self.assertListEqual(['a act', 'a cat', 'act a', 'cat a'], phrases)
+
+    def test_iter_anagram_phrases(self):
+        """Test that it can iterate over anagram phrases."""
+        dict_file = os.path.abspath('tests/data/ch03/dictionary.txt')
+        word_list = cleanup_list_more(cleanup_dict(dict_file))
+        anagram_dict = anagram_generator.get_anagram_dict(word_list)
+        # Test a word without anagrams.
+        test_iter = anagram_generator.iter_anagram_phrases('ttr', anagram_dict)
+        self.assertListEqual([], list(test_iter))
+        # Test that it matches find_anagram_phrases.
+        for word in ['a cat', 'See Shells', 'tip tap', 'jose']:
+            phrases = []
+            anagram_generator.find_anagram_phrases(phrases, word.lower(),
+                                                   anagram_dict, [])
+            test_iter = anagram_generator.iter_anagram_phrases(word,
+                                                               anagram_dict)
+            self.assertListEqual(phrases, list(test_iter))
+        # Test that it yields phrases one at a time.
+        test_iter = anagram_generator.iter_anagram_phrases('a cat', anagram_dict)
+        self.assertEqual('a act', next(test_iter))
+        self.assertEqual('a cat', next(test_iter))
+        test_iter.close()
+        self.assertIsNone(next(test_iter, None))
+        # Test that it stops at the limit.
+        test_iter = anagram_generator.iter_anagram_phrases('a cat', anagram_dict,
+                                                           limit=3)
+        self.assertListEqual(['a act', 'a cat', 'act a'], list(test_iter))
+        test_iter = anagram_generator.iter_anagram_phrases('a cat', anagram_dict,
+                                                           limit=0)
+        self.assertListEqual([], list(test_iter))
+
+    def test_iter_anagram_phrases_canonical(self):
+        """Test that it can skip other orders of the same words."""
+        dict_file = os.path.abspath('tests/data/ch03/dictionary.txt')
+        word_list = cleanup_list_more(cleanup_dict(dict_file))
+        anagram_dict = anagram_generator.get_anagram_dict(word_list)
+        test_iter = anagram_generator.iter_anagram_phrases(
+            'a cat', anagram_dict, canonical=True)
+        self.assertListEqual(['a act', 'a cat'], list(test_iter))
+        # Test that permuting gets back every phrase.
+        for word in ['a cat', 'see shells', 'tip tap', 'tia tip tap']:
+            phrases = anagram_generator.iter_anagram_phrases(word, anagram_dict)
+            test_iter = anagram_generator.iter_anagram_phrases(
+                word, anagram_dict, canonical=True)
+            test_phrases = list(test_iter)
+            for phrase in test_phrases:
+                self.assertListEqual(sorted(phrase.split()), phrase.split())
+            self.assertListEqual(
+                sorted(phrases),
+                sorted(anagram_generator.permute_phrases(test_phrases)))
+
+    def test_iter_anagram_phrases_cache(self):
+        """Test that it finds the same phrases with a cache."""
+        dict_file = os.path.abspath('tests/data/ch03/dictionary.txt')
+        word_list = cleanup_list_more(cleanup_dict(dict_file))
+        anagram_dict = anagram_generator.get_anagram_dict(word_list)
+        for word in ['a cat', 'see shells', 'tia tip tap']:
+            for canonical in [False, True]:
+                phrases = list(anagram_generator.iter_anagram_phrases(
+                    word, anagram_dict, canonical=canonical))
+                # Test that tiny caches still find the same phrases.
+                for maxsize in [1, 1024]:
+                    for completions in [False, True]:
+                        cache = anagram_memo.LetterCache(maxsize, completions)
+                        test_iter = anagram_generator.iter_anagram_phrases(
+                            word, anagram_dict, canonical=canonical,
+                            cache=cache)
+                        self.assertListEqual(phrases, list(test_iter))
+                        self.assertLessEqual(len(cache), maxsize)
+        # Test that letters left by different orders are only searched once.
+        cache = anagram_memo.LetterCache()
+        test_iter = anagram_generator.iter_anagram_phrases(
+            'tia tip tap', anagram_dict, cache=cache)
+        self.assertEqual(824, len(list(test_iter)))
+        hits, misses, _, currsize = cache.cache_info()
+        self.assertEqual(misses, currsize)
+        self.assertGreater(hits, misses)
+        # Test that it reuses the cache for the next search.
+        test_iter = anagram_generator.iter_anagram_phrases(
+            'tia tip tap', anagram_dict, cache=cache)
+        self.assertEqual(824, len(list(test_iter)))
+        self.assertEqual(misses, cache.cache_info().misses)
+        # Test that it reuses completions of the letters left.
+        cache = anagram_memo.LetterCache(completions=True)
+        test_iter = anagram_generator.iter_anagram_phrases(
+            'tia tip tap', anagram_dict, limit=1, cache=cache)
+        self.assertListEqual(['a a pit pitt'], list(test_iter))
+        misses = cache.cache_info().misses
+        test_iter = anagram_generator.iter_anagram_phrases(
+            'tia tip tap', anagram_dict, cache=cache)
+        self.assertEqual(824, len(list(test_iter)))
+        self.assertEqual(misses, cache.cache_info().misses)
+
+    def test_pool_iter_anagram_phrases(self):
+        """Test that it can iterate over anagram phrases with processes."""
+        dict_file = os.path.abspath('tests/data/ch03/dictionary.txt')
+        word_list = cleanup_list_more(cleanup_dict(dict_file))
+        anagram_dict = anagram_generator.get_anagram_dict(word_list)
+        # Test that it matches iter_anagram_phrases in the same order.
+        for word in ['ttr', 'a cat', 'see shells', 'tia tip tap']:
+            for canonical in [False, True]:
+                phrases = anagram_generator.iter_anagram_phrases(
+                    word, anagram_dict, canonical=canonical)
+                test_iter = anagram_generator.pool_iter_anagram_phrases(
+                    word, anagram_dict, 2, canonical=canonical)
+                self.assertListEqual(list(phrases), list(test_iter))
+        # Test that it stops at the limit.
+        test_iter = anagram_generator.pool_iter_anagram_phrases(
+            'tia tip tap', anagram_dict, 2, limit=5)
+        phrases = anagram_generator.iter_anagram_phrases(
+            'tia tip tap', anagram_dict, limit=5)
+        self.assertListEqual(list(phrases), list(test_iter))
+        # Test that it can stop early.
+        test_iter = anagram_generator.pool_iter_anagram_phrases(
+            'tia tip tap', anagram_dict, 2)
+        self.assertEqual('a a pit pitt', next(test_iter, None))
+        test_iter.close()
+        self.assertIsNone(next(test_iter, None))
+        # Test that it sends the anagram index once to each process.
+        with unittest.mock.patch(
+                'src.ch03.c1_anagram_generator.ProcessPoolExecutor',
+                wraps=ProcessPoolExecutor) as mock_executor:
+            test_iter = anagram_generator.pool_iter_anagram_phrases(
+                'a cat', anagram_dict, 2)
+            self.assertListEqual(['a act', 'a cat', 'act a', 'cat a'],
+                                 list(test_iter))
+        kwargs = mock_executor.call_args[1]
+        self.assertEqual(anagram_generator._init_search_task,
+                         kwargs['initializer'])
+        self.assertIsInstance(kwargs['initargs'][0],
+                              anagram_generator.AnagramIndex)
+
+    def test_search_phrase_task(self):
+        """Test that it searches with the anagram index of its process."""
+        anagram_dict = anagram_generator.AnagramIndex(
+            anagram_generator.get_anagram_dict(['a', 'act', 'cat']))
+        with unittest.mock.patch(
+                'src.ch03.c1_anagram_generator._TASK_INDEX', None):
+            anagram_generator._init_search_task(anagram_dict)
+            test_phrases = anagram_generator._search_phrase_task(
+                Counter('acat'), ['act'], False)
+        self.assertListEqual(['act a'], test_phrases)
+
+    def test_split_phrases(self):
+        """Test that it splits big searches first."""
+        anagram_dict = anagram_generator.AnagramIndex(
+            anagram_generator.get_anagram_dict(['a', 'at', 'cat', 'act']))
+        letters = Counter('acat')
+        test_phrases = anagram_generator._split_phrases(
+            letters, anagram_dict, False, 1)
+        self.assertListEqual([[]], test_phrases)
+        test_phrases = anagram_generator._split_phrases(
+            letters, anagram_dict, False, 3)
+        self.assertListEqual([['a'], ['act'], ['at'], ['cat']], test_phrases)
+        test_phrases = anagram_generator._split_phrases(
+            letters, anagram_dict, False, 5)
+        self.assertListEqual([['a', 'a'], ['a', 'act'], ['a', 'at'],
+                              ['a', 'cat'], ['act'], ['at'], ['cat']],
+                             test_phrases)
+        test_phrases = anagram_generator._split_phrases(
+            letters, anagram_dict, False, 100)
+        self.assertListEqual([['a', 'act'], ['a', 'cat'], ['act', 'a'],
+                              ['cat', 'a']], test_phrases)
+        test_phrases = anagram_generator._split_phrases(
+            Counter('xyz'), anagram_dict, False, 100)
+        self.assertListEqual([], test_phrases)
+
+    def test_permute_phrases(self):
+        """Test that it can permute the words of phrases."""
+        test_list = list(anagram_generator.permute_phrases(['a act', 'a cat']))
+        self.assertListEqual(['a act', 'act a', 'a cat', 'cat a'], test_list)
+        # Test that it skips repeated orders.
+        test_list = list(anagram_generator.permute_phrases(['a a at']))
+        self.assertListEqual(['a a at', 'a at a', 'at a a'], test_list)
+        self.assertListEqual([], list(anagram_generator.permute_phrases([])))
+
+    def test_cached_anagram_dict(self):
+        """Test that it can build and reuse an anagram dictionary cache."""
+        with TemporaryDirectory() as cache_dir:
+            dict_file = os.path.join(cache_dir, 'dictionary.txt')
+            copyfile('tests/data/ch03/dictionary.txt', dict_file)
+            word_list = cleanup_list_more(cleanup_dict(dict_file))
+            anagram_dict = anagram_generator.get_anagram_dict(word_list)
+            # Test that it builds the cache file.
+            test_dict = anagram_generator.cached_anagram_dict(dict_file,
+                                                              cache_dir)
+            self.assertDictEqual(anagram_dict, test_dict)
+            cache_file = cache_files.get_cache_path(
+                dict_file, cache_dir, anagram_cache.CACHE_EXTENSION)
+            self.assertTrue(os.path.isfile(cache_file))
+            # Test that it reads the cache file instead of rebuilding.
+            with unittest.mock.patch(
+                    'src.ch03.c1_anagram_generator.pool_get_anagram_dict') \
+                    as mock_builder:
+                test_dict = anagram_generator.cached_anagram_dict(dict_file,
+                                                                  cache_dir)
+                mock_builder.assert_not_called()
+            self.assertDictEqual(anagram_dict, test_dict)
+            # Test that it rebuilds when the word dictionary changes.
+            with open(dict_file, 'a') as file:
+                file.write('\ntacos\n')
+            test_dict = anagram_generator.cached_anagram_dict(dict_file,
+                                                              cache_dir)
+            self.assertIn(['tacos'], test_dict.values())
+            # Test that it rebuilds a corrupted cache file.
+            with open(cache_file, 'wb') as file:
+                file.write(b'not a cache')
+            test_dict = anagram_generator.cached_anagram_dict(dict_file,
+                                                              cache_dir)
+            self.assertIn(['tacos'], test_dict.values())
 
     @unittest.mock.patch('src.ch03.c1_anagram_generator.DICTIONARY_FILE_PATH', 'tests/data/ch03/dictionary.txt')
     def test_anagram_generator(self):
         """Test that it can also find anagram phrases."""
         phrases = ['a act', 'a cat', 'act a', 'cat a']
-        test_phrases = anagram_generator.anagram_generator('a cat')
-        self.assertListEqual(phrases, test_phrases)
+        with TemporaryDirectory() as cache_dir:
+            test_phrases = anagram_generator.anagram_generator('a cat',
+                                                               cache_dir)
+            self.assertListEqual(phrases, test_phrases)
+            # Test that it stops at the limit.
+            test_phrases = anagram_generator.anagram_generator('a cat',
+                                                               cache_dir, 2)
+            self.assertListEqual(phrases[:2], test_phrases)
+            # Test canonical phrases with and without permuting.
+            test_phrases = anagram_generator.anagram_generator(
+                'a cat', cache_dir, canonical=True)
+            self.assertListEqual(['a act', 'a cat'], test_phrases)
+            test_phrases = anagram_generator.anagram_generator(
+                'a cat', cache_dir, canonical=True, permute=True)
+            self.assertListEqual(['a act', 'act a', 'a cat', 'cat a'],
+                                 test_phrases)
+            # Test searching with processes.
+            test_phrases = anagram_generator.anagram_generator(
+                'a cat', cache_dir, workers=2)
+            self.assertListEqual(phrases, test_phrases)
+            # Test searching with letter count vectors and letter masks.
+            for encoding in ['vector', 'mask']:
+                # Test that the search uses the encoding, not the trie.
+                with unittest.mock.patch.object(
+                        anagram_generator.AnagramIndex,
+                        'find_keys') as mock_find_keys:
+                    test_phrases = anagram_generator.anagram_generator(
+                        'a cat', cache_dir, encoding=encoding)
+                mock_find_keys.assert_not_called()
+                self.assertListEqual(phrases, test_phrases)
+                test_phrases = anagram_generator.anagram_generator(
+                    'a cat', cache_dir, workers=2, encoding=encoding)
+                self.assertListEqual(phrases, test_phrases)
+            with self.assertRaises(ValueError) as err:
+                anagram_generator.anagram_generator('a cat', cache_dir,
+                                                    encoding='morse')
+            self.assertEqual(ENCODING_ERROR, str(err.exception))
 
     @unittest.mock.patch('sys.stdout', new_callable=StringIO)
     @unittest.mock.patch('src.ch03.c1_anagram_generator.DICTIONARY_FILE_PATH', 'tests/data/ch03/dictionary.txt')
     def test_main(self, mock_stdout):
         """Test demo main function."""
-        anagram_generator.main()
+        with TemporaryDirectory() as cache_dir, unittest.mock.patch(
+                'src.ch03.c1_anagram_generator.ANAGRAM_CACHE_DIR', cache_dir):
+            anagram_generator.main()
         # Test printed output.
         with open(os.path.normpath('tests/data/ch03/main/anagram_generator.txt'),
                   'r') as file:
@@ -248,5 +1034,267 @@ class TestAnagramGenerator(unittest.TestCase):
         self.assertEqual(mock_stdout.getvalue(), file_data)
 
 
+class TestAnagramVectors(unittest.TestCase):
+    """Test Anagram Vectors."""
+
+    def test_get_counts(self):
+        """Test that it can count letters of a word."""
+        test_counts = anagram_vectors.get_counts('abracadabra')
+        counts = [5, 2, 1, 1] + [0] * 13 + [2] + [0] * 8
+        self.assertListEqual(counts, test_counts.tolist())
+        self.assertListEqual([0] * 26, anagram_vectors.get_counts('').tolist())
+
+    def test_get_count_matrix(self):
+        """Test that it can count letters of a list of words."""
+        test_list = [random_string(length, ascii_lowercase)
+                     for length in range(15)]
+        test_matrix = anagram_vectors.get_count_matrix(test_list)
+        self.assertEqual((15, 26), test_matrix.shape)
+        self.assertEqual('uint8', test_matrix.dtype.name)
+        for word, row in zip(test_list, test_matrix):
+            self.assertListEqual(anagram_vectors.get_counts(word).tolist(),
+                                 row.tolist())
+        self.assertEqual((0, 26), anagram_vectors.get_count_matrix([]).shape)
+
+    def test_anagram_matrix(self):
+        """Test that it finds the same IDs as the modulo check."""
+        dict_file = os.path.abspath('tests/data/ch03/dictionary.txt')
+        word_list = cleanup_list_more(cleanup_dict(dict_file))
+        anagram_dict = anagram_generator.get_anagram_dict(word_list)
+        anagram_matrix = anagram_vectors.AnagramMatrix(anagram_dict)
+        # Test that it acts like the anagram dictionary.
+        self.assertDictEqual(anagram_dict, dict(anagram_matrix))
+        self.assertEqual(len(anagram_dict), len(anagram_matrix))
+        for word in ['ttr', 'test', 'tiptap', 'jose', 'seeshells', 'aardvark']:
+            id_num = anagram_generator.get_id(word)
+            keys = sorted(key for key in anagram_dict if id_num % key == 0)
+            self.assertListEqual(keys, sorted(anagram_matrix.find_keys(word)))
+        # Test that it works with find_anagrams and remove_unusable_words.
+        self.assertListEqual(
+            ['a', 'apt', 'at', 'i', 'it', 'pap', 'pat', 'patti', 'pip', 'pit',
+             'pita', 'pitt', 'tap', 'tat', 'tia', 'tip', 'tit'],
+            anagram_generator.find_anagrams('tip tap', anagram_matrix))
+        test_dict = anagram_generator.remove_unusable_words(anagram_matrix,
+                                                            list('test'))
+        self.assertIsInstance(test_dict, anagram_vectors.AnagramMatrix)
+        self.assertListEqual(['set', 'test', 'tet'],
+                             sorted(word for words in test_dict.values()
+                                    for word in words))
+        # Test that it skips empty entries.
+        anagram_matrix = anagram_vectors.AnagramMatrix({451: []})
+        self.assertListEqual([], anagram_matrix.find_keys('me'))
+
+    def test_benchmark_encodings(self):
+        """Test that it can time each encoding."""
+        test_times = anagram_benchmark.benchmark_encodings(['test', 'me'],
+                                                           ['tests'])
+        self.assertListEqual(['prime', 'mask', 'vector'], list(test_times))
+        for time in test_times.values():
+            self.assertGreater(time, 0)
+
+
+class TestAnagramMemo(unittest.TestCase):
+    """Test Anagram Memo."""
+
+    def test_get_signature(self):
+        """Test that it can sort letters."""
+        self.assertEqual('ehllss', anagram_memo.get_signature('shells'))
+        self.assertEqual('ehllss',
+                         anagram_memo.get_signature(Counter('shells')))
+        # Test that it skips used letters.
+        letters = Counter('shells')
+        letters.subtract('sell')
+        self.assertEqual('hs', anagram_memo.get_signature(letters))
+        self.assertEqual('', anagram_memo.get_signature(Counter()))
+
+    def test_letter_cache(self):
+        """Test that it forgets the least recently used key."""
+        cache = anagram_memo.LetterCache(maxsize=2)
+        self.assertEqual(2, cache.maxsize)
+        self.assertFalse(cache.completions)
+        self.assertIsNone(cache.get('a'))
+        cache.put('a', ('a',))
+        cache.put('act', ('a', 'act', 'at', 'cat'))
+        self.assertTupleEqual(('a',), cache.get('a'))
+        # Test that 'act' is forgotten since 'a' was used more recently.
+        cache.put('at', ('a', 'at'))
+        self.assertEqual(2, len(cache))
+        self.assertIsNone(cache.get('act'))
+        self.assertTupleEqual(('a', 'at'), cache.get('at'))
+        self.assertTupleEqual(
+            anagram_memo.CacheInfo(hits=2, misses=2, maxsize=2, currsize=2),
+            cache.cache_info())
+        # Test that it replaces the value of a key.
+        cache.put('at', ('at',))
+        self.assertTupleEqual(('at',), cache.get('at'))
+        self.assertEqual(2, len(cache))
+        # Test that it can forget everything.
+        cache.clear()
+        self.assertEqual(0, len(cache))
+        self.assertTupleEqual(
+            anagram_memo.CacheInfo(hits=0, misses=0, maxsize=2, currsize=0),
+            cache.cache_info())
+        self.assertTrue(anagram_memo.LetterCache(completions=True).completions)
+
+
+class TestCacheFiles(unittest.TestCase):
+    """Test Cache Files."""
+
+    def test_get_fingerprint(self):
+        """Test that it can fingerprint a file."""
+        dict_file = os.path.abspath('tests/data/ch03/dictionary.txt')
+        size, mtime, digest = cache_files.get_fingerprint(dict_file)
+        self.assertEqual(os.path.getsize(dict_file), size)
+        self.assertEqual(os.stat(dict_file).st_mtime_ns, mtime)
+        self.assertEqual(32, len(digest))
+        self.assertTrue(cache_files.is_fresh(dict_file, (size, mtime, digest)))
+
+    def test_is_fresh(self):
+        """Test that it can tell if a file changed."""
+        with TemporaryDirectory() as temp_dir:
+            dict_file = os.path.join(temp_dir, 'dictionary.txt')
+            with open(dict_file, 'w') as file:
+                file.write('test\n')
+            fingerprint = cache_files.get_fingerprint(dict_file)
+            # Test that touching without changing is still fresh.
+            os.utime(dict_file, ns=(0, 0))
+            self.assertTrue(cache_files.is_fresh(dict_file, fingerprint))
+            # Test that same size, different contents is stale.
+            with open(dict_file, 'w') as file:
+                file.write('sett\n')
+            self.assertFalse(cache_files.is_fresh(dict_file, fingerprint))
+            # Test that a different size is stale.
+            with open(dict_file, 'w') as file:
+                file.write('tests\n')
+            self.assertFalse(cache_files.is_fresh(dict_file, fingerprint))
+
+    def test_get_cache_path(self):
+        """Test that each word dictionary gets its own cache file."""
+        path1 = cache_files.get_cache_path('dictionary.txt', 'cache',
+                                           'anagrams')
+        path2 = cache_files.get_cache_path('other.txt', 'cache', 'anagrams')
+        self.assertNotEqual(path1, path2)
+        self.assertEqual('cache', os.path.dirname(path1))
+        self.assertEqual(path1, cache_files.get_cache_path(
+            os.path.abspath('dictionary.txt'), 'cache', 'anagrams'))
+        # Test that each kind of cache file gets its own cache file.
+        path3 = cache_files.get_cache_path('dictionary.txt', 'cache',
+                                           'digrams')
+        self.assertTrue(path1.endswith('.anagrams'))
+        self.assertTrue(path3.endswith('.digrams'))
+        self.assertEqual(os.path.splitext(path1)[0],
+                         os.path.splitext(path3)[0])
+
+    def test_write_cache_file(self):
+        """Test that it can write a cache file."""
+        with TemporaryDirectory() as temp_dir:
+            cache_file = os.path.join(temp_dir, 'test.cache')
+            cache_files.write_cache_file(b'test', cache_file)
+            with open(cache_file, 'rb') as file:
+                self.assertEqual(b'test', file.read())
+            # Test that it replaces the cache file.
+            cache_files.write_cache_file(b'sett', cache_file)
+            with open(cache_file, 'rb') as file:
+                self.assertEqual(b'sett', file.read())
+            # Test that a failed write doesn't leave a temporary file.
+            with unittest.mock.patch('os.replace', side_effect=OSError):
+                with self.assertRaises(OSError):
+                    cache_files.write_cache_file(b'tests', cache_file)
+            self.assertListEqual(['test.cache'], os.listdir(temp_dir))
+            with open(cache_file, 'rb') as file:
+                self.assertEqual(b'sett', file.read())
+
+    def test_load_cache_file(self):
+        """Test that it reads a cache file or builds it again."""
+        def read(cache_file, dict_file):
+            with open(cache_file, 'rb') as file:
+                data = file.read()
+            with open(dict_file, 'rb') as file:
+                if data != b'built ' + file.read():
+                    raise ValueError('stale')
+            return 'read'
+
+        def build(fingerprint):
+            self.assertTupleEqual(cache_files.get_fingerprint(dict_file),
+                                  fingerprint)
+            with open(dict_file, 'rb') as file:
+                return 'built', b'built ' + file.read()
+
+        with TemporaryDirectory() as temp_dir:
+            dict_file = os.path.join(temp_dir, 'dictionary.txt')
+            with open(dict_file, 'w') as file:
+                file.write('test\n')
+            cache_file = os.path.join(temp_dir, 'cache', 'test.cache')
+            # Test that it builds and writes a missing cache file.
+            self.assertEqual('built', cache_files.load_cache_file(
+                dict_file, cache_file, read, build))
+            self.assertTrue(os.path.isfile(cache_file))
+            # Test that it reads the cache file instead of building.
+            self.assertEqual('read', cache_files.load_cache_file(
+                dict_file, cache_file, read, build))
+            # Test that it builds a stale cache file again.
+            with open(dict_file, 'a') as file:
+                file.write('sett\n')
+            self.assertEqual('built', cache_files.load_cache_file(
+                dict_file, cache_file, read, build))
+            self.assertEqual('read', cache_files.load_cache_file(
+                dict_file, cache_file, read, build))
+            # Test that it still builds if it can't write the cache file.
+            blocked_file = os.path.join(temp_dir, 'blocked')
+            with open(blocked_file, 'w') as file:
+                file.write('not a folder')
+            blocked_cache = os.path.join(blocked_file, 'cache', 'test.cache')
+            self.assertEqual('built', cache_files.load_cache_file(
+                dict_file, blocked_cache, read, build))
+
+
+class TestAnagramCache(unittest.TestCase):
+    """Test Anagram Cache."""
+
+    def test_anagram_cache(self):
+        """Test that it can write and read an anagram cache file."""
+        anagram_dict = {3715217: ['sett', 'test'], 451: ['me'],
+                        anagram_generator.get_id('z' * 40): ['z' * 40]}
+        with TemporaryDirectory() as temp_dir:
+            dict_file = os.path.join(temp_dir, 'dictionary.txt')
+            cache_file = os.path.join(temp_dir, 'test.anagrams')
+            with open(dict_file, 'w') as file:
+                file.write('test\nsett\nme\n')
+            fingerprint = cache_files.get_fingerprint(dict_file)
+            anagram_cache.write_anagram_cache(anagram_dict, cache_file,
+                                              fingerprint)
+            test_dict = anagram_cache.read_anagram_cache(cache_file, dict_file)
+            self.assertDictEqual(anagram_dict, test_dict)
+            # Test IDs with no words and with an empty word.
+            for words in [[], [''], ['', 'me']]:
+                anagram_cache.write_anagram_cache({451: words}, cache_file,
+                                                  fingerprint)
+                test_dict = anagram_cache.read_anagram_cache(cache_file,
+                                                             dict_file)
+                self.assertDictEqual({451: words}, test_dict)
+            # Test that it raises an error if the word dictionary changed.
+            with open(dict_file, 'a') as file:
+                file.write('pls\n')
+            with self.assertRaises(ValueError) as err:
+                anagram_cache.read_anagram_cache(cache_file, dict_file)
+            self.assertEqual(STALE_ANAGRAM_CACHE_ERROR, str(err.exception))
+            # Test that it raises an error if it isn't a cache file.
+            for data in [b'', b'x' * 100]:
+                with open(cache_file, 'wb') as file:
+                    file.write(data)
+                with self.assertRaises(ValueError) as err:
+                    anagram_cache.read_anagram_cache(cache_file, dict_file)
+                self.assertEqual(READ_ANAGRAM_CACHE_ERROR, str(err.exception))
+            # Test that it raises an error if the cache file is truncated.
+            fingerprint = cache_files.get_fingerprint(dict_file)
+            anagram_cache.write_anagram_cache(anagram_dict, cache_file,
+                                              fingerprint)
+            with open(cache_file, 'rb+') as file:
+                file.truncate(os.path.getsize(cache_file) - 3)
+            with self.assertRaises(ValueError) as err:
+                anagram_cache.read_anagram_cache(cache_file, dict_file)
+            self.assertEqual(READ_ANAGRAM_CACHE_ERROR, str(err.exception))
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -2,15 +2,23 @@
 import os
 import unittest.mock
 from io import StringIO
+from itertools import permutations
 from random import Random
+from tempfile import TemporaryDirectory
 import src.ch04.practice.p1_hack_lincoln as hack_lincoln
 import src.ch04.practice.p2_identify_cipher as identify_cipher
 import src.ch04.practice.p2_identify_cipher_deco as identify_cipher_deco
 import src.ch04.practice.p3_get_keys as get_keys
 import src.ch04.practice.p4_generate_keys as generate_keys
 import src.ch04.practice.p5_hack_route as hack_route
+import src.ch04.practice.p6_crack_route as crack_route
+import src.ch04.practice.p7_search_route as search_route
+import src.ch04.practice.p8_route_decoder as route_decoder
 import src.ch04.challenge.c1_encode_route as encode_route
 import src.ch04.challenge.c2_encode_rail as encode_rail
+from src.ch03.p1_ngram_counter import NgramCounter
+from src.ch04 import TOP_K_ERROR, COLUMNS_ERROR, BEAM_WIDTH_ERROR, \
+    BACKEND_ERROR
 
 
 class TestHackLincoln(unittest.TestCase):
@@ -74,6 +82,11 @@ class TestHackLincoln(unittest.TestCase):
         ciphertext = "message super be supposed this is to a secret stop"
         hack_lincoln.hack_route(ciphertext)
         self.assertEqual(mock_stdout.getvalue(), file_data)
+        # Test that processes print the same decoded messages in order.
+        mock_stdout.truncate(0)
+        mock_stdout.seek(0)
+        hack_lincoln.hack_route(ciphertext, workers=2)
+        self.assertEqual(mock_stdout.getvalue(), file_data)
 
     @unittest.mock.patch('sys.stdout', new_callable=StringIO)
     def test_main(self, mock_stdout):
@@ -248,23 +261,94 @@ class TestGenerateKeys(unittest.TestCase):
     def test_generate_keys(self):
         """Test generate_keys."""
         # Test small key length
-        keys = [(-1, 2), (1, -2), (1, 2), (-1, -2)]
+        keys = [(-1, -2), (-1, 2), (1, -2), (1, 2)]
         test_keys = generate_keys.generate_keys(2)
         self.assertListEqual(keys, test_keys)
         # Test odd key length
-        keys = [(1, 2, -3), (-1, 2, 3), (-1, -2, 3), (1, -2, -3),
-                (1, -2, 3), (-1, -2, -3), (-1, 2, -3), (1, 2, 3)]
+        keys = [(-1, -2, -3), (-1, -2, 3), (-1, 2, -3), (-1, 2, 3),
+                (1, -2, -3), (1, -2, 3), (1, 2, -3), (1, 2, 3)]
         test_keys = generate_keys.generate_keys(3)
         self.assertListEqual(keys, test_keys)
         # Test big key length
-        keys = [(-1, 2, -3, 4), (-1, -2, 3, 4), (-1, -2, 3, -4),
-                (-1, 2, 3, -4), (-1, -2, -3, -4), (1, -2, -3, 4),
-                (1, -2, 3, 4), (1, 2, -3, 4), (1, 2, 3, 4), (1, -2, 3, -4),
-                (1, -2, -3, -4), (1, 2, -3, -4), (-1, -2, -3, 4),
-                (1, 2, 3, -4), (-1, 2, 3, 4), (-1, 2, -3, -4)]
+        keys = [(-1, -2, -3, -4), (-1, -2, -3, 4), (-1, -2, 3, -4),
+                (-1, -2, 3, 4), (-1, 2, -3, -4), (-1, 2, -3, 4),
+                (-1, 2, 3, -4), (-1, 2, 3, 4), (1, -2, -3, -4),
+                (1, -2, -3, 4), (1, -2, 3, -4), (1, -2, 3, 4),
+                (1, 2, -3, -4), (1, 2, -3, 4), (1, 2, 3, -4), (1, 2, 3, 4)]
         test_keys = generate_keys.generate_keys(4)
         self.assertListEqual(keys, test_keys)
 
+    def test_iter_keys(self):
+        """Test iter_keys."""
+        # Test that it makes keys one at a time.
+        test_keys = generate_keys.iter_keys(3)
+        self.assertTupleEqual((-1, -2, -3), next(test_keys))
+        self.assertTupleEqual((-1, -2, 3), next(test_keys))
+        self.assertEqual(6, len(list(test_keys)))
+        for length in range(1, 7):
+            test_keys = list(generate_keys.iter_keys(length))
+            self.assertEqual(2 ** length, len(test_keys))
+            self.assertListEqual(sorted(set(test_keys)), test_keys)
+        self.assertListEqual([()], list(generate_keys.iter_keys(0)))
+        # Test column order mode.
+        keys = [(-1, -2), (-1, 2), (1, -2), (1, 2),
+                (-2, -1), (-2, 1), (2, -1), (2, 1)]
+        test_keys = list(generate_keys.iter_keys(2, permute=True))
+        self.assertListEqual(keys, test_keys)
+        test_keys = list(generate_keys.iter_keys(4, permute=True))
+        self.assertEqual(24 * 16, len(set(test_keys)))
+        self.assertListEqual(generate_keys.generate_keys(4), test_keys[:16])
+        for key in test_keys:
+            self.assertListEqual([1, 2, 3, 4], sorted(map(abs, key)))
+        # Test ranges of keys.
+        self.assertListEqual(test_keys[20:50], list(
+            generate_keys.iter_keys(4, permute=True, start=20, stop=50)))
+        self.assertListEqual(test_keys[370:], list(
+            generate_keys.iter_keys(4, permute=True, start=370)))
+        self.assertListEqual([(-1, 2), (1, -2)],
+                             list(generate_keys.iter_keys(2, False, 1, 3)))
+        self.assertListEqual([], list(generate_keys.iter_keys(2, False, 3, 3)))
+        self.assertListEqual([], list(generate_keys.iter_keys(2, False, 9)))
+
+    def test_count_keys(self):
+        """Test count_keys."""
+        for length in range(5):
+            for permute in (False, True):
+                self.assertEqual(
+                    len(list(generate_keys.iter_keys(length, permute))),
+                    generate_keys.count_keys(length, permute))
+        self.assertEqual(3840, generate_keys.count_keys(5, permute=True))
+
+    def test_split_keys(self):
+        """Test split_keys."""
+        self.assertListEqual([(0, 3), (3, 6), (6, 8)],
+                             generate_keys.split_keys(3, 3))
+        self.assertListEqual([(0, 8)], generate_keys.split_keys(3, 1))
+        # Test more parts than keys.
+        self.assertListEqual([(0, 1), (1, 2), (2, 3), (3, 4)],
+                             generate_keys.split_keys(2, 10))
+        self.assertListEqual([(0, 1)], generate_keys.split_keys(0, 4))
+        # Test that the ranges make every key in order.
+        for parts in range(1, 20):
+            ranges = generate_keys.split_keys(3, parts, permute=True)
+            self.assertLessEqual(len(ranges), parts)
+            test_keys = [key for start, stop in ranges for key in
+                         generate_keys.iter_keys(3, True, start, stop)]
+            self.assertListEqual(
+                list(generate_keys.iter_keys(3, permute=True)), test_keys)
+
+    def test_map_keys(self):
+        """Test that it calls function with each range of keys in order."""
+        results = list(generate_keys.map_keys(generate_keys.iter_keys,
+                                              [2, 3], permute=True))
+        self.assertEqual(2, len(results))
+        self.assertListEqual(list(generate_keys.iter_keys(2, True)),
+                             list(results[0]))
+        self.assertListEqual(list(generate_keys.iter_keys(3, True)),
+                             list(results[1]))
+        self.assertListEqual([], list(generate_keys.map_keys(
+            generate_keys.iter_keys, [])))
+
     @unittest.mock.patch('sys.stdout', new_callable=StringIO)
     def test_main(self, mock_stdout):
         """Test demo main function."""
@@ -312,6 +396,20 @@ class TestHackRoute(unittest.TestCase):
         ciphertext = "MESSAGE SUPER BE SUPPOSED THIS IS TO A SECRET STOP"
         hack_route.hack_route(ciphertext, 2)
         self.assertEqual(mock_stdout.getvalue(), file_data)
+        # Test column order mode.
+        mock_stdout.truncate(0)
+        mock_stdout.seek(0)
+        hack_route.hack_route(ciphertext, 2, permute=True)
+        output = mock_stdout.getvalue()
+        self.assertTrue(output.startswith(file_data))
+        self.assertEqual(8, output.count('Key: '))
+        self.assertIn('Key: (2, -1)\nDecoded message: is this to supposed a '
+                      'be secret super stop message\n', output)
+        # Test that processes print the same decoded messages in order.
+        mock_stdout.truncate(0)
+        mock_stdout.seek(0)
+        hack_route.hack_route(ciphertext, 2, permute=True, workers=2)
+        self.assertEqual(output, mock_stdout.getvalue())
         # Test substitution cipher.
         # Used key of FRSDBTVXANQJWLYUPGCEKZIOHM in Al Sweigart's
         # Cracking Codes with Python simpleSubCipher.py
@@ -334,6 +432,316 @@ class TestHackRoute(unittest.TestCase):
         self.assertEqual(mock_stdout.getvalue(), file_data)
 
 
+class TestCrackRoute(unittest.TestCase):
+    """Test Crack Route."""
+
+    def test_get_ngram_counter(self):
+        """Test that it counts n-grams of a file once until it changes."""
+        with TemporaryDirectory() as temp_dir:
+            filepath = os.path.join(temp_dir, 'dictionary.txt')
+            with open(filepath, 'w') as file:
+                file.write('banana\nbandana\n')
+            counter = crack_route.get_ngram_counter(filepath)
+            self.assertIsInstance(counter, NgramCounter)
+            self.assertEqual(3, counter.length)
+            self.assertIs(counter, crack_route.get_ngram_counter(filepath))
+            self.assertEqual(2, crack_route.get_ngram_counter(
+                filepath, 2).length)
+            # Test that it counts again once the file changes.
+            with open(filepath, 'w') as file:
+                file.write('banana\nbandana\ncabana\n')
+            new_counter = crack_route.get_ngram_counter(filepath)
+            self.assertIsNot(counter, new_counter)
+            self.assertGreater(new_counter.fitness('cab'),
+                               counter.fitness('cab'))
+
+    def test_make_ngram_scorer(self):
+        """Test that it scores text like its words higher."""
+        scorer = crack_route.make_ngram_scorer(['banana', 'bandana'])
+        self.assertGreater(scorer('ban ana'), scorer('nab ana'))
+        scorer = crack_route.make_ngram_scorer(['banana', 'bandana'], 2)
+        self.assertGreater(scorer('ana'), scorer('naa'))
+        with unittest.mock.patch(
+                'src.ch04.practice.p6_crack_route.DICTIONARY_FILE_PATH',
+                'tests/data/ch04/dictionary.txt'):
+            scorer = crack_route.make_ngram_scorer()
+            # Test that the default n-grams are only counted once.
+            self.assertEqual(scorer, crack_route.make_ngram_scorer())
+        self.assertGreater(scorer('filler'), scorer('rellif'))
+
+    def test_crack_route(self):
+        """Test that it ranks the plaintext first."""
+        message = "this is supposed to be a super secret message stop"
+        scorer = crack_route.make_ngram_scorer([''.join(message.split())])
+        # Test a two column key.
+        ciphertext = "message super be supposed this is to a secret stop"
+        candidates = crack_route.crack_route(ciphertext, scorer=scorer)
+        # Two and five columns have 4 + 32 keys.
+        self.assertEqual(10, len(candidates))
+        self.assertEqual(message, candidates[0].message)
+        self.assertListEqual([-1, 2], candidates[0].key)
+        scores = [candidate.score for candidate in candidates]
+        self.assertListEqual(sorted(scores, reverse=True), scores)
+        # Test that it keeps the best of every key.
+        all_candidates = crack_route.crack_route(ciphertext, 100,
+                                                 scorer=scorer)
+        self.assertEqual(36, len(all_candidates))
+        self.assertListEqual(candidates, all_candidates[:10])
+        for candidate in all_candidates:
+            self.assertListEqual(
+                candidate.message.split(),
+                hack_lincoln.decode_route(candidate.key, ciphertext.split()))
+            self.assertEqual(scorer(candidate.message), candidate.score)
+        # Test a five column key.
+        ciphertext = "this a super is secret supposed to message stop be"
+        candidates = crack_route.crack_route(ciphertext, 1, 5, scorer)
+        self.assertEqual(1, len(candidates))
+        self.assertEqual(message, candidates[0].message)
+        self.assertListEqual([1, -2, -3, 4, -5], candidates[0].key)
+        # Test that earlier keys win ties.
+        candidates = crack_route.crack_route(ciphertext, 3, 5, len)
+        self.assertListEqual(hack_lincoln.keygen(5)[:3],
+                             [candidate.key for candidate in candidates])
+        # Test that processes keep the same best keys, even on ties.
+        self.assertListEqual(candidates, crack_route.crack_route(
+            ciphertext, 3, 5, len, workers=2))
+        candidates = crack_route.crack_route(ciphertext, 1, 5, scorer,
+                                             workers=3)
+        self.assertListEqual([1, -2, -3, 4, -5], candidates[0].key)
+        ciphertext = "message super be supposed this is to a secret stop"
+        self.assertListEqual(all_candidates, crack_route.crack_route(
+            ciphertext, 100, scorer=scorer, workers=3))
+        # Test that processes count the default n-grams themselves.
+        with unittest.mock.patch(
+                'src.ch04.practice.p6_crack_route.DICTIONARY_FILE_PATH',
+                'tests/data/ch04/dictionary.txt'):
+            self.assertListEqual(
+                crack_route.crack_route(ciphertext, 5),
+                crack_route.crack_route(ciphertext, 5, workers=2))
+        # Test every order of the columns.
+        candidates = crack_route.crack_route(ciphertext, 100, 2, scorer,
+                                             permute=True)
+        self.assertListEqual(
+            sorted(list(key) for key in generate_keys.iter_keys(2, True)),
+            sorted(candidate.key for candidate in candidates))
+        self.assertEqual(message, candidates[0].message)
+        for candidate in candidates:
+            self.assertListEqual(
+                candidate.message.split(), hack_route.decode_route(
+                    get_keys.key_to_dict(candidate.key), ciphertext.split()))
+        self.assertListEqual(candidates, crack_route.crack_route(
+            ciphertext, 100, 2, scorer, permute=True, workers=2))
+        with self.assertRaises(ValueError) as err:
+            crack_route.crack_route(ciphertext, 0, scorer=scorer)
+        self.assertEqual(TOP_K_ERROR, str(err.exception))
+        with self.assertRaises(ValueError) as err:
+            crack_route.crack_route(ciphertext, 1, 3, scorer)
+        self.assertEqual(COLUMNS_ERROR, str(err.exception))
+
+    @unittest.mock.patch('sys.stdout', new_callable=StringIO)
+    @unittest.mock.patch('src.ch04.practice.p6_crack_route.DICTIONARY_FILE_PATH', 'tests/data/ch02/dictionary.txt')
+    def test_main(self, mock_stdout):
+        """Test demo main function."""
+        crack_route.main()
+        # Test printed output.
+        with open(os.path.normpath('tests/data/ch04/main/crack_route.txt'),
+                  'r') as file:
+            file_data = ''.join(file.readlines())
+        self.assertEqual(mock_stdout.getvalue(), file_data)
+
+class TestSearchRoute(unittest.TestCase):
+    """Test Search Route."""
+
+    @staticmethod
+    def get_best_scores(ciphertext: str, columns: int, counter) -> list:
+        """Score every key in every column order, best first."""
+        cipherlist = ciphertext.split()
+        scores = []
+        for key in generate_keys.iter_keys(columns, permute=True):
+            message = ' '.join(hack_route.decode_route(
+                get_keys.key_to_dict(key), cipherlist))
+            scores.append(counter.fitness(message))
+        return sorted(scores, reverse=True)
+
+    def test_search_route(self):
+        """Test that it finds the best keys in any column order."""
+        message = "this is supposed to be a super secret message stop"
+        counter = NgramCounter(3, [''.join(message.split())])
+        # Columns read in order 2, 1, with column 2 reversed.
+        ciphertext = "is to a secret stop message super be supposed this"
+        candidates = search_route.search_route(ciphertext, 2, 3, counter,
+                                               None)
+        self.assertEqual(3, len(candidates))
+        self.assertEqual(message, candidates[0].message)
+        self.assertListEqual([-2, 1], candidates[0].key)
+        self.assertListEqual(
+            self.get_best_scores(ciphertext, 2, counter)[:3],
+            [candidate.score for candidate in candidates])
+        for candidate in candidates:
+            self.assertEqual(candidate.message, ' '.join(
+                hack_route.decode_route(get_keys.key_to_dict(candidate.key),
+                                        ciphertext.split())))
+        # Columns read in order 3, 5, 1, 4, 2, with columns 5 and 4 reversed.
+        ciphertext = "supposed secret be stop this a message to super is"
+        for beam_width in [None, 1000, 50]:
+            candidates = search_route.search_route(ciphertext, 5, 1, counter,
+                                                   beam_width)
+            self.assertEqual(message, candidates[0].message)
+            self.assertListEqual([3, -5, 1, -4, 2], candidates[0].key)
+        # Test that it finds the same best keys as trying every key.
+        counter = NgramCounter(2, ['thequickbrownfoxjumpsoverthelazydog'])
+        ciphertext = "dog the over quick the brown jumps fox lazy"
+        best_scores = self.get_best_scores(ciphertext, 3, counter)[:5]
+        for beam_width in [None, 1000]:
+            candidates = search_route.search_route(ciphertext, 3, 5, counter,
+                                                   beam_width)
+            self.assertListEqual(best_scores,
+                                 [candidate.score for candidate in candidates])
+        # Test that it only keeps the best partial keys of each length.
+        candidates = search_route.search_route(ciphertext, 3, 5, counter, 1)
+        self.assertEqual(1, len(candidates))
+        # Test bad arguments.
+        with self.assertRaises(ValueError) as err:
+            search_route.search_route(ciphertext, 3, 0, counter)
+        self.assertEqual(TOP_K_ERROR, str(err.exception))
+        with self.assertRaises(ValueError) as err:
+            search_route.search_route(ciphertext, 3, 5, counter, 0)
+        self.assertEqual(BEAM_WIDTH_ERROR, str(err.exception))
+        with self.assertRaises(ValueError) as err:
+            search_route.search_route(ciphertext, 4, 5, counter)
+        self.assertEqual(COLUMNS_ERROR, str(err.exception))
+
+    @unittest.mock.patch('sys.stdout', new_callable=StringIO)
+    @unittest.mock.patch('src.ch04.practice.p7_search_route.DICTIONARY_FILE_PATH', 'tests/data/ch02/dictionary.txt')
+    def test_main(self, mock_stdout):
+        """Test demo main function."""
+        search_route.main()
+        # Test printed output.
+        with open(os.path.normpath('tests/data/ch04/main/search_route.txt'),
+                  'r') as file:
+            file_data = ''.join(file.readlines())
+        self.assertEqual(mock_stdout.getvalue(), file_data)
+
+class TestRouteDecoder(unittest.TestCase):
+    """Test Route Decoder."""
+
+    def test_compile_route(self):
+        """Test that it compiles keys into word orders."""
+        self.assertTupleEqual((2, 3, 1, 4, 0, 5),
+                              route_decoder.compile_route([-1, 2], 3))
+        self.assertTupleEqual((3, 2, 4, 1, 5, 0),
+                              route_decoder.compile_route((2, -1), 3))
+        self.assertTupleEqual((0, 1, 2), route_decoder.compile_route([1], 3))
+
+    def test_compile_routes(self):
+        """Test that it compiles every sign pattern of a column order."""
+        for columns in range(1, 6):
+            keys = generate_keys.iter_keys(columns, permute=True)
+            for order in permutations(range(1, columns + 1)):
+                routes = route_decoder.compile_routes(order, 3)
+                self.assertEqual((2 ** columns, 3 * columns), routes.shape)
+                for route in routes.tolist():
+                    self.assertTupleEqual(
+                        route_decoder.compile_route(next(keys), 3),
+                        tuple(route))
+        # Test ranges of sign patterns.
+        routes = route_decoder.compile_routes([2, 1], 3, 1, 3)
+        self.assertListEqual([[5, 0, 4, 1, 3, 2], [3, 2, 4, 1, 5, 0]],
+                             routes.tolist())
+        self.assertEqual(0, len(route_decoder.compile_routes([1, 2], 3, 4)))
+
+    def test_decode_route(self):
+        """Test that it decodes like the other decoders."""
+        message = "this is supposed to be a super secret message stop"
+        ciphertext = "this a super is secret supposed to message stop be"
+        test_message = route_decoder.decode_route([1, -2, -3, 4, -5],
+                                                  ciphertext.split())
+        self.assertListEqual(message.split(), test_message)
+        cipherlist = [str(index) for index in range(12)]
+        for columns in [1, 2, 3, 4, 6, 12]:
+            for key in generate_keys.iter_keys(columns, permute=True):
+                self.assertListEqual(
+                    hack_route.decode_route(get_keys.key_to_dict(key),
+                                            cipherlist),
+                    route_decoder.decode_route(key, cipherlist))
+                if columns == 12:
+                    # Only test the first orders of 12 columns.
+                    break
+            for key in hack_lincoln.keygen(columns):
+                self.assertListEqual(
+                    hack_lincoln.decode_route(key, cipherlist),
+                    route_decoder.decode_route(key, cipherlist))
+        with self.assertRaises(ValueError) as err:
+            route_decoder.decode_route([1, 2, 3], ciphertext.split())
+        self.assertEqual(COLUMNS_ERROR, str(err.exception))
+
+    def test_decode_batch(self):
+        """Test that it decodes many keys at once."""
+        cipherlist = ("this a super is secret supposed to message stop "
+                      "be").split()
+        keys = list(generate_keys.iter_keys(5, permute=True))
+        messages = [route_decoder.decode_route(key, cipherlist)
+                    for key in keys]
+        self.assertListEqual(messages,
+                             route_decoder.decode_batch(keys, cipherlist))
+        self.assertListEqual(messages, route_decoder.decode_batch(
+            iter(keys), cipherlist, 'numpy'))
+        for backend in ['python', 'numpy']:
+            self.assertListEqual([], route_decoder.decode_batch(
+                [], cipherlist, backend))
+        with self.assertRaises(ValueError) as err:
+            route_decoder.decode_batch(keys, cipherlist, 'cython')
+        self.assertEqual(BACKEND_ERROR, str(err.exception))
+        with self.assertRaises(ValueError) as err:
+            route_decoder.decode_batch([(1, 2), (1, 2, 3)], cipherlist)
+        self.assertEqual(COLUMNS_ERROR, str(err.exception))
+
+    def test_decode_keys(self):
+        """Test that it decodes ranges of keys."""
+        cipherlist = [str(index) for index in range(14)]
+        keys = list(generate_keys.iter_keys(7))
+        for start, stop in [(0, None), (5, 100), (3, 3), (120, 200)]:
+            decoded = list(route_decoder.decode_keys(7, cipherlist,
+                                                     start=start, stop=stop))
+            self.assertListEqual(keys[start:stop],
+                                 [key for key, _ in decoded])
+            self.assertListEqual(
+                [route_decoder.decode_route(key, cipherlist)
+                 for key in keys[start:stop]],
+                [message for _, message in decoded])
+        # Test keys split into more than one chunk.
+        with unittest.mock.patch(
+                'src.ch04.practice.p8_route_decoder._CHUNK', 3):
+            self.assertListEqual(decoded, list(
+                route_decoder.decode_keys(7, cipherlist, False, 120, 200)))
+        # Test every order of the columns, across column orders and chunks.
+        words = cipherlist[:12]
+        keys = list(generate_keys.iter_keys(4, permute=True))
+        for chunk in (3, 4096):
+            with unittest.mock.patch(
+                    'src.ch04.practice.p8_route_decoder._CHUNK', chunk):
+                for start, stop in [(0, None), (10, 50), (370, 400)]:
+                    decoded = list(route_decoder.decode_keys(
+                        4, words, True, start, stop))
+                    self.assertListEqual(keys[start:stop],
+                                         [key for key, _ in decoded])
+                    self.assertListEqual(
+                        [route_decoder.decode_route(key, words)
+                         for key in keys[start:stop]],
+                        [message for _, message in decoded])
+        with self.assertRaises(ValueError) as err:
+            next(route_decoder.decode_keys(3, cipherlist))
+        self.assertEqual(COLUMNS_ERROR, str(err.exception))
+
+    def test_benchmark_decoders(self):
+        """Test that it times each decoder."""
+        cipherlist = [str(index) for index in range(12)]
+        times = route_decoder.benchmark_decoders(cipherlist, 4)
+        self.assertListEqual(
+            ['table', 'compiled', 'python', 'numpy', 'routes'], list(times))
+        for time in times.values():
+            self.assertGreater(time, 0)
+
 class TestEncodeRoute(unittest.TestCase):
     """Test Encode Route."""
 
@@ -3,8 +3,11 @@ import unittest.mock
 import os
 from random import Random
 from io import StringIO
+from tempfile import TemporaryDirectory
 
 import src.ch08.p1_count_syllables as count_syllables
+from src.ch02.p1_word_artifact import write_artifact
+from src.ch02.p1_word_registry import get_words
 
 
 class TestCountSyllables(unittest.TestCase):
@@ -37,6 +40,7 @@ class TestCountSyllables(unittest.TestCase):
         # Test word in CMUdict.
         self.assertEqual(count_syllables.count_syllables(['test']), 1)
 
+    @unittest.mock.patch('src.ch08.p1_count_syllables.CLEAN_DICTIONARY_FILE_PATH', 'tests/data/ch08/missing.txt')
     @unittest.mock.patch('src.ch08.p1_count_syllables.DICTIONARY_FILE_PATH', 'tests/data/ch08/dictionary.txt')
     @unittest.mock.patch('sys.stdout', new_callable=StringIO)
     @unittest.mock.patch('src.ch08.p1_count_syllables.sample')
@@ -53,6 +57,28 @@ class TestCountSyllables(unittest.TestCase):
             file_data = ''.join(file.readlines())
         self.assertEqual(mock_stdout.getvalue(), file_data)
 
+    @unittest.mock.patch('src.ch08.p1_count_syllables.DICTIONARY_FILE_PATH', 'tests/data/ch08/missing.txt')
+    @unittest.mock.patch('sys.stdout', new_callable=StringIO)
+    @unittest.mock.patch('src.ch08.p1_count_syllables.sample')
+    def test_main_artifact(self, mock_sample, mock_stdout):
+        """Test that demo main function samples the cleaned up words."""
+        self.random.seed(222)
+        mock_sample.side_effect = self.random.sample
+        with TemporaryDirectory() as temp_dir:
+            artifact_file = os.path.join(temp_dir, 'words.txt')
+            write_artifact(get_words('tests/data/ch08/dictionary.txt'),
+                           artifact_file)
+            with unittest.mock.patch(
+                    'src.ch08.p1_count_syllables.CLEAN_DICTIONARY_FILE_PATH',
+                    artifact_file):
+                count_syllables.main()
+
+        # Test sys.stdout output.
+        with open(os.path.normpath('tests/data/ch08/main/count_syllables.txt'),
+                  'r') as file:
+            file_data = ''.join(file.readlines())
+        self.assertEqual(mock_stdout.getvalue(), file_data)
+
 
 if __name__ == '__main__':
     unittest.main()